@@ -0,0 +1,446 @@
+"""Run ``MonitoringService`` end to end against local stand-ins and report its throughput.
+
+A child process serves a synthetic Polygon-like chain over JSON-RPC together with stand-ins
+for the explorer, CoinGecko and Telegram, all with optional injected latency. The monitor
+runs in this process with the production clients and reports:
+
+* blocks/s from the first poll until the last block is checkpointed
+* HTTP requests and JSON-RPC calls per block (a batch is one request, many calls)
+* p50/p99 block-to-alert latency, from the block becoming available to the Telegram ack
+* peak RSS of the monitor process (the stand-ins run in their own process)
+
+With ``--block-time 0`` the whole chain exists up front, which measures catch-up throughput.
+A positive ``--block-time`` produces blocks live, which measures steady-state latency.
+The ``eth_getLogs`` stand-in filters like a node, so ``--logs`` only changes how many
+token transfers exist; ``--hit-rate`` of them, and of the transactions, pay a monitored
+contract. Runs are deterministic for a given ``--seed``.
+
+Run with ``python benchmarks/monitor_pipeline.py [--blocks 500] [--transactions 400] [--block-time 0]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import logging
+import multiprocessing
+import random
+import resource
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+import aiohttp
+from aiohttp import web
+
+from polymarkt_monitoring import metrics
+from polymarkt_monitoring.builders import (
+    build_evaluator,
+    build_explorer_client,
+    build_price_feed,
+    build_rpc_client,
+)
+from polymarkt_monitoring.clients import AsyncTelegramNotifier, json_codec
+from polymarkt_monitoring.config import MonitorConfig
+from polymarkt_monitoring.services import MonitoringService
+from polymarkt_monitoring.tracing import AlertTrace, AlertTracer
+
+FIRST_BLOCK = 50_000_000
+BET_CONTRACT = "0x4d97dcd97ec945f40cf65f87097ace5ea0476045"
+USDC = "0x2791bca1f2de4661ed88a30c99a7a9449aa84174"
+TRANSFER_EVENT_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+
+@dataclass(slots=True, frozen=True)
+class ChainOptions:
+    blocks: int
+    transactions: int
+    logs: int
+    hit_rate: float
+    block_time: float
+    rpc_latency: float
+    api_latency: float
+    new_wallet_rate: float
+    seed: int
+
+
+class SyntheticChain:
+    """Deterministic blocks and transfer logs; block ``n`` exists from ``produced_at(n)`` on."""
+
+    def __init__(self, options: ChainOptions, *, total_blocks: int, started_at: float) -> None:
+        self.options = options
+        self.last_block = FIRST_BLOCK + total_blocks - 1
+        self.started_at = started_at
+        self._blocks: dict[int, tuple[bytes, bytes, list[dict]]] = {}
+
+    def produced_at(self, number: int) -> float:
+        return self.started_at + (number - FIRST_BLOCK) * self.options.block_time
+
+    def head(self) -> int:
+        if self.options.block_time <= 0:
+            return self.last_block
+        produced = int((time.time() - self.started_at) / self.options.block_time)
+        return min(self.last_block, FIRST_BLOCK + produced)
+
+    def block(self, number: int, full_transactions: bool) -> bytes:
+        full, header, _ = self._build(number)
+        return full if full_transactions else header
+
+    def logs(self, from_block: int, to_block: int, tokens: set[str], recipients: set[str]) -> list[dict]:
+        matched: list[dict] = []
+        for number in range(from_block, min(to_block, self.head()) + 1):
+            for log in self._build(number)[2]:
+                if log["address"] in tokens and log["topics"][2] in recipients:
+                    matched.append(log)
+        return matched
+
+    def _build(self, number: int) -> tuple[bytes, bytes, list[dict]]:
+        cached = self._blocks.get(number)
+        if cached is not None:
+            return cached
+        rng = random.Random(f"{self.options.seed}:{number}")
+        block_hash = f"0x{number:064x}"
+        transactions = []
+        for index in range(self.options.transactions):
+            hit = rng.random() < self.options.hit_rate
+            transactions.append(
+                {
+                    "blockHash": block_hash,
+                    "blockNumber": hex(number),
+                    "from": _address(f"sender:{number}:{index}"),
+                    "gas": "0x5208",
+                    "gasPrice": "0x6fc23ac00",
+                    "hash": f"0x{number:032x}{index:032x}",
+                    "input": "0x" + "ab" * 68,
+                    "nonce": hex(index),
+                    "to": BET_CONTRACT if hit else _address(f"to:{number}:{index}"),
+                    "transactionIndex": hex(index),
+                    "value": hex(10_000 * 10**18 if hit else rng.randrange(10**15, 10**19)),
+                    "type": "0x2",
+                    "chainId": "0x89",
+                    "v": "0x1",
+                    "r": "0x" + "1" * 64,
+                    "s": "0x" + "2" * 64,
+                }
+            )
+        logs = []
+        bet_topic = "0x" + "0" * 24 + BET_CONTRACT[2:]
+        for index in range(self.options.logs):
+            hit = rng.random() < self.options.hit_rate
+            logs.append(
+                {
+                    "address": USDC,
+                    "blockNumber": hex(number),
+                    "transactionHash": f"0x{number:032x}{index + self.options.transactions:032x}",
+                    "logIndex": hex(index),
+                    "topics": [
+                        TRANSFER_EVENT_TOPIC,
+                        "0x" + "0" * 24 + _address(f"payer:{number}:{index}")[2:],
+                        bet_topic if hit else "0x" + "0" * 24 + _address(f"payee:{number}:{index}")[2:],
+                    ],
+                    "data": hex(10_000 * 10**6 if hit else rng.randrange(10**6, 10**10)),
+                }
+            )
+        header = {
+            "number": hex(number),
+            "hash": block_hash,
+            "parentHash": f"0x{number - 1:064x}",
+            "timestamp": hex(int(self.produced_at(number))),
+            "gasLimit": "0x1c9c380",
+            "gasUsed": "0x1312d00",
+            "baseFeePerGas": "0x1e",
+            "miner": "0x0000000000000000000000000000000000000000",
+            "logsBloom": "0x" + "0" * 512,
+        }
+        full = json_codec.dumps({**header, "transactions": transactions})
+        hashes = json_codec.dumps({**header, "transactions": [tx["hash"] for tx in transactions]})
+        self._blocks[number] = (full, hashes, logs)
+        return self._blocks[number]
+
+
+class StandIns:
+    """JSON-RPC node, explorer, CoinGecko and Telegram on one local aiohttp app."""
+
+    def __init__(self, options: ChainOptions, chain: SyntheticChain) -> None:
+        self.options = options
+        self.chain = chain
+        self.requests: Counter[str] = Counter()
+        self.app = web.Application()
+        self.app.router.add_post("/rpc", self._rpc)
+        self.app.router.add_get("/explorer", self._explorer)
+        self.app.router.add_get("/coingecko/simple/price", self._prices)
+        self.app.router.add_post("/telegram/bot{token}/sendMessage", self._telegram)
+        self.app.router.add_get("/stats", self._stats)
+
+    async def _rpc(self, request: web.Request) -> web.Response:
+        payload = json_codec.loads(await request.read())
+        if self.options.rpc_latency:
+            await asyncio.sleep(self.options.rpc_latency)
+        self.requests["rpc_http"] += 1
+        if isinstance(payload, list):
+            self.requests["rpc_calls"] += len(payload)
+            body = b"[" + b",".join(self._call(call) for call in payload) + b"]"
+        else:
+            self.requests["rpc_calls"] += 1
+            body = self._call(payload)
+        return web.Response(body=body, content_type="application/json")
+
+    def _call(self, call: dict) -> bytes:
+        method, params = call["method"], call["params"]
+        self.requests[method] += 1
+        if method == "eth_blockNumber":
+            result = json_codec.dumps(hex(self.chain.head()))
+        elif method == "eth_getBlockByNumber":
+            number = int(params[0], 16)
+            result = self.chain.block(number, params[1]) if number <= self.chain.head() else b"null"
+        elif method == "eth_getLogs":
+            query = params[0]
+            logs = self.chain.logs(
+                int(query["fromBlock"], 16), int(query["toBlock"], 16), set(query["address"]), set(query["topics"][2])
+            )
+            result = json_codec.dumps(logs)
+        elif method == "eth_getTransactionCount":
+            result = json_codec.dumps(hex(self._tx_count(params[0])))
+        else:
+            return json_codec.dumps({"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32601, "message": method}})
+        return b'{"jsonrpc":"2.0","id":' + json_codec.dumps(call["id"]) + b',"result":' + result + b"}"
+
+    async def _explorer(self, request: web.Request) -> web.Response:
+        if self.options.api_latency:
+            await asyncio.sleep(self.options.api_latency)
+        self.requests["explorer"] += 1
+        count = self._tx_count(request.query["address"])
+        return web.json_response({"jsonrpc": "2.0", "id": 1, "result": hex(count)})
+
+    async def _prices(self, request: web.Request) -> web.Response:
+        if self.options.api_latency:
+            await asyncio.sleep(self.options.api_latency)
+        self.requests["coingecko"] += 1
+        return web.json_response({asset: {"usd": 1.0} for asset in request.query["ids"].split(",")})
+
+    async def _telegram(self, request: web.Request) -> web.Response:
+        await request.read()
+        if self.options.api_latency:
+            await asyncio.sleep(self.options.api_latency)
+        self.requests["telegram"] += 1
+        return web.json_response({"ok": True, "result": {"message_id": self.requests["telegram"]}})
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response(dict(self.requests))
+
+    def _tx_count(self, address: str) -> int:
+        digest = hashlib.blake2b(address.lower().encode(), digest_size=4).digest()
+        return 1 if int.from_bytes(digest, "big") / 2**32 < self.options.new_wallet_rate else 500
+
+
+def serve_stand_ins(options: ChainOptions, total_blocks: int, connection) -> None:
+    async def _serve() -> None:
+        started_at = time.time()
+        stand_ins = StandIns(options, SyntheticChain(options, total_blocks=total_blocks, started_at=started_at))
+        runner = web.AppRunner(stand_ins.app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        connection.send((runner.addresses[0][1], started_at))
+        await asyncio.Event().wait()
+
+    asyncio.run(_serve())
+
+
+class LatencyRecorder:
+    def __init__(self) -> None:
+        self.traces: list[AlertTrace] = []
+
+    async def export(self, trace: AlertTrace) -> None:
+        self.traces.append(trace)
+
+    async def close(self) -> None:
+        return None
+
+
+def build_config(args: argparse.Namespace, base_url: str) -> MonitorConfig:
+    return MonitorConfig(
+        chain_name="polygon",
+        rpc_urls=[f"{base_url}/rpc"],
+        bet_contract_addresses=[BET_CONTRACT],
+        token_contracts={"USDC": USDC} if args.logs else {},
+        token_decimals={"USDC": 6},
+        token_coingecko_ids={"USDC": "usd-coin"},
+        native_symbol="MATIC",
+        native_coingecko_id="matic-network",
+        usd_threshold=5000.0,
+        wallet_max_tx_count=5,
+        poll_interval_seconds=max(1, int(args.block_time * 4)),
+        block_confirmations=args.confirmations,
+        max_blocks_per_cycle=args.range_blocks,
+        start_block=FIRST_BLOCK,
+        explorer_api_base=f"{base_url}/explorer",
+        explorer_api_key="",
+        coingecko_api_base=f"{base_url}/coingecko",
+        telegram_bot_token="benchmark",
+        telegram_chat_id="1",
+        log_level="WARNING",
+        novelty_backend=args.novelty_backend,
+        explorer_calls_per_second=args.explorer_calls_per_second,
+        min_poll_interval_seconds=min(1.0, max(args.block_time / 4, 0.05)),
+        max_catchup_blocks_per_cycle=max(args.range_blocks, 500),
+        telegram_messages_per_minute=args.telegram_per_minute,
+    )
+
+
+async def run_monitor(args: argparse.Namespace, base_url: str, started_at: float) -> dict:
+    logger = logging.getLogger("polymarkt_monitoring")
+    config = build_config(args, base_url)
+    recorder = LatencyRecorder()
+    tracer = AlertTracer(exporters=[recorder], logger=logger)
+    rpc_client = build_rpc_client(config, logger)
+    price_feed = build_price_feed(config, logger)
+    notifier = AsyncTelegramNotifier(
+        bot_token=config.telegram_bot_token,
+        chat_id=config.telegram_chat_id,
+        api_base=f"{base_url}/telegram",
+        messages_per_minute=config.telegram_messages_per_minute,
+        logger=logger,
+    )
+    service = MonitoringService(
+        config=config,
+        rpc_client=rpc_client,
+        pricing_client=price_feed,
+        explorer_client=build_explorer_client(config, logger),
+        notifier=notifier,
+        evaluator=build_evaluator(config),
+        tracer=tracer,
+        logger=logger,
+    )
+
+    processed_before = metrics.BLOCKS_PROCESSED.value()
+    async with rpc_client, price_feed, notifier, tracer:
+        started = time.perf_counter()
+        run = asyncio.create_task(service.run())
+        try:
+            while metrics.BLOCKS_PROCESSED.value() - processed_before < args.blocks:
+                if run.done():
+                    run.result()
+                    raise RuntimeError("monitor stopped before reaching the last block")
+                if time.perf_counter() - started > args.timeout:
+                    raise TimeoutError(f"monitor did not finish {args.blocks} blocks within {args.timeout}s")
+                await asyncio.sleep(0.01)
+            elapsed = time.perf_counter() - started
+        finally:
+            run.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await run
+
+    latencies = sorted(
+        trace.acknowledged_at - (started_at + (trace.block_number - FIRST_BLOCK) * args.block_time)
+        for trace in recorder.traces
+    )
+    return {
+        "elapsed": elapsed,
+        "blocks": metrics.BLOCKS_PROCESSED.value() - processed_before,
+        "latencies": latencies,
+    }
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=500, help="blocks the monitor must checkpoint")
+    parser.add_argument("--transactions", type=int, default=400, help="transactions per block")
+    parser.add_argument("--logs", type=int, default=200, help="USDC transfer logs per block; 0 skips ERC-20")
+    parser.add_argument("--hit-rate", type=float, default=0.005, help="share of txs and logs paying the contract")
+    parser.add_argument("--new-wallet-rate", type=float, default=0.5, help="share of senders that are new wallets")
+    parser.add_argument("--block-time", type=float, default=0.0, help="seconds between blocks; 0 = all up front")
+    parser.add_argument("--confirmations", type=int, default=2)
+    parser.add_argument("--range-blocks", type=int, default=50, help="MAX_BLOCKS_PER_CYCLE")
+    parser.add_argument("--rpc-latency-ms", type=float, default=0.0)
+    parser.add_argument("--api-latency-ms", type=float, default=0.0, help="explorer, CoinGecko and Telegram")
+    parser.add_argument("--novelty-backend", choices=("explorer", "rpc"), default="explorer")
+    parser.add_argument("--explorer-calls-per-second", type=float, default=5.0)
+    parser.add_argument("--telegram-per-minute", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=600.0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    options = ChainOptions(
+        blocks=args.blocks,
+        transactions=args.transactions,
+        logs=args.logs,
+        hit_rate=args.hit_rate,
+        block_time=args.block_time,
+        rpc_latency=args.rpc_latency_ms / 1000,
+        api_latency=args.api_latency_ms / 1000,
+        new_wallet_rate=args.new_wallet_rate,
+        seed=args.seed,
+    )
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    # The confirmation window above the last measured block has to exist too.
+    server = context.Process(
+        target=serve_stand_ins, args=(options, args.blocks + args.confirmations, sender), daemon=True
+    )
+    server.start()
+    try:
+        port, started_at = receiver.recv()
+        base_url = f"http://127.0.0.1:{port}"
+        result = asyncio.run(run_monitor(args, base_url, started_at))
+        stats = asyncio.run(fetch_stats(base_url))
+    finally:
+        server.terminate()
+        server.join()
+
+    blocks = result["blocks"]
+    latencies = result["latencies"]
+    decoder = "orjson" if json_codec.orjson is not None else "json"
+    print(
+        f"{blocks:.0f} blocks, {args.transactions} txs + {args.logs} logs/block, hit rate {args.hit_rate}, "
+        f"block time {args.block_time}s, rpc latency {args.rpc_latency_ms:.0f} ms, "
+        f"novelty={args.novelty_backend}, decoder={decoder}"
+    )
+    print(f"    blocks/s: {blocks / result['elapsed']:9.1f}  ({result['elapsed']:.2f} s)")
+    print(
+        f"RPC / block: {stats.get('rpc_http', 0) / blocks:9.2f} requests, "
+        f"{stats.get('rpc_calls', 0) / blocks:.2f} calls"
+    )
+    for method in ("eth_blockNumber", "eth_getBlockByNumber", "eth_getLogs", "eth_getTransactionCount"):
+        if stats.get(method):
+            print(f"{'':>13}{method}: {stats[method]}")
+    print(
+        f"   API calls: explorer {stats.get('explorer', 0)}, coingecko {stats.get('coingecko', 0)}, "
+        f"telegram {stats.get('telegram', 0)}"
+    )
+    if latencies:
+        print(
+            f"      alerts: {len(latencies)}  block-to-alert p50 {percentile(latencies, 0.5) * 1000:.0f} ms  "
+            f"p99 {percentile(latencies, 0.99) * 1000:.0f} ms"
+        )
+    else:
+        print("      alerts: 0")
+    print(f"    peak RSS: {peak_rss_mb():9.1f} MB")
+
+
+async def fetch_stats(base_url: str) -> dict[str, int]:
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{base_url}/stats") as response:
+            return await response.json()
+
+
+def _address(seed: str) -> str:
+    return "0x" + hashlib.blake2b(seed.encode(), digest_size=20).hexdigest()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Compare the web3 full-block path with the raw JSON-RPC fast path for native transfers.
+
+Serves one synthetic Polygon-sized block from a local HTTP server and times, per block:
+
+* ``web3``: ``w3.eth.get_block(n, full_transactions=True)`` + ``_extract_native_transfers``
+* ``raw``: ``RpcClient.get_native_transfers`` (direct POST, fast JSON decode, raw ``to`` filter)
+
+Run with ``python benchmarks/native_transfers.py [--transactions 400] [--rounds 200]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from web3 import Web3
+
+from polymarkt_monitoring.clients import json_codec
+from polymarkt_monitoring.clients.rpc import RpcClient, _extract_native_transfers
+
+TARGET = "0x4d97dcd97ec945f40cf65f87097ace5ea0476045"
+
+
+def build_block(number: int, transactions: int, hits: int) -> dict:
+    txs = []
+    for index in range(transactions):
+        to_address = TARGET if index < hits else f"0x{(index * 7919) % 2**160:040x}"
+        txs.append(
+            {
+                "blockHash": f"0x{number:064x}",
+                "blockNumber": hex(number),
+                "from": f"0x{(index + 1) * 104729 % 2**160:040x}",
+                "gas": "0x5208",
+                "gasPrice": "0x6fc23ac00",
+                "maxFeePerGas": "0x77359400",
+                "maxPriorityFeePerGas": "0x6fc23ac00",
+                "hash": f"0x{number:032x}{index:032x}",
+                "input": "0x" + "ab" * 68,
+                "nonce": hex(index),
+                "to": to_address,
+                "transactionIndex": hex(index),
+                "value": hex(10**18 + index),
+                "type": "0x2",
+                "accessList": [],
+                "chainId": "0x89",
+                "v": "0x1",
+                "r": "0x" + "1" * 64,
+                "s": "0x" + "2" * 64,
+                "yParity": "0x1",
+            }
+        )
+    return {
+        "number": hex(number),
+        "hash": f"0x{number:064x}",
+        "parentHash": f"0x{number - 1:064x}",
+        "timestamp": hex(1_700_000_000 + number * 2),
+        "miner": "0x0000000000000000000000000000000000000000",
+        "gasLimit": "0x1c9c380",
+        "gasUsed": "0x1312d00",
+        "baseFeePerGas": "0x1e",
+        "difficulty": "0x1",
+        "totalDifficulty": "0x1",
+        "extraData": "0x",
+        "logsBloom": "0x" + "0" * 512,
+        "mixHash": "0x" + "0" * 64,
+        "nonce": "0x0000000000000000",
+        "receiptsRoot": "0x" + "0" * 64,
+        "sha3Uncles": "0x" + "0" * 64,
+        "stateRoot": "0x" + "0" * 64,
+        "transactionsRoot": "0x" + "0" * 64,
+        "size": "0x1",
+        "uncles": [],
+        "transactions": txs,
+    }
+
+
+def serve(block: dict) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802 - http.server API
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            body = json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": block}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def time_per_call(fn, rounds: int) -> list[float]:
+    fn()
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=400)
+    parser.add_argument("--hits", type=int, default=2)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    number = 50_000_000
+    server = serve(build_block(number, args.transactions, args.hits))
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    targets = {TARGET}
+    try:
+        web3 = Web3(Web3.HTTPProvider(url))
+        client = RpcClient(rpc_urls=[url])
+
+        def web3_path() -> list:
+            block = web3.eth.get_block(number, full_transactions=True)
+            return _extract_native_transfers(block, number, targets)
+
+        def raw_path() -> list:
+            return client.get_native_transfers(number, targets)
+
+        assert len(web3_path()) == len(raw_path()) == args.hits
+        results = {
+            "web3": time_per_call(web3_path, args.rounds),
+            "raw": time_per_call(raw_path, args.rounds),
+        }
+    finally:
+        server.shutdown()
+
+    decoder = "orjson" if json_codec.orjson is not None else "json"
+    print(f"{args.transactions} transactions/block, {args.hits} hits, {args.rounds} rounds, decoder={decoder}")
+    for name, samples in results.items():
+        median_ms = statistics.median(samples) * 1000
+        p90_ms = sorted(samples)[int(0.9 * len(samples))] * 1000
+        print(f"{name:>5}: median {median_ms:7.2f} ms  p90 {p90_ms:7.2f} ms")
+    speedup = statistics.median(results["web3"]) / statistics.median(results["raw"])
+    print(f"speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
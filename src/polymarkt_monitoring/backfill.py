@@ -0,0 +1,237 @@
+"""Parallel historical scans: shard a block range across worker processes and merge the results."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from polymarkt_monitoring.builders import build_evaluator, build_explorer_client, build_price_feed, build_rpc_client
+from polymarkt_monitoring.clients import HistoricalPriceFeed
+from polymarkt_monitoring.config import MonitorConfig
+from polymarkt_monitoring.models import BetCandidate
+from polymarkt_monitoring.services import MonitoringService
+
+# Shards span a fixed number of scan chunks, so boundaries, and recorded progress, survive a
+# rerun with a different --workers.
+SHARD_CHUNKS = 20
+
+
+@dataclass(slots=True, frozen=True)
+class BackfillShard:
+    from_block: int
+    to_block: int
+
+    @property
+    def name(self) -> str:
+        return f"shard-{self.from_block}-{self.to_block}"
+
+
+def plan_shards(from_block: int, to_block: int, *, shard_blocks: int) -> list[BackfillShard]:
+    """Split ``[from_block, to_block]`` into contiguous shards of ``shard_blocks`` blocks."""
+    if shard_blocks < 1:
+        raise ValueError("shard_blocks must be >= 1")
+    return [
+        BackfillShard(start, min(to_block, start + shard_blocks - 1))
+        for start in range(from_block, to_block + 1, shard_blocks)
+    ]
+
+
+class ShardProgress:
+    """Append-only JSONL log of one shard: one line per scanned chunk with its candidates.
+
+    A torn final line from an interrupted write is cut off on load, so that chunk is simply
+    rescanned and later appends start on a fresh line.
+    """
+
+    def __init__(self, state_dir: str | Path, shard: BackfillShard) -> None:
+        self.shard = shard
+        self.path = Path(state_dir) / f"{shard.name}.jsonl"
+
+    def load(self) -> tuple[int, list[BetCandidate]]:
+        """Return the next block to scan and the candidates recorded so far."""
+        next_block = self.shard.from_block
+        candidates: list[BetCandidate] = []
+        if not self.path.exists():
+            return next_block, candidates
+
+        data = self.path.read_bytes()
+        valid_bytes = 0
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            candidates.extend(BetCandidate(**payload) for payload in record["candidates"])
+            next_block = record["to_block"] + 1
+            valid_bytes += len(line)
+        if valid_bytes < len(data):
+            os.truncate(self.path, valid_bytes)
+        return next_block, candidates
+
+    @property
+    def complete(self) -> bool:
+        return self.load()[0] > self.shard.to_block
+
+    def append(self, to_block: int, candidates: list[BetCandidate]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        record = {"to_block": to_block, "candidates": [asdict(candidate) for candidate in candidates]}
+        with self.path.open("a") as handle:
+            handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def scan_shard(config: MonitorConfig, shard: BackfillShard, state_dir: str) -> int:
+    """Worker-process entry point; returns the number of candidates found in the shard."""
+    return asyncio.run(_scan_shard(config, shard, state_dir))
+
+
+async def _scan_shard(config: MonitorConfig, shard: BackfillShard, state_dir: str) -> int:
+    logger = logging.getLogger("polymarkt_monitoring.backfill")
+    progress = ShardProgress(state_dir, shard)
+    next_block, candidates = progress.load()
+    found = len(candidates)
+
+    rpc_client = build_rpc_client(config, logger)
+    price_feed = build_price_feed(config, logger)
+    async with rpc_client, price_feed:
+        # Extraction only: novelty and alerts run once, in the parent, over merged results.
+        service = MonitoringService(
+            config=config,
+            rpc_client=rpc_client,
+            pricing_client=price_feed,
+            explorer_client=None,
+            notifier=None,
+            evaluator=build_evaluator(config),
+            logger=logger,
+        )
+        while next_block <= shard.to_block:
+            chunk_end = min(shard.to_block, next_block + config.max_blocks_per_cycle - 1)
+            chunk = await service.collect_candidates(next_block, chunk_end)
+            progress.append(chunk_end, chunk)
+            # Nothing is alerted here, so traces would otherwise pile up for the whole shard.
+            service.tracer.prune(chunk_end, keep=())
+            found += len(chunk)
+            next_block = chunk_end + 1
+    return found
+
+
+def merge_candidates(chunks: list[list[BetCandidate]]) -> list[BetCandidate]:
+    """Concatenate shard results in block order, dropping duplicates by dedup key."""
+    merged: dict[tuple[str, str, str, str], BetCandidate] = {}
+    for candidate in sorted((c for chunk in chunks for c in chunk), key=lambda c: c.block_number):
+        merged.setdefault(candidate.dedup_key, candidate)
+    return list(merged.values())
+
+
+def write_candidates(path: str | Path, candidates: list[BetCandidate]) -> None:
+    with Path(path).open("w") as handle:
+        for candidate in candidates:
+            handle.write(json.dumps(asdict(candidate), separators=(",", ":")) + "\n")
+
+
+class BackfillRunner:
+    """Scans ``[from_block, to_block]`` in a process pool, resuming shards recorded in ``state_dir``."""
+
+    def __init__(
+        self,
+        *,
+        config: MonitorConfig,
+        from_block: int,
+        to_block: int,
+        workers: int,
+        state_dir: str | Path,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.config = config
+        self.from_block = from_block
+        self.to_block = to_block
+        self.workers = workers
+        self.state_dir = Path(state_dir)
+        self.logger = logger or logging.getLogger(__name__)
+        self.shards = plan_shards(from_block, to_block, shard_blocks=config.max_blocks_per_cycle * SHARD_CHUNKS)
+
+    def run(self) -> list[BetCandidate]:
+        pending = [shard for shard in self.shards if not ShardProgress(self.state_dir, shard).complete]
+        self.logger.info(
+            "Backfill started",
+            extra={
+                "from_block": self.from_block,
+                "to_block": self.to_block,
+                "shards": len(self.shards),
+                "pending_shards": len(pending),
+                "workers": self.workers,
+            },
+        )
+
+        if pending:
+            if self.config.pricing_mode == "historical":
+                # Fill the shared price cache once, so workers only read it.
+                asyncio.run(self._prepare_price_history())
+            started = time.monotonic()
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(pending))) as pool:
+                futures = {pool.submit(scan_shard, self.config, shard, str(self.state_dir)): shard for shard in pending}
+                for future in as_completed(futures):
+                    shard = futures[future]
+                    self.logger.info(
+                        "Backfill shard finished",
+                        extra={
+                            "shard": shard.name,
+                            "candidate_count": future.result(),
+                            "elapsed_seconds": round(time.monotonic() - started, 1),
+                        },
+                    )
+
+        return merge_candidates([ShardProgress(self.state_dir, shard).load()[1] for shard in self.shards])
+
+    async def alert(self, candidates: list[BetCandidate], *, notifier) -> list[BetCandidate]:
+        """Run merged candidates through novelty checks and alerting, one shard at a time.
+
+        Returns the candidates whose novelty check or delivery failed; they were not alerted.
+        """
+        rpc_client = build_rpc_client(self.config, self.logger)
+        async with rpc_client:
+            service = MonitoringService(
+                config=self.config,
+                rpc_client=rpc_client,
+                pricing_client=None,
+                explorer_client=build_explorer_client(self.config, self.logger),
+                notifier=notifier,
+                evaluator=build_evaluator(self.config),
+                logger=self.logger,
+            )
+            for shard in self.shards:
+                shard_candidates = [c for c in candidates if shard.from_block <= c.block_number <= shard.to_block]
+                if shard_candidates:
+                    await service.evaluate_and_alert(shard_candidates, block_number=shard.to_block)
+                    pending = {candidate.dedup_key for candidate in service.pending_candidates}
+                    service.tracer.prune(shard.to_block, keep=pending)
+
+        undelivered = service.pending_candidates
+        for candidate in undelivered:
+            self.logger.error(
+                "Backfill alert not delivered",
+                extra={
+                    "tx_hash": candidate.tx_hash,
+                    "wallet_address": candidate.wallet_address,
+                    "block_number": candidate.block_number,
+                },
+            )
+        return undelivered
+
+    async def _prepare_price_history(self) -> None:
+        rpc_client = build_rpc_client(self.config, self.logger)
+        price_feed = build_price_feed(self.config, self.logger)
+        if not isinstance(price_feed, HistoricalPriceFeed):
+            return
+        async with rpc_client:
+            timestamps = await rpc_client.get_block_timestamps([self.from_block, self.to_block])
+        await price_feed.prepare(timestamps[self.from_block], timestamps[self.to_block])
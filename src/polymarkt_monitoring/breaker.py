@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    def __init__(self, name: str, retry_in_seconds: float) -> None:
+        super().__init__(f"circuit {name} is open; next probe in {retry_in_seconds:.1f}s")
+        self.name = name
+        self.retry_in_seconds = retry_in_seconds
+
+
+class CircuitBreaker:
+    """Fails calls to one dependency fast after ``failure_threshold`` consecutive failures.
+
+    After ``reset_timeout_seconds`` open, up to ``half_open_max_calls`` probe calls are let
+    through; a successful probe closes the circuit and a failed one re-opens it. Safe to share
+    between the event loop and worker threads.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        if reset_timeout_seconds <= 0:
+            raise ValueError("reset_timeout_seconds must be > 0")
+
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.logger = logger or logging.getLogger(__name__)
+        self.state = CLOSED
+        self.opened = 0
+        self.rejected = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    def allow_request(self) -> bool:
+        """True if a call may go out now; in half-open state this claims a probe slot."""
+        with self._lock:
+            if self.state == OPEN and self._clock() - self._opened_at >= self.reset_timeout_seconds:
+                self._transition(HALF_OPEN)
+                self._probes = 0
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def retry_in_seconds(self) -> float:
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout_seconds - (self._clock() - self._opened_at))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._probes = 0
+            if self.state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self._failures >= self.failure_threshold):
+                self._opened_at = self._clock()
+                self.opened += 1
+                self._transition(OPEN)
+
+    def release(self) -> None:
+        """Give back a probe slot for a call that ended without an outcome (e.g. cancelled)."""
+        with self._lock:
+            if self.state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def call(self, fn: Callable[[], T]) -> T:
+        self._check()
+        try:
+            result = fn()
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+    async def call_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        self._check()
+        try:
+            result = await fn()
+        except BaseException as exc:
+            if isinstance(exc, Exception):
+                self.record_failure()
+            else:
+                self.release()
+            raise
+        self.record_success()
+        return result
+
+    def _check(self) -> None:
+        if not self.allow_request():
+            raise CircuitOpenError(self.name, self.retry_in_seconds())
+
+    def _transition(self, state: str) -> None:
+        previous, self.state = self.state, state
+        log = self.logger.warning if state == OPEN else self.logger.info
+        log(
+            "Circuit breaker state changed",
+            extra={"breaker": self.name, "from_state": previous, "to_state": state, "failures": self._failures},
+        )
@@ -0,0 +1,195 @@
+"""Construct configured clients; shared by the monitor and backfill entry points."""
+
+from __future__ import annotations
+
+import logging
+
+from polymarkt_monitoring import metrics
+from polymarkt_monitoring.breaker import CircuitBreaker
+from polymarkt_monitoring.capture import TrafficCapture
+from polymarkt_monitoring.clients import (
+    AsyncRpcClient,
+    AsyncTelegramNotifier,
+    CoinGeckoPricingClient,
+    ExplorerClient,
+    HeadStream,
+    HistoricalPriceFeed,
+    PriceFeed,
+    WalletNoveltyCache,
+)
+from polymarkt_monitoring.config import MonitorConfig
+from polymarkt_monitoring.metrics import MetricsServer
+from polymarkt_monitoring.services import BetEvaluator, MonitoringService
+from polymarkt_monitoring.tracing import AlertTracer, JsonlTraceExporter, OtlpHttpTraceExporter, TraceExporter
+
+
+def build_breaker(config: MonitorConfig, name: str, logger: logging.Logger) -> CircuitBreaker:
+    return CircuitBreaker(
+        name,
+        failure_threshold=config.breaker_failure_threshold,
+        reset_timeout_seconds=config.breaker_reset_seconds,
+        logger=logger,
+    )
+
+
+def build_capture(config: MonitorConfig, logger: logging.Logger) -> TrafficCapture | None:
+    if config.capture_mode == "off":
+        return None
+    return TrafficCapture(
+        config.capture_path,
+        mode=config.capture_mode,
+        timing=config.capture_replay_timing,
+        logger=logger,
+    )
+
+
+def build_rpc_client(
+    config: MonitorConfig,
+    logger: logging.Logger,
+    *,
+    capture: TrafficCapture | None = None,
+) -> AsyncRpcClient:
+    return AsyncRpcClient(
+        rpc_urls=config.rpc_urls,
+        max_connections=config.rpc_max_concurrency,
+        batch_size=config.rpc_batch_size,
+        hedge_percentile=config.rpc_hedge_percentile,
+        max_head_lag_blocks=config.rpc_max_head_lag_blocks,
+        head_check_interval_seconds=config.rpc_head_check_seconds,
+        breaker_failure_threshold=config.breaker_failure_threshold,
+        breaker_reset_seconds=config.breaker_reset_seconds,
+        capture=capture,
+        logger=logger,
+    )
+
+
+def build_head_stream(config: MonitorConfig, logger: logging.Logger) -> HeadStream | None:
+    # A replay has no live chain to subscribe to; heads come from the captured eth_blockNumber calls.
+    if not config.rpc_ws_url or config.capture_mode == "replay":
+        return None
+    return HeadStream(
+        ws_url=config.rpc_ws_url,
+        token_addresses=config.token_contracts.values(),
+        target_addresses=config.bet_contract_addresses,
+        logger=logger,
+    )
+
+
+def build_price_feed(
+    config: MonitorConfig,
+    logger: logging.Logger,
+    *,
+    capture: TrafficCapture | None = None,
+) -> PriceFeed | HistoricalPriceFeed:
+    coingecko_client = CoinGeckoPricingClient(
+        api_base=config.coingecko_api_base,
+        breaker=build_breaker(config, "coingecko", logger),
+        capture=capture,
+        logger=logger,
+    )
+    price_asset_ids = [config.native_coingecko_id, *config.token_coingecko_ids.values()]
+    if config.pricing_mode == "historical":
+        return HistoricalPriceFeed(
+            pricing_client=coingecko_client,
+            asset_ids=price_asset_ids,
+            cache_path=config.price_history_path,
+            logger=logger,
+        )
+    return PriceFeed(
+        pricing_client=coingecko_client,
+        asset_ids=price_asset_ids,
+        refresh_interval_seconds=config.price_refresh_seconds,
+        max_staleness_seconds=config.price_max_staleness_seconds,
+        logger=logger,
+    )
+
+
+def build_explorer_client(
+    config: MonitorConfig,
+    logger: logging.Logger,
+    *,
+    capture: TrafficCapture | None = None,
+) -> ExplorerClient:
+    novelty_cache = (
+        WalletNoveltyCache(
+            novelty_threshold=config.wallet_max_tx_count,
+            max_entries=config.novelty_cache_size,
+            new_wallet_ttl_seconds=config.novelty_cache_ttl_seconds,
+        )
+        if config.novelty_cache_size > 0
+        else None
+    )
+    return ExplorerClient(
+        api_base=config.explorer_api_base,
+        api_key=config.explorer_api_key,
+        novelty_cache=novelty_cache,
+        breaker=build_breaker(config, "explorer", logger),
+        capture=capture,
+        logger=logger,
+    )
+
+
+def build_telegram_notifier(config: MonitorConfig, logger: logging.Logger) -> AsyncTelegramNotifier:
+    return AsyncTelegramNotifier(
+        bot_token=config.telegram_bot_token,
+        chat_id=config.telegram_chat_id,
+        messages_per_minute=config.telegram_messages_per_minute,
+        breaker=build_breaker(config, "telegram", logger),
+        logger=logger,
+    )
+
+
+def build_evaluator(config: MonitorConfig) -> BetEvaluator:
+    return BetEvaluator(
+        usd_threshold=config.usd_threshold,
+        wallet_max_tx_count=config.wallet_max_tx_count,
+    )
+
+
+def build_tracer(config: MonitorConfig, logger: logging.Logger) -> AlertTracer:
+    exporters: list[TraceExporter] = []
+    if config.trace_path:
+        exporters.append(JsonlTraceExporter(path=config.trace_path))
+    if config.trace_otlp_endpoint:
+        exporters.append(OtlpHttpTraceExporter(endpoint=config.trace_otlp_endpoint, logger=logger))
+    return AlertTracer(exporters=exporters, logger=logger)
+
+
+def build_metrics_server(
+    config: MonitorConfig,
+    service: MonitoringService,
+    logger: logging.Logger,
+) -> MetricsServer | None:
+    """Bind the service's gauges to the metrics registry and build its ``/metrics`` server."""
+    if not config.metrics_port:
+        return None
+
+    registry = metrics.REGISTRY
+    gauges = {
+        "polymarkt_blocks_per_second": (
+            "Checkpointed blocks per second over the last minute.",
+            lambda: service.blocks_per_second,
+        ),
+        "polymarkt_head_lag_blocks": (
+            "Confirmed blocks not yet checkpointed.",
+            lambda: service.head_lag_blocks,
+        ),
+        "polymarkt_head_lag_seconds": ("Age of the newest checkpointed block.", lambda: service.head_lag_seconds),
+        "polymarkt_pending_candidates": ("Candidates parked for retry.", lambda: service.pending_count),
+        "polymarkt_dedup_size": ("Event keys held by the dedup store.", lambda: service.dedup_size),
+        "polymarkt_timestamp_cache_hit_ratio": (
+            "Share of block timestamp lookups served from cache.",
+            service.timestamp_cache_hit_ratio,
+        ),
+        "polymarkt_price_cache_hit_ratio": (
+            "Share of price lookups served from memory without a fetch or staleness error.",
+            lambda: metrics.hit_ratio(service.pricing_client.hits, service.pricing_client.misses),
+        ),
+        "polymarkt_novelty_cache_hit_ratio": (
+            "Share of wallet novelty lookups served from cache.",
+            lambda: stats.hit_ratio if (stats := service.explorer_client.cache_stats()) is not None else None,
+        ),
+    }
+    for name, (documentation, function) in gauges.items():
+        registry.gauge(name, documentation, function)
+    return MetricsServer(registry=registry, host=config.metrics_host, port=config.metrics_port, logger=logger)
@@ -0,0 +1,153 @@
+"""Record RPC and API traffic to a capture file and serve it back offline."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import threading
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+CAPTURE_MODES = ("record", "replay")
+REPLAY_TIMINGS = ("fast", "original")
+
+
+class CaptureMissError(LookupError):
+    """Replay was asked for a request the capture does not contain."""
+
+
+@dataclass(slots=True, frozen=True)
+class CapturedResponse:
+    status: int
+    body: Any
+    latency: float
+
+
+class TrafficCapture:
+    """Gzip-compressed, append-only JSONL of request/response pairs keyed by service, method and params.
+
+    In ``record`` mode clients call ``record`` after each response; every record is flushed
+    on its own, so a crash loses at most the line being written and a later run appends to
+    the same file. In ``replay`` mode the file is indexed up front and ``replay`` answers
+    from it. Repeated requests get their recorded responses in order, and the last one
+    is repeated once they run out, so polling calls like ``eth_blockNumber`` settle on the
+    last recorded head. ``timing="original"`` waits out each recorded latency before
+    answering. ``fast`` answers at once.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        mode: str,
+        timing: str = "fast",
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if mode not in CAPTURE_MODES:
+            raise ValueError(f"mode must be one of {', '.join(CAPTURE_MODES)}")
+        if timing not in REPLAY_TIMINGS:
+            raise ValueError(f"timing must be one of {', '.join(REPLAY_TIMINGS)}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.timing = timing
+        self.logger = logger or logging.getLogger(__name__)
+        self.recorded = 0
+        self.replayed = 0
+        self._lock = threading.Lock()
+        self._handle: gzip.GzipFile | None = None
+        self._index: dict[str, deque[CapturedResponse]] = {}
+        if mode == "replay":
+            self._load()
+
+    def __enter__(self) -> TrafficCapture:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._index.values())
+
+    def record(self, service: str, method: str, params: Any, body: Any, *, status: int = 200, latency: float) -> None:
+        entry = {
+            "service": service,
+            "method": method,
+            "params": params,
+            "status": status,
+            "latency": round(latency, 6),
+            "body": body,
+        }
+        line = json.dumps(entry, separators=(",", ":"), default=str).encode() + b"\n"
+        with self._lock:
+            if self._handle is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # Appending starts a new gzip member; readers see the members as one stream.
+                self._handle = gzip.open(self.path, "ab")
+            self._handle.write(line)
+            self._handle.flush(zlib.Z_SYNC_FLUSH)
+            self.recorded += 1
+
+    def replay(self, service: str, method: str, params: Any) -> CapturedResponse:
+        response = self._next(service, method, params)
+        if self.timing == "original" and response.latency > 0:
+            time.sleep(response.latency)
+        return response
+
+    async def replay_async(self, service: str, method: str, params: Any) -> CapturedResponse:
+        response = self._next(service, method, params)
+        if self.timing == "original" and response.latency > 0:
+            await asyncio.sleep(response.latency)
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def _next(self, service: str, method: str, params: Any) -> CapturedResponse:
+        key = _key(service, method, params)
+        with self._lock:
+            responses = self._index.get(key)
+            if not responses:
+                raise CaptureMissError(f"No captured response for {service} {method} {_canonical(params)}")
+            self.replayed += 1
+            return responses.popleft() if len(responses) > 1 else responses[0]
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            raise FileNotFoundError(f"Capture file not found: {self.path}")
+        try:
+            with gzip.open(self.path, "rb") as handle:
+                for line in handle:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A record cut short by a crash during recording.
+                        continue
+                    response = CapturedResponse(entry["status"], entry["body"], entry["latency"])
+                    key = _key(entry["service"], entry["method"], entry["params"])
+                    self._index.setdefault(key, deque()).append(response)
+        except (EOFError, gzip.BadGzipFile, zlib.error):
+            # A recorder that was killed leaves the last member without its trailer.
+            self.logger.warning("Capture file ends early; replaying what was read", extra={"path": str(self.path)})
+        self.logger.info("Capture loaded", extra={"path": str(self.path), "responses": len(self)})
+
+
+def _canonical(params: Any) -> str:
+    return json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _key(service: str, method: str, params: Any) -> str:
+    return f"{service} {method} {_canonical(params)}"
@@ -1,13 +1,25 @@
 """External service clients."""
 
+from .async_rpc import AsyncRpcClient
 from .explorer import ExplorerClient
-from .notifier import TelegramNotifier
+from .head_stream import HeadStream
+from .notifier import AsyncTelegramNotifier, FileNotifier, TelegramNotifier
+from .novelty_cache import WalletNoveltyCache
+from .price_feed import PriceFeed
+from .price_history import HistoricalPriceFeed
 from .pricing import CoinGeckoPricingClient
 from .rpc import RpcClient
 
 __all__ = [
     "RpcClient",
+    "AsyncRpcClient",
+    "HeadStream",
     "CoinGeckoPricingClient",
+    "PriceFeed",
+    "HistoricalPriceFeed",
     "ExplorerClient",
     "TelegramNotifier",
+    "AsyncTelegramNotifier",
+    "FileNotifier",
+    "WalletNoveltyCache",
 ]
@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from polymarkt_monitoring import metrics
+from polymarkt_monitoring.capture import TrafficCapture
+from polymarkt_monitoring.clients import json_codec
+from polymarkt_monitoring.clients.endpoint_pool import EndpointPool
+from polymarkt_monitoring.clients.log_ranges import LogRangePlanner, is_range_error
+from polymarkt_monitoring.clients.rpc import (
+    DEFAULT_LOG_TOPIC_CHUNK_SIZE,
+    JSON_HEADERS,
+    TRANSFER_EVENT_TOPIC,
+    RpcError,
+    _capture_request,
+    _parse_transfer_logs,
+    _raise_for_error,
+    _recipient_topic_chunks,
+    _restore_ids,
+    _scan_native_transfers,
+    _strip_ids,
+    _to_int,
+)
+from polymarkt_monitoring.retry import async_with_retries
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - import depends on runtime environment
+    aiohttp = None
+
+
+class AsyncRpcClient:
+    """JSON-RPC client on a pooled aiohttp session, mirroring ``RpcClient`` with awaitable methods.
+
+    Every call goes to the healthiest endpoint in an ``EndpointPool`` and fails over to the
+    next one immediately. With ``hedge_percentile`` set, a call still running after that
+    percentile of the endpoint's recent latencies is raced against the runner-up endpoint and
+    the first answer wins. Heads of all endpoints are compared every
+    ``head_check_interval_seconds``; endpoints trailing by more than ``max_head_lag_blocks``
+    are only used as a last resort.
+    """
+
+    def __init__(
+        self,
+        *,
+        rpc_urls: list[str],
+        request_timeout: int = 10,
+        max_connections: int = 8,
+        batch_size: int = 20,
+        batch_item_attempts: int = 3,
+        retry_delay_seconds: float = 1.0,
+        log_topic_chunk_size: int = DEFAULT_LOG_TOPIC_CHUNK_SIZE,
+        log_range_planner: LogRangePlanner | None = None,
+        hedge_percentile: float = 0.0,
+        max_head_lag_blocks: int = 5,
+        head_check_interval_seconds: float = 30.0,
+        breaker_failure_threshold: int = 5,
+        breaker_reset_seconds: float = 30.0,
+        capture: TrafficCapture | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required. Install dependencies with `pip install -e .`.")
+        if not rpc_urls:
+            raise ValueError("rpc_urls must include at least one endpoint")
+        if max_connections < 1:
+            raise ValueError("max_connections must be >= 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if batch_item_attempts < 1:
+            raise ValueError("batch_item_attempts must be >= 1")
+
+        self.rpc_urls = [url.strip() for url in rpc_urls if url.strip()]
+        self.request_timeout = request_timeout
+        self.max_connections = max_connections
+        self.batch_size = batch_size
+        self.batch_item_attempts = batch_item_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.log_topic_chunk_size = log_topic_chunk_size
+        self.capture = capture
+        self.logger = logger or logging.getLogger(__name__)
+        self.log_range_planner = log_range_planner or LogRangePlanner(logger=self.logger)
+        self.pool = EndpointPool(
+            self.rpc_urls,
+            hedge_percentile=hedge_percentile,
+            max_head_lag_blocks=max_head_lag_blocks,
+            breaker_failure_threshold=breaker_failure_threshold,
+            breaker_reset_seconds=breaker_reset_seconds,
+            logger=self.logger,
+        )
+        self.head_check_interval_seconds = head_check_interval_seconds
+        self.hedged_requests = 0
+        self._heads_checked_at: float | None = None
+        self._request_ids = itertools.count(1)
+        self._session: aiohttp.ClientSession | None = None
+
+    async def __aenter__(self) -> AsyncRpcClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def latest_block_number(self) -> int:
+        if len(self.rpc_urls) > 1 and (
+            self._heads_checked_at is None
+            or time.monotonic() - self._heads_checked_at >= self.head_check_interval_seconds
+        ):
+            return await self.check_heads()
+        return _to_int(await self._request("eth_blockNumber", []))
+
+    async def check_heads(self) -> int:
+        """Query every endpoint's head, flag laggards, and return the lowest head among the rest.
+
+        The lowest in-sync head is returned so that whichever endpoint a later call is routed
+        to already has every block up to it.
+        """
+        self._heads_checked_at = time.monotonic()
+
+        async def _head(url: str) -> int | None:
+            payload = {"jsonrpc": "2.0", "id": next(self._request_ids), "method": "eth_blockNumber", "params": []}
+            try:
+                body = await self._timed_post(url, payload)
+                _raise_for_error(body)
+                return _to_int(body["result"])
+            except Exception:
+                self.logger.warning("RPC head check failed", extra={"rpc_url": url}, exc_info=True)
+                return None
+
+        heads = dict(zip(self.rpc_urls, await asyncio.gather(*(_head(url) for url in self.rpc_urls))))
+        self.pool.record_heads(heads)
+        in_sync = [
+            heads[snapshot.url]
+            for snapshot in self.pool.health()
+            if not snapshot.lagging and heads[snapshot.url] is not None
+        ]
+        if not in_sync:
+            raise RuntimeError("RPC head check failed on every endpoint")
+        return min(in_sync)
+
+    async def get_block_timestamp(self, block_number: int) -> int:
+        block = await self._request("eth_getBlockByNumber", [hex(block_number), False])
+        return _to_int(block["timestamp"])
+
+    async def get_native_transfers(self, block_number: int, target_addresses: set[str]) -> list[dict[str, Any]]:
+        if not target_addresses:
+            return []
+
+        target_set = {address.lower() for address in target_addresses}
+        block = await self._request("eth_getBlockByNumber", [hex(block_number), True])
+        return _scan_native_transfers(block["transactions"], block_number, target_set)
+
+    async def get_blocks(
+        self,
+        from_block: int,
+        to_block: int,
+        *,
+        full_transactions: bool = False,
+    ) -> list[dict[str, Any]]:
+        return await self.get_blocks_by_number(range(from_block, to_block + 1), full_transactions=full_transactions)
+
+    async def get_blocks_by_number(
+        self,
+        block_numbers: Iterable[int],
+        *,
+        full_transactions: bool = False,
+    ) -> list[dict[str, Any]]:
+        calls = [("eth_getBlockByNumber", [hex(number), full_transactions]) for number in block_numbers]
+        chunks = [calls[start : start + self.batch_size] for start in range(0, len(calls), self.batch_size)]
+        chunk_results = await asyncio.gather(*(self._batch_request(chunk) for chunk in chunks))
+
+        blocks: list[dict[str, Any]] = []
+        for results in chunk_results:
+            blocks.extend(results)
+        return blocks
+
+    async def get_block_timestamps(self, block_numbers: Iterable[int]) -> dict[int, int]:
+        numbers = sorted(set(block_numbers))
+        if not numbers:
+            return {}
+        headers = await self.get_blocks_by_number(numbers, full_transactions=False)
+        return {number: _to_int(header["timestamp"]) for number, header in zip(numbers, headers)}
+
+    async def get_transaction_counts(self, wallet_addresses: Iterable[str], block_number: int) -> dict[str, int]:
+        """Batch ``eth_getTransactionCount`` for many wallets, pinned to ``block_number``."""
+        wallets = sorted({address.lower() for address in wallet_addresses})
+        calls = [("eth_getTransactionCount", [wallet, hex(block_number)]) for wallet in wallets]
+        chunks = [calls[start : start + self.batch_size] for start in range(0, len(calls), self.batch_size)]
+        chunk_results = await asyncio.gather(*(self._batch_request(chunk) for chunk in chunks))
+
+        counts: list[int] = []
+        for results in chunk_results:
+            counts.extend(_to_int(result) for result in results)
+        return dict(zip(wallets, counts))
+
+    async def get_native_transfers_range(
+        self,
+        from_block: int,
+        to_block: int,
+        target_addresses: set[str],
+    ) -> list[dict[str, Any]]:
+        """Return one ``{"block_number", "timestamp", "transfers"}`` record per block, in order."""
+        target_set = {address.lower() for address in target_addresses}
+        blocks = await self.get_blocks(from_block, to_block, full_transactions=True)
+        return [
+            {
+                "block_number": block_number,
+                "timestamp": _to_int(block["timestamp"]),
+                "transfers": _scan_native_transfers(block["transactions"], block_number, target_set)
+                if target_set
+                else [],
+            }
+            for block_number, block in zip(range(from_block, to_block + 1), blocks)
+        ]
+
+    async def get_erc20_transfers(
+        self,
+        *,
+        token_addresses: Iterable[str],
+        from_block: int,
+        to_block: int,
+        target_addresses: set[str],
+    ) -> list[dict[str, Any]]:
+        tokens = sorted({address.lower() for address in token_addresses})
+        if not tokens or not target_addresses:
+            return []
+
+        async def _fetch_logs(recipient_topics: list[str]) -> list[Any]:
+            async def _fetch_window(start: int, end: int) -> tuple[str, list[Any]]:
+                query = {
+                    "fromBlock": hex(start),
+                    "toBlock": hex(end),
+                    "address": tokens,
+                    "topics": [TRANSFER_EVENT_TOPIC, None, recipient_topics],
+                }
+                return await self._served_request("eth_getLogs", [query])
+
+            # The best endpoint sizes each window; the one that answers is charged with the outcome.
+            return await self.log_range_planner.fetch(
+                _fetch_window,
+                from_block,
+                to_block,
+                provider=self.pool.best,
+            )
+
+        topic_chunks = _recipient_topic_chunks(target_addresses, self.log_topic_chunk_size)
+        log_batches = await asyncio.gather(*(_fetch_logs(chunk) for chunk in topic_chunks))
+
+        logs: list[Any] = []
+        for log_batch in log_batches:
+            logs.extend(log_batch)
+        return _parse_transfer_logs(logs)
+
+    async def _request(self, method: str, params: list[Any]) -> Any:
+        return (await self._served_request(method, params))[1]
+
+    async def _served_request(self, method: str, params: list[Any]) -> tuple[str, Any]:
+        """Like ``_request``, but also return the endpoint that answered; its errors carry that URL."""
+        payload = {"jsonrpc": "2.0", "id": next(self._request_ids), "method": method, "params": params}
+        url, body = await self._send(payload, method=method)
+        if not isinstance(body, dict):
+            raise ValueError(f"Unexpected RPC payload: {body}")
+        _raise_for_error(body, url)
+        return url, body.get("result")
+
+    async def _batch_request(self, calls: list[tuple[str, list[Any]]]) -> list[Any]:
+        """Send ``calls`` as one JSON-RPC batch, re-sending only the items that failed."""
+        results: list[Any] = [None] * len(calls)
+        pending = list(range(len(calls)))
+        delay = self.retry_delay_seconds
+
+        for attempt in range(1, self.batch_item_attempts + 1):
+            ids = {next(self._request_ids): index for index in pending}
+            payload = [
+                {"jsonrpc": "2.0", "id": request_id, "method": calls[index][0], "params": calls[index][1]}
+                for request_id, index in ids.items()
+            ]
+            _, body = await self._send(payload, method=f"batch[{len(payload)}]")
+            if isinstance(body, dict):
+                # Some providers reject the whole batch with a single error object.
+                _raise_for_error(body)
+                raise ValueError(f"Unexpected RPC batch payload: {body}")
+
+            responses = {item.get("id"): item for item in body if isinstance(item, dict)}
+            failed: list[int] = []
+            for request_id, index in ids.items():
+                item = responses.get(request_id)
+                if item is None or item.get("error") or item.get("result") is None:
+                    failed.append(index)
+                    continue
+                results[index] = item["result"]
+
+            if not failed:
+                return results
+            if attempt == self.batch_item_attempts:
+                break
+
+            self.logger.warning(
+                "retrying failed batch items",
+                extra={"attempt": attempt, "failed_count": len(failed), "batch_size": len(calls)},
+            )
+            pending = failed
+            await asyncio.sleep(delay)
+            delay *= 2
+
+        first_failed = calls[failed[0]]
+        raise RpcError(0, f"{len(failed)} batch item(s) failed, first: {first_failed[0]} {first_failed[1]}")
+
+    async def _send(self, payload: dict[str, Any] | list[dict[str, Any]], *, method: str) -> tuple[str, Any]:
+        """Return the URL of the endpoint that answered and its response body."""
+        return await async_with_retries(
+            lambda: self._race(payload, method=method),
+            attempts=2,
+            base_delay_seconds=self.retry_delay_seconds,
+            deadline_seconds=self.request_timeout * 3,
+            should_retry=lambda exc: not is_range_error(exc),
+            logger=self.logger,
+        )
+
+    async def _race(self, payload: dict[str, Any] | list[dict[str, Any]], *, method: str) -> tuple[str, Any]:
+        """Try endpoints in health order, hedging a slow primary; the first success wins."""
+        candidates = iter(self.pool.ranked())
+        pending: dict[asyncio.Task[Any], str] = {}
+        last_error: Exception | None = None
+
+        def _launch() -> bool:
+            url = self.pool.acquire(candidates)
+            if url is None:
+                return False
+            pending[asyncio.create_task(self._timed_post(url, payload))] = url
+            return True
+
+        if not _launch():
+            raise self.pool.circuit_open_error()
+        hedge_delay = self.pool.hedge_delay(next(iter(pending.values())))
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # Only one hedge per call; after that wait for whichever finishes first.
+                    hedge_delay = None
+                    if _launch():
+                        self.hedged_requests += 1
+                        self.logger.debug("Hedging slow RPC call", extra={"method": method})
+                    continue
+                for task in done:
+                    url = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        return url, task.result()
+                    if is_range_error(error):
+                        # The query itself is too large; another provider would reject it the same way.
+                        raise error
+                    self.logger.warning(
+                        "RPC call failed; trying next provider",
+                        extra={"rpc_url": url, "method": method},
+                        exc_info=error,
+                    )
+                    last_error = error
+                if not pending:
+                    _launch()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        assert last_error is not None
+        raise last_error
+
+    async def _timed_post(self, url: str, payload: dict[str, Any] | list[dict[str, Any]]) -> Any:
+        method = _metric_method(payload)
+        started = time.monotonic()
+        try:
+            body = await self._post(url, payload)
+        except asyncio.CancelledError:
+            self.pool.record_cancelled(url, time.monotonic() - started)
+            metrics.RPC_REQUESTS.inc(method, "cancelled")
+            raise
+        except Exception as exc:
+            latency = time.monotonic() - started
+            if is_range_error(exc):
+                self.pool.record_success(url, latency)
+            else:
+                self.pool.record_failure(url)
+            metrics.RPC_LATENCY.observe(latency, method)
+            metrics.RPC_REQUESTS.inc(method, "error")
+            raise
+        latency = time.monotonic() - started
+        self.pool.record_success(url, latency)
+        metrics.RPC_LATENCY.observe(latency, method)
+        metrics.RPC_REQUESTS.inc(method, "ok")
+        return body
+
+    async def _post(self, url: str, payload: dict[str, Any] | list[dict[str, Any]]) -> Any:
+        if self.capture is not None and self.capture.replaying:
+            captured = await self.capture.replay_async("rpc", *_capture_request(payload))
+            body = _restore_ids(payload, captured.body)
+            if captured.status >= 400:
+                _raise_for_error(body, url)
+            return body
+        started = time.monotonic()
+        async with self._get_session().post(url, data=json_codec.dumps(payload), headers=JSON_HEADERS) as response:
+            raw = await response.read()
+            if response.status >= 400:
+                # Providers often report oversized queries as HTTP errors carrying a JSON-RPC error body.
+                try:
+                    body = json_codec.loads(raw)
+                except ValueError:
+                    body = None
+                if isinstance(body, dict) and body.get("error"):
+                    self._record(payload, body, status=response.status, started=started)
+                    _raise_for_error(body, url)
+                response.raise_for_status()
+            body = json_codec.loads(raw)
+            self._record(payload, body, status=response.status, started=started)
+            return body
+
+    def _record(self, payload: dict[str, Any] | list[dict[str, Any]], body: Any, *, status: int, started: float) -> None:
+        if self.capture is not None:
+            method, params = _capture_request(payload)
+            latency = time.monotonic() - started
+            self.capture.record("rpc", method, params, _strip_ids(payload, body), status=status, latency=latency)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            )
+        return self._session
+
+
+def _metric_method(payload: dict[str, Any] | list[dict[str, Any]]) -> str:
+    """Method label for metrics; a batch is labelled by its first call, e.g. ``batch:eth_getBlockByNumber``."""
+    if isinstance(payload, list):
+        return f"batch:{payload[0]['method']}" if payload else "batch"
+    return payload["method"]
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import logging
+import math
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+from polymarkt_monitoring.breaker import OPEN, CircuitBreaker, CircuitOpenError
+
+
+@dataclass(slots=True)
+class EndpointHealth:
+    url: str
+    latency_ewma: float | None = None
+    error_rate: float = 0.0
+    calls: int = 0
+    failures: int = 0
+    head: int | None = None
+    lagging: bool = False
+    recent_latencies: deque[float] = field(default_factory=deque)
+
+    @property
+    def score(self) -> float:
+        """Expected seconds per successful call; lower is healthier, unmeasured endpoints rank last."""
+        if self.latency_ewma is None:
+            return math.inf
+        return self.latency_ewma / max(1e-3, 1.0 - self.error_rate)
+
+
+@dataclass(slots=True, frozen=True)
+class EndpointSnapshot:
+    url: str
+    latency_ewma: float | None
+    error_rate: float
+    calls: int
+    failures: int
+    head: int | None
+    lagging: bool
+    breaker_state: str
+
+
+class EndpointPool:
+    """Per-endpoint health bookkeeping shared by the sync and async RPC clients; performs no I/O.
+
+    Each endpoint keeps a latency EWMA, an error-rate EWMA and a window of recent latencies.
+    ``ranked`` orders endpoints by expected time per successful call, with endpoints whose
+    head trails the best one by more than ``max_head_lag_blocks`` moved to the back. Endpoints
+    without a latency sample yet rank after measured ones; the periodic head check is what
+    measures every endpoint. Each endpoint also has a ``CircuitBreaker``; callers skip
+    endpoints whose breaker refuses a request, and open endpoints rank last.
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        *,
+        smoothing: float = 0.2,
+        max_head_lag_blocks: int = 5,
+        hedge_percentile: float = 0.0,
+        min_hedge_samples: int = 20,
+        min_hedge_delay_seconds: float = 0.05,
+        sample_size: int = 200,
+        breaker_failure_threshold: int = 5,
+        breaker_reset_seconds: float = 30.0,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.urls = list(urls)
+        if not self.urls:
+            raise ValueError("urls must include at least one endpoint")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        if max_head_lag_blocks < 0:
+            raise ValueError("max_head_lag_blocks must be >= 0")
+        if not 0 <= hedge_percentile < 100:
+            raise ValueError("hedge_percentile must be in [0, 100)")
+
+        self.smoothing = smoothing
+        self.max_head_lag_blocks = max_head_lag_blocks
+        self.hedge_percentile = hedge_percentile
+        self.min_hedge_samples = min_hedge_samples
+        self.min_hedge_delay_seconds = min_hedge_delay_seconds
+        self.logger = logger or logging.getLogger(__name__)
+        self._health = {url: EndpointHealth(url=url, recent_latencies=deque(maxlen=sample_size)) for url in self.urls}
+        self.breakers = {
+            url: CircuitBreaker(
+                f"rpc {url}",
+                failure_threshold=breaker_failure_threshold,
+                reset_timeout_seconds=breaker_reset_seconds,
+                logger=self.logger,
+            )
+            for url in self.urls
+        }
+
+    def ranked(self) -> list[str]:
+        """Endpoints from healthiest to least healthy; ties keep configuration order."""
+        return sorted(
+            self.urls,
+            key=lambda url: (self.breakers[url].state == OPEN, self._health[url].lagging, self._health[url].score),
+        )
+
+    def best(self) -> str:
+        return self.ranked()[0]
+
+    def acquire(self, candidates: Iterable[str]) -> str | None:
+        """First of ``candidates`` whose breaker lets a request through, or ``None``."""
+        for url in candidates:
+            if self.breakers[url].allow_request():
+                return url
+        return None
+
+    def circuit_open_error(self) -> CircuitOpenError:
+        return CircuitOpenError("rpc", min(breaker.retry_in_seconds() for breaker in self.breakers.values()))
+
+    def record_cancelled(self, url: str, latency_seconds: float) -> None:
+        """A call abandoned mid-flight still shows the endpoint was at least this slow."""
+        self.record_latency(url, latency_seconds)
+        self.breakers[url].release()
+
+    def record_latency(self, url: str, latency_seconds: float) -> None:
+        health = self._health[url]
+        if health.latency_ewma is None:
+            health.latency_ewma = latency_seconds
+        else:
+            health.latency_ewma += self.smoothing * (latency_seconds - health.latency_ewma)
+        health.recent_latencies.append(latency_seconds)
+
+    def record_success(self, url: str, latency_seconds: float) -> None:
+        health = self._health[url]
+        health.calls += 1
+        health.error_rate *= 1 - self.smoothing
+        self.record_latency(url, latency_seconds)
+        self.breakers[url].record_success()
+
+    def record_failure(self, url: str) -> None:
+        health = self._health[url]
+        health.calls += 1
+        health.failures += 1
+        health.error_rate += self.smoothing * (1 - health.error_rate)
+        self.breakers[url].record_failure()
+
+    def hedge_delay(self, url: str) -> float | None:
+        """Seconds to wait on ``url`` before racing another endpoint, or ``None`` to not hedge."""
+        if self.hedge_percentile <= 0 or len(self.urls) < 2:
+            return None
+        latencies = self._health[url].recent_latencies
+        if len(latencies) < self.min_hedge_samples:
+            return None
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, math.ceil(self.hedge_percentile / 100 * len(ordered)) - 1)
+        return max(self.min_hedge_delay_seconds, ordered[index])
+
+    def record_heads(self, heads: Mapping[str, int | None]) -> None:
+        """Mark endpoints lagging when their head (``None`` if unreachable) trails the best one."""
+        known = [head for head in heads.values() if head is not None]
+        if not known:
+            return
+        best_head = max(known)
+        for url, head in heads.items():
+            health = self._health[url]
+            health.head = head
+            lagging = head is None or best_head - head > self.max_head_lag_blocks
+            if lagging != health.lagging:
+                self.logger.warning(
+                    "RPC endpoint lagging" if lagging else "RPC endpoint caught up",
+                    extra={"rpc_url": url, "head": head, "best_head": best_head},
+                )
+            health.lagging = lagging
+
+    def health(self) -> list[EndpointSnapshot]:
+        return [
+            EndpointSnapshot(
+                url=health.url,
+                latency_ewma=health.latency_ewma,
+                error_rate=health.error_rate,
+                calls=health.calls,
+                failures=health.failures,
+                head=health.head,
+                lagging=health.lagging,
+                breaker_state=self.breakers[health.url].state,
+            )
+            for health in self._health.values()
+        ]
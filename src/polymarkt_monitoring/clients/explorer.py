@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import logging
+import time
+from typing import Any
 
 import requests
 
+from polymarkt_monitoring import metrics
+from polymarkt_monitoring.breaker import CircuitBreaker
+from polymarkt_monitoring.capture import TrafficCapture
+from polymarkt_monitoring.clients.novelty_cache import NoveltyCacheStats, WalletNoveltyCache
 from polymarkt_monitoring.retry import with_retries
 
 
@@ -14,19 +20,39 @@ class ExplorerClient:
         api_base: str,
         api_key: str = "",
         request_timeout: int = 10,
+        novelty_cache: WalletNoveltyCache | None = None,
+        breaker: CircuitBreaker | None = None,
+        retry_deadline_seconds: float = 30.0,
+        capture: TrafficCapture | None = None,
         logger: logging.Logger | None = None,
     ) -> None:
         self.api_base = api_base.rstrip("/")
         self.api_key = api_key.strip()
+        self.capture = capture
         self.request_timeout = request_timeout
+        self.novelty_cache = novelty_cache
         self.logger = logger or logging.getLogger(__name__)
+        self.breaker = breaker or CircuitBreaker("explorer", logger=self.logger)
+        self.retry_deadline_seconds = retry_deadline_seconds
         self._session = requests.Session()
 
-    def get_transaction_count(self, wallet_address: str) -> int:
+    def cached_transaction_count(self, wallet_address: str) -> int | None:
+        """Count from the novelty cache without touching the explorer, or ``None``."""
+        if self.novelty_cache is None:
+            return None
+        return self.novelty_cache.peek(wallet_address.strip().lower())
+
+    def get_transaction_count(self, wallet_address: str, *, attempts: int = 3) -> int:
+        """Nonce of ``wallet_address``; ``attempts=1`` leaves retrying, and its quota, to the caller."""
         address = wallet_address.strip().lower()
         if not address.startswith("0x"):
             raise ValueError(f"Invalid wallet_address: {wallet_address}")
 
+        if self.novelty_cache is not None:
+            cached = self.novelty_cache.get(address)
+            if cached is not None:
+                return cached
+
         def _request() -> int:
             params = {
                 "module": "proxy",
@@ -34,16 +60,35 @@ class ExplorerClient:
                 "address": address,
                 "tag": "latest",
             }
-            if self.api_key:
-                params["apikey"] = self.api_key
 
-            response = self._session.get(self.api_base, params=params, timeout=self.request_timeout)
-            response.raise_for_status()
-            payload = response.json()
+            with metrics.track_dependency("explorer"):
+                payload = self._get(params)
+                result = payload.get("result")
+                if not isinstance(result, str):
+                    raise ValueError(f"Unexpected explorer payload: {payload}")
+                return int(result, 16)
+
+        tx_count = self.breaker.call(
+            lambda: with_retries(
+                _request, attempts=attempts, deadline_seconds=self.retry_deadline_seconds, logger=self.logger
+            )
+        )
+        if self.novelty_cache is not None:
+            self.novelty_cache.put(address, tx_count)
+        return tx_count
 
-            result = payload.get("result")
-            if not isinstance(result, str):
-                raise ValueError(f"Unexpected explorer payload: {payload}")
-            return int(result, 16)
+    def _get(self, params: dict[str, str]) -> Any:
+        # The capture is keyed without the API key, so it never lands on disk.
+        if self.capture is not None and self.capture.replaying:
+            return self.capture.replay("explorer", params["action"], params).body
+        started = time.monotonic()
+        query = {**params, "apikey": self.api_key} if self.api_key else params
+        response = self._session.get(self.api_base, params=query, timeout=self.request_timeout)
+        response.raise_for_status()
+        payload = response.json()
+        if self.capture is not None:
+            self.capture.record("explorer", params["action"], params, payload, latency=time.monotonic() - started)
+        return payload
 
-        return with_retries(_request, attempts=3, logger=self.logger)
+    def cache_stats(self) -> NoveltyCacheStats | None:
+        return self.novelty_cache.stats() if self.novelty_cache is not None else None
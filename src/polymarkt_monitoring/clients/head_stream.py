@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from typing import Any
+
+import aiohttp
+
+from polymarkt_monitoring.clients import json_codec
+from polymarkt_monitoring.clients.rpc import (
+    DEFAULT_LOG_TOPIC_CHUNK_SIZE,
+    TRANSFER_EVENT_TOPIC,
+    _parse_transfer_logs,
+    _recipient_topic_chunks,
+    _to_int,
+)
+
+
+class HeadStream:
+    """``eth_subscribe`` client for ``newHeads`` and filtered ERC-20 ``Transfer`` logs.
+
+    Heads wake the monitor as soon as a block arrives instead of after a poll interval.
+    Logs are buffered per block from the first head seen after (re)subscribing, so a
+    confirmed range inside that window can be served without ``eth_getLogs``. A dropped
+    connection is retried with backoff; meanwhile ``fresh_head`` returns ``None`` and the
+    monitor falls back to polling, which also fills any gap from its checkpoint.
+    """
+
+    def __init__(
+        self,
+        *,
+        ws_url: str,
+        token_addresses: Iterable[str] = (),
+        target_addresses: Iterable[str] = (),
+        reconnect_delay_seconds: float = 1.0,
+        max_reconnect_delay_seconds: float = 30.0,
+        stale_after_seconds: float = 60.0,
+        max_buffered_blocks: int = 10_000,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.ws_url = ws_url
+        self.token_addresses = sorted({address.lower() for address in token_addresses})
+        self.target_addresses = sorted({address.lower() for address in target_addresses})
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+        self.max_reconnect_delay_seconds = max_reconnect_delay_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self.max_buffered_blocks = max_buffered_blocks
+        self.logger = logger or logging.getLogger(__name__)
+        self.latest_head: int | None = None
+        self.connected = False
+        self.connections = 0
+        self._head_seen_at = 0.0
+        self._head_changed = asyncio.Event()
+        # First block whose logs are guaranteed to be in the buffer; None until a head arrives.
+        self._logs_from: int | None = None
+        self._logs: dict[int, dict[tuple[str, str], dict[str, Any]]] = {}
+        self._subscribes_logs = bool(self.token_addresses and self.target_addresses)
+        self._kinds: dict[str, str] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> HeadStream:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._session = aiohttp.ClientSession()
+            self._task = asyncio.create_task(self._run(), name="head-stream")
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self.connected = False
+
+    def fresh_head(self) -> int | None:
+        """Latest streamed head, or ``None`` while disconnected or silent for too long."""
+        if not self.connected or self.latest_head is None:
+            return None
+        if time.monotonic() - self._head_seen_at > self.stale_after_seconds:
+            return None
+        return self.latest_head
+
+    async def wait_for_head(self, min_block: int, timeout: float) -> int | None:
+        """Wait up to ``timeout`` seconds for a head at or above ``min_block``."""
+        deadline = time.monotonic() + timeout
+        while True:
+            head = self.fresh_head()
+            if head is not None and head >= min_block:
+                return head
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            changed = self._head_changed
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return None
+
+    def transfers(self, from_block: int, to_block: int) -> list[dict[str, Any]] | None:
+        """Buffered transfers for the range, or ``None`` when the stream does not cover all of it."""
+        if not self._subscribes_logs or not self.connected or self._logs_from is None:
+            return None
+        # A block's logs may trail its own head notification, so only serve blocks below the head.
+        if from_block < self._logs_from or self.latest_head is None or to_block >= self.latest_head:
+            return None
+        logs = [log for block in range(from_block, to_block + 1) for log in self._logs.get(block, {}).values()]
+        for block in [block for block in self._logs if block <= to_block]:
+            del self._logs[block]
+        return _parse_transfer_logs(logs)
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay_seconds
+        while True:
+            try:
+                async with self._session.ws_connect(self.ws_url, heartbeat=30) as ws:
+                    await self._subscribe(ws)
+                    self.connected = True
+                    self.connections += 1
+                    delay = self.reconnect_delay_seconds
+                    self.logger.info("Head stream connected", extra={"connections": self.connections})
+                    await self._consume(ws)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger.warning("Head stream failed", exc_info=True)
+            self._reset()
+            self.logger.info("Head stream reconnecting", extra={"delay_seconds": delay})
+            await asyncio.sleep(delay)
+            delay = min(self.max_reconnect_delay_seconds, delay * 2)
+
+    def _reset(self) -> None:
+        self.connected = False
+        self._logs_from = None
+        self._logs.clear()
+        self._notify()
+
+    async def _subscribe(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        requests: list[list[Any]] = [["newHeads"]]
+        if self._subscribes_logs:
+            for recipient_topics in _recipient_topic_chunks(self.target_addresses, DEFAULT_LOG_TOPIC_CHUNK_SIZE):
+                requests.append(
+                    ["logs", {"address": self.token_addresses, "topics": [TRANSFER_EVENT_TOPIC, None, recipient_topics]}]
+                )
+        for request_id, params in enumerate(requests, start=1):
+            request = {"jsonrpc": "2.0", "id": request_id, "method": "eth_subscribe", "params": params}
+            await ws.send_str(json_codec.dumps(request).decode())
+
+        self._kinds = {}
+        while len(self._kinds) < len(requests):
+            message = json_codec.loads(await ws.receive_str())
+            if "error" in message:
+                raise RuntimeError(f"eth_subscribe rejected: {message['error']}")
+            if "id" in message:
+                self._kinds[message["result"]] = "heads" if message["id"] == 1 else "logs"
+
+    async def _consume(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        async for message in ws:
+            if message.type is not aiohttp.WSMsgType.TEXT:
+                if message.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSE):
+                    break
+                continue
+            payload = json_codec.loads(message.data)
+            params = payload.get("params") or {}
+            kind = self._kinds.get(params.get("subscription"))
+            if kind == "heads":
+                self._on_head(_to_int(params["result"]["number"]))
+            elif kind == "logs":
+                self._on_log(params["result"])
+
+    def _on_head(self, block_number: int) -> None:
+        if self._logs_from is None:
+            # Logs for this head may have been emitted before our subscription; only trust later blocks.
+            self._logs_from = block_number + 1
+        self.latest_head = max(self.latest_head or 0, block_number)
+        self._head_seen_at = time.monotonic()
+        if len(self._logs) > self.max_buffered_blocks:
+            # Nobody is consuming the buffer; stop claiming coverage rather than grow without bound.
+            self._logs_from = self.latest_head + 1
+            self._logs.clear()
+        self._notify()
+
+    def _on_log(self, log: dict[str, Any]) -> None:
+        block_number = _to_int(log.get("blockNumber"))
+        key = (str(log.get("transactionHash")), str(log.get("logIndex")))
+        if log.get("removed"):
+            self._logs.get(block_number, {}).pop(key, None)
+            return
+        self._logs.setdefault(block_number, {})[key] = log
+
+    def _notify(self) -> None:
+        self._head_changed.set()
+        self._head_changed = asyncio.Event()
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+# Phrases of providers' span and result limits. A bare "block range" would also match a lagging
+# node's "block range extends beyond current head", which failover, not a smaller window, fixes.
+RANGE_ERROR_MARKERS = (
+    "returned more than",
+    "maximum block range",
+    "block range limit",
+    "block range is too wide",
+    "max range of blocks",
+    "range too large",
+    "range is too large",
+    "too many results",
+    "response size exceeded",
+    "query timeout",
+)
+# Throttling is retried and failed over like any other error, never answered by splitting the range.
+RATE_LIMIT_MARKERS = ("rate limit", "too many requests")
+_RATE_LIMIT_STATUS_PATTERN = re.compile(r"\b429\b")
+_RESULT_LIMIT_PATTERN = re.compile(r"more than (\d+) results")
+DEFAULT_MAX_RESULTS = 10_000
+
+
+def is_range_error(exc: BaseException) -> bool:
+    message = str(exc).lower()
+    if getattr(exc, "status", None) == 429 or _RATE_LIMIT_STATUS_PATTERN.search(message):
+        return False
+    if any(marker in message for marker in RATE_LIMIT_MARKERS):
+        return False
+    return any(marker in message for marker in RANGE_ERROR_MARKERS)
+
+
+@dataclass(slots=True)
+class RangeBudget:
+    window: int
+    max_results: int = DEFAULT_MAX_RESULTS
+    range_ceiling: int | None = None
+    largest_accepted: int = 0
+    rejections: int = 0
+
+
+class LogRangePlanner:
+    """Splits ``eth_getLogs`` ranges into windows each provider accepts.
+
+    A rejected range is bisected until the halves succeed, and the provider's window shrinks
+    to the largest span that worked. Windows grow again when results come back sparse:
+    doubling while no block-range limit is known, then binary-searching towards it.
+
+    ``provider`` names the endpoint expected to serve the next window and sizes it.
+    ``fetch_window`` returns the endpoint that actually served it along with the logs, and a
+    rejection carrying an ``rpc_url`` is charged to that endpoint, so a failover or hedge
+    never teaches one endpoint's limit to another.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_window: int = 2_000,
+        max_window: int = 100_000,
+        sparse_fraction: float = 0.25,
+        dense_fraction: float = 0.75,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if initial_window < 1 or max_window < initial_window:
+            raise ValueError("windows must satisfy 1 <= initial_window <= max_window")
+        if not 0 < sparse_fraction < dense_fraction <= 1:
+            raise ValueError("fractions must satisfy 0 < sparse_fraction < dense_fraction <= 1")
+
+        self.initial_window = initial_window
+        self.max_window = max_window
+        self.sparse_fraction = sparse_fraction
+        self.dense_fraction = dense_fraction
+        self.logger = logger or logging.getLogger(__name__)
+        self.budgets: dict[str, RangeBudget] = {}
+
+    def budget(self, provider: str) -> RangeBudget:
+        budget = self.budgets.get(provider)
+        if budget is None:
+            budget = RangeBudget(window=self.initial_window)
+            self.budgets[provider] = budget
+        return budget
+
+    async def fetch(
+        self,
+        fetch_window: Callable[[int, int], Awaitable[tuple[str, list[Any]]]],
+        from_block: int,
+        to_block: int,
+        *,
+        provider: Callable[[], str],
+    ) -> list[Any]:
+        results: list[Any] = []
+        start = from_block
+        while start <= to_block:
+            end = min(to_block, start + self.budget(provider()).window - 1)
+            results.extend(await self._fetch_bisecting(fetch_window, start, end, provider))
+            start = end + 1
+        return results
+
+    async def _fetch_bisecting(
+        self,
+        fetch_window: Callable[[int, int], Awaitable[tuple[str, list[Any]]]],
+        start: int,
+        end: int,
+        provider: Callable[[], str],
+    ) -> list[Any]:
+        try:
+            served_by, logs = await fetch_window(start, end)
+        except Exception as exc:
+            if start == end or not is_range_error(exc):
+                raise
+            self._record_rejection(getattr(exc, "rpc_url", None) or provider(), end - start + 1, exc)
+            middle = (start + end) // 2
+            left = await self._fetch_bisecting(fetch_window, start, middle, provider)
+            right = await self._fetch_bisecting(fetch_window, middle + 1, end, provider)
+            return left + right
+
+        self._record_success(served_by, end - start + 1, len(logs))
+        return logs
+
+    def _record_rejection(self, provider: str, span: int, exc: BaseException) -> None:
+        budget = self.budget(provider)
+        budget.rejections += 1
+
+        message = str(exc).lower()
+        limit = _RESULT_LIMIT_PATTERN.search(message)
+        if limit:
+            budget.max_results = int(limit.group(1))
+            budget.window = max(1, min(budget.window, span // 2))
+        else:
+            # Block-range limits do not depend on log density, so never grow back past them.
+            budget.range_ceiling = span - 1 if budget.range_ceiling is None else min(budget.range_ceiling, span - 1)
+            budget.largest_accepted = min(budget.largest_accepted, budget.range_ceiling)
+            budget.window = max(1, min(budget.window, span // 2), budget.largest_accepted)
+
+        self.logger.info(
+            "Shrunk eth_getLogs window after provider rejection",
+            extra={"rpc_url": provider, "window": budget.window, "rejected_span": span},
+        )
+
+    def _record_success(self, provider: str, span: int, result_count: int) -> None:
+        budget = self.budget(provider)
+        budget.largest_accepted = max(budget.largest_accepted, span)
+        if result_count >= budget.max_results * self.dense_fraction:
+            budget.window = max(1, min(budget.window, span // 2))
+            return
+        if span < budget.window or result_count > budget.max_results * self.sparse_fraction:
+            return
+
+        if budget.range_ceiling is None:
+            budget.window = min(self.max_window, budget.window * 2)
+        else:
+            ceiling = min(self.max_window, budget.range_ceiling)
+            budget.window = max(budget.window, (budget.window + ceiling + 1) // 2)
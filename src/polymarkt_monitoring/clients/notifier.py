@@ -1,11 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
 
 import requests
 
+from polymarkt_monitoring import metrics
+from polymarkt_monitoring.breaker import CircuitBreaker, CircuitOpenError
+from polymarkt_monitoring.ratelimit import TokenBucket, acquire_all
 from polymarkt_monitoring.retry import with_retries
 
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - import depends on runtime environment
+    aiohttp = None
+
+TELEGRAM_MAX_MESSAGE_CHARS = 4096
+COALESCE_SEPARATOR = "\n\n"
+
 
 class TelegramNotifier:
     def __init__(
@@ -14,12 +31,14 @@ class TelegramNotifier:
         bot_token: str,
         chat_id: str,
         request_timeout: int = 10,
+        breaker: CircuitBreaker | None = None,
         logger: logging.Logger | None = None,
     ) -> None:
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.request_timeout = request_timeout
         self.logger = logger or logging.getLogger(__name__)
+        self.breaker = breaker or CircuitBreaker("telegram", logger=self.logger)
         self._session = requests.Session()
 
     def send_message(self, text: str) -> None:
@@ -43,4 +62,269 @@ class TelegramNotifier:
             if not payload.get("ok"):
                 raise ValueError(f"Telegram send failed: {payload}")
 
-        with_retries(_request, attempts=3, logger=self.logger)
+        self.breaker.call(lambda: with_retries(_request, attempts=3, logger=self.logger))
+
+
+class TelegramSendError(RuntimeError):
+    pass
+
+
+class TelegramUnavailableError(TelegramSendError):
+    """Telegram could not be reached or kept failing; counts against the circuit breaker."""
+
+
+class AsyncTelegramNotifier:
+    """Queued Telegram sender that respects per-chat rate limits.
+
+    ``send_message`` enqueues the text and resolves once Telegram has accepted it. One sender
+    task drains the queue through token buckets (``messages_per_second`` and
+    ``messages_per_minute``), waits out the ``retry_after`` of a 429 (up to
+    ``max_rate_limit_wait_seconds`` per message), and packs every alert that queued up
+    meanwhile into one message of at most ``max_message_chars`` characters. If Telegram
+    rejects a packed message, its alerts are resent one by one. While the circuit breaker is
+    open, queued alerts fail at once instead of waiting.
+    """
+
+    def __init__(
+        self,
+        *,
+        bot_token: str,
+        chat_id: str,
+        api_base: str = "https://api.telegram.org",
+        messages_per_second: float = 1.0,
+        messages_per_minute: int = 20,
+        max_message_chars: int = TELEGRAM_MAX_MESSAGE_CHARS,
+        max_attempts: int = 5,
+        retry_delay_seconds: float = 1.0,
+        max_rate_limit_wait_seconds: float = 300.0,
+        request_timeout: int = 10,
+        breaker: CircuitBreaker | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required. Install dependencies with `pip install -e .`.")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+
+        self.bot_token = bot_token
+        self.chat_id = chat_id
+        self.api_base = api_base.rstrip("/")
+        self.max_message_chars = max_message_chars
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.max_rate_limit_wait_seconds = max_rate_limit_wait_seconds
+        self.request_timeout = request_timeout
+        self.logger = logger or logging.getLogger(__name__)
+        self.breaker = breaker or CircuitBreaker("telegram", logger=self.logger)
+        self.messages_sent = 0
+        self.alerts_sent = 0
+        self.rate_limited = 0
+        self._buckets = [
+            TokenBucket(rate=messages_per_second, capacity=1),
+            TokenBucket(rate=messages_per_minute / 60, capacity=messages_per_minute),
+        ]
+        self._queue: deque[tuple[str, asyncio.Future[None]]] = deque()
+        self._queued = asyncio.Event()
+        self._session: aiohttp.ClientSession | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> AsyncTelegramNotifier:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    @property
+    def queue_size(self) -> int:
+        return len(self._queue)
+
+    async def send_message(self, text: str) -> None:
+        if not text.strip():
+            raise ValueError("message text must not be empty")
+        if len(text) > self.max_message_chars:
+            text = text[: self.max_message_chars - 1] + "…"
+        # Enqueue before the first await so callers' submission order is the delivery order.
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queue.append((text, future))
+        self._queued.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="telegram-sender")
+        await future
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._fail(list(self._queue), TelegramSendError("notifier closed before delivery"))
+        self._queue.clear()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _run(self) -> None:
+        while True:
+            if not self._queue:
+                self._queued.clear()
+                await self._queued.wait()
+                continue
+            if not self.breaker.allow_request():
+                self._fail(list(self._queue), CircuitOpenError("telegram", self.breaker.retry_in_seconds()))
+                self._queue.clear()
+                continue
+            await self._acquire_tokens()
+            # Everything that queued while we waited for a token goes out together.
+            batch = self._take_batch()
+            error = await self._send(batch)
+            if error is None:
+                continue
+            if len(batch) > 1 and not isinstance(error, TelegramUnavailableError):
+                # Telegram rejected the coalesced text; resend alone so one bad alert fails only itself.
+                self.logger.warning(
+                    "Resending rejected Telegram batch one alert at a time", extra={"alert_count": len(batch)}
+                )
+                await self._send_each(batch)
+                continue
+            self._fail(batch, error)
+
+    async def _acquire_tokens(self) -> None:
+        try:
+            await acquire_all(self._buckets)
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+
+    async def _send(self, batch: list[tuple[str, asyncio.Future[None]]]) -> Exception | None:
+        """Deliver ``batch`` as one message and resolve its callers; returns the error if that failed."""
+        try:
+            await self._deliver(COALESCE_SEPARATOR.join(text for text, _ in batch))
+        except asyncio.CancelledError:
+            self.breaker.release()
+            self._queue.extendleft(reversed(batch))
+            raise
+        except Exception as exc:
+            if isinstance(exc, TelegramUnavailableError):
+                self.breaker.record_failure()
+            else:
+                # Telegram answered; the message itself was rejected.
+                self.breaker.record_success()
+            self.logger.error("Telegram delivery failed", extra={"alert_count": len(batch)}, exc_info=True)
+            return exc
+        self.breaker.record_success()
+        self.messages_sent += 1
+        self.alerts_sent += len(batch)
+        for _, future in batch:
+            if not future.done():
+                future.set_result(None)
+        return None
+
+    async def _send_each(self, batch: list[tuple[str, asyncio.Future[None]]]) -> None:
+        remaining = deque(batch)
+        while remaining:
+            if not self.breaker.allow_request():
+                self._fail(list(remaining), CircuitOpenError("telegram", self.breaker.retry_in_seconds()))
+                return
+            try:
+                await self._acquire_tokens()
+            except asyncio.CancelledError:
+                self._queue.extendleft(reversed(remaining))
+                raise
+            item = remaining.popleft()
+            error = await self._send([item])
+            if error is not None:
+                self._fail([item], error)
+
+    @staticmethod
+    def _fail(batch: list[tuple[str, asyncio.Future[None]]], error: Exception) -> None:
+        # The traceback references the sender's own frame; a caller clearing it would finalize the sender.
+        error = error.with_traceback(None)
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def _take_batch(self) -> list[tuple[str, asyncio.Future[None]]]:
+        batch = [self._queue.popleft()]
+        length = len(batch[0][0])
+        while self._queue:
+            text = self._queue[0][0]
+            length += len(COALESCE_SEPARATOR) + len(text)
+            if length > self.max_message_chars:
+                break
+            batch.append(self._queue.popleft())
+        return batch
+
+    async def _deliver(self, text: str) -> None:
+        delay = self.retry_delay_seconds
+        attempt = 0
+        rate_limit_waited = 0.0
+        while True:
+            attempt += 1
+            retry_after = await self._post(text)
+            if retry_after is None:
+                return
+            if retry_after > 0:
+                # Rate limited: Telegram says exactly how long to wait; that does not use up an attempt,
+                # but the total wait is capped so a chat that stays throttled cannot stall the queue.
+                self.rate_limited += 1
+                attempt -= 1
+                if rate_limit_waited + retry_after > self.max_rate_limit_wait_seconds:
+                    self.logger.warning(
+                        "Dropping Telegram message after rate limiting",
+                        extra={"waited_seconds": rate_limit_waited, "retry_after_seconds": retry_after},
+                    )
+                    raise TelegramUnavailableError(f"Telegram still rate limited after {rate_limit_waited:.0f}s")
+                rate_limit_waited += retry_after
+                self.logger.warning("Telegram rate limited", extra={"retry_after_seconds": retry_after})
+                await asyncio.sleep(retry_after)
+                continue
+            if attempt >= self.max_attempts:
+                raise TelegramUnavailableError(f"Telegram send failed after {attempt} attempts")
+            self.logger.warning("retrying Telegram send", extra={"attempt": attempt})
+            await asyncio.sleep(delay)
+            delay *= 2
+
+    async def _post(self, text: str) -> float | None:
+        """Send once; ``None`` on success, ``retry_after`` seconds on 429, 0 for a retryable failure."""
+        endpoint = f"{self.api_base}/bot{self.bot_token}/sendMessage"
+        payload = {"chat_id": self.chat_id, "text": text, "disable_web_page_preview": True}
+        started = time.monotonic()
+        try:
+            async with self._get_session().post(endpoint, json=payload) as response:
+                body = await response.json(content_type=None)
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            metrics.record_dependency("telegram", time.monotonic() - started, "error")
+            self.logger.warning("Telegram request failed", exc_info=True)
+            return 0.0
+        outcome = "ok" if status < 400 else "rate_limited" if status == 429 else "error"
+        metrics.record_dependency("telegram", time.monotonic() - started, outcome)
+        if status == 429:
+            return float((body.get("parameters") or {}).get("retry_after", 1))
+        if status >= 500:
+            return 0.0
+        if not body.get("ok"):
+            raise TelegramSendError(f"Telegram send failed: {body}")
+        return None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.request_timeout))
+        return self._session
+
+
+class FileNotifier:
+    """Appends alerts to a local file instead of sending them, e.g. for backfill audits."""
+
+    def __init__(self, *, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def send_message(self, text: str) -> None:
+        if not text.strip():
+            raise ValueError("message text must not be empty")
+        with self._lock, self.path.open("a") as handle:
+            handle.write(text + "\n\n")
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class NoveltyCacheStats:
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    permanent_entries: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class WalletNoveltyCache:
+    """LRU cache of wallet transaction counts.
+
+    Counts only grow, so a wallet at or above ``novelty_threshold`` can never become new again
+    and is cached without expiry. Counts below the threshold expire after ``new_wallet_ttl_seconds``.
+    Safe to share between the worker threads that run explorer lookups.
+    """
+
+    def __init__(
+        self,
+        *,
+        novelty_threshold: int,
+        max_entries: int = 10_000,
+        new_wallet_ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if new_wallet_ttl_seconds < 0:
+            raise ValueError("new_wallet_ttl_seconds must be >= 0")
+
+        self.novelty_threshold = novelty_threshold
+        self.max_entries = max_entries
+        self.new_wallet_ttl_seconds = new_wallet_ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        # wallet -> (tx_count, expires_at); expires_at is None for known-old wallets.
+        self._entries: OrderedDict[str, tuple[int, float | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, wallet_address: str) -> int | None:
+        with self._lock:
+            return self._get(wallet_address)
+
+    def peek(self, wallet_address: str) -> int | None:
+        """Like ``get``, but a miss is left for the lookup that follows to count."""
+        with self._lock:
+            return self._get(wallet_address, count_miss=False)
+
+    def put(self, wallet_address: str, tx_count: int) -> None:
+        with self._lock:
+            self._put(wallet_address, tx_count)
+
+    def _get(self, wallet_address: str, *, count_miss: bool = True) -> int | None:
+        entry = self._entries.get(wallet_address)
+        if entry is not None:
+            tx_count, expires_at = entry
+            if expires_at is None or expires_at > self._clock():
+                self._entries.move_to_end(wallet_address)
+                self.hits += 1
+                return tx_count
+            del self._entries[wallet_address]
+
+        if count_miss:
+            self.misses += 1
+        return None
+
+    def _put(self, wallet_address: str, tx_count: int) -> None:
+        previous = self._entries.get(wallet_address)
+        if previous is not None and previous[1] is None and previous[0] > tx_count:
+            # A lagging explorer replica must not make a known-old wallet look new.
+            return
+
+        expires_at = None if tx_count >= self.novelty_threshold else self._clock() + self.new_wallet_ttl_seconds
+        self._entries[wallet_address] = (tx_count, expires_at)
+        self._entries.move_to_end(wallet_address)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> NoveltyCacheStats:
+        with self._lock:
+            return self._stats()
+
+    def _stats(self) -> NoveltyCacheStats:
+        return NoveltyCacheStats(
+            size=len(self._entries),
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            permanent_entries=sum(1 for _, expires_at in self._entries.values() if expires_at is None),
+        )
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable
+
+from polymarkt_monitoring.clients.pricing import CoinGeckoPricingClient
+
+
+class StalePriceError(RuntimeError):
+    """Raised when a price is older than the feed's staleness bound."""
+
+
+class PriceFeed:
+    """Keeps USD prices for a fixed set of CoinGecko ids fresh from a background task.
+
+    All ids are refreshed together with one batched request every ``refresh_interval_seconds``.
+    ``get_usd_price`` only reads memory: it serves the last value while a refresh is in flight
+    or failing, until that value is older than ``max_staleness_seconds``.
+    """
+
+    def __init__(
+        self,
+        *,
+        pricing_client: CoinGeckoPricingClient,
+        asset_ids: Iterable[str],
+        refresh_interval_seconds: float = 20.0,
+        max_staleness_seconds: float = 120.0,
+        clock: Callable[[], float] = time.monotonic,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if refresh_interval_seconds <= 0:
+            raise ValueError("refresh_interval_seconds must be > 0")
+        if max_staleness_seconds < refresh_interval_seconds:
+            raise ValueError("max_staleness_seconds must be >= refresh_interval_seconds")
+
+        self.pricing_client = pricing_client
+        self.asset_ids = sorted({asset_id.strip().lower() for asset_id in asset_ids if asset_id.strip()})
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.max_staleness_seconds = max_staleness_seconds
+        self.refresh_failures = 0
+        self.hits = 0
+        self.misses = 0
+        self.logger = logger or logging.getLogger(__name__)
+        self._clock = clock
+        # asset -> (usd price, monotonic time it was fetched)
+        self._prices: dict[str, tuple[float, float]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> PriceFeed:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Load every price once, then keep refreshing in the background."""
+        await self.refresh()
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop(), name="price-feed")
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def refresh(self) -> None:
+        if not self.asset_ids:
+            return
+        prices = await asyncio.to_thread(self.pricing_client.get_usd_prices, self.asset_ids)
+        fetched_at = self._clock()
+        for asset, price in prices.items():
+            self._prices[asset] = (price, fetched_at)
+
+    def get_usd_price(self, asset_id: str) -> float:
+        asset = asset_id.strip().lower()
+        if not asset:
+            raise ValueError("asset_id is required")
+
+        entry = self._prices.get(asset)
+        if entry is None:
+            self.misses += 1
+            raise StalePriceError(f"No price loaded for {asset}; is it in the feed's asset ids?")
+        price, fetched_at = entry
+        age = self._clock() - fetched_at
+        if age > self.max_staleness_seconds:
+            self.misses += 1
+            raise StalePriceError(f"Price for {asset} is {age:.0f}s old (bound {self.max_staleness_seconds:.0f}s)")
+        self.hits += 1
+        return price
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval_seconds)
+            try:
+                await self.refresh()
+            except Exception:
+                self.refresh_failures += 1
+                self.logger.warning(
+                    "Background price refresh failed; serving cached prices",
+                    extra={"asset_ids": self.asset_ids, "failures": self.refresh_failures},
+                    exc_info=True,
+                )
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from polymarkt_monitoring.clients.price_feed import StalePriceError
+from polymarkt_monitoring.clients.pricing import CoinGeckoPricingClient
+
+CACHE_VERSION = 1
+# CoinGecko serves hourly points for spans up to 90 days; 30-day chunks stay well inside that.
+DEFAULT_CHUNK_SECONDS = 30 * 86_400
+
+
+class _AssetHistory:
+    __slots__ = ("covered_from", "covered_to", "timestamps", "prices")
+
+    def __init__(self, covered_from: int, covered_to: int, points: Iterable[tuple[int, float]]) -> None:
+        self.covered_from = covered_from
+        self.covered_to = covered_to
+        series = dict(points)
+        self.timestamps = sorted(series)
+        self.prices = [series[timestamp] for timestamp in self.timestamps]
+
+    def merge(self, covered_from: int, covered_to: int, points: Iterable[tuple[int, float]]) -> None:
+        series = dict(zip(self.timestamps, self.prices))
+        series.update(points)
+        self.timestamps = sorted(series)
+        self.prices = [series[timestamp] for timestamp in self.timestamps]
+        self.covered_from = min(self.covered_from, covered_from)
+        self.covered_to = max(self.covered_to, covered_to)
+
+
+class HistoricalPriceFeed:
+    """USD prices at past timestamps for backfills, from bulk ``market_chart/range`` data.
+
+    ``prepare`` extends each asset's contiguous covered window with chunked range requests
+    and persists the series to ``cache_path``; ``get_usd_price_at`` then answers from memory
+    by binary search, using the point nearest to the requested timestamp.
+    """
+
+    def __init__(
+        self,
+        *,
+        pricing_client: CoinGeckoPricingClient,
+        asset_ids: Iterable[str],
+        cache_path: str | Path,
+        chunk_seconds: int = DEFAULT_CHUNK_SECONDS,
+        max_gap_seconds: int = 2 * 3_600,
+        clock: Callable[[], float] = time.time,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if chunk_seconds < 1:
+            raise ValueError("chunk_seconds must be >= 1")
+
+        self.pricing_client = pricing_client
+        self.asset_ids = sorted({asset_id.strip().lower() for asset_id in asset_ids if asset_id.strip()})
+        self.cache_path = Path(cache_path)
+        self.chunk_seconds = chunk_seconds
+        self.max_gap_seconds = max_gap_seconds
+        self.range_requests = 0
+        # Per asset and prepared range: a hit needed no request, a miss fetched at least one chunk.
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self.logger = logger or logging.getLogger(__name__)
+        self._history: dict[str, _AssetHistory] = {}
+        self._load()
+
+    async def __aenter__(self) -> HistoricalPriceFeed:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def prepare(self, from_timestamp: int, to_timestamp: int) -> None:
+        """Make sure every asset is covered from ``from_timestamp`` to ``to_timestamp``."""
+        changed = False
+        for asset in self.asset_ids:
+            spans = self._missing_spans(asset, from_timestamp, to_timestamp)
+            if spans:
+                self.misses += 1
+            else:
+                self.hits += 1
+            for start, end in spans:
+                chunk_start = start
+                while chunk_start <= end:
+                    chunk_end = min(end, chunk_start + self.chunk_seconds - 1)
+                    if chunk_end == end:
+                        # The last chunk runs to a whole chunk (never past now) so consecutive ranges reuse it.
+                        chunk_end = max(end, min(chunk_start + self.chunk_seconds - 1, int(self._clock())))
+                    # Pad by the lookup tolerance so edge timestamps still find a neighbouring point.
+                    points = await asyncio.to_thread(
+                        self.pricing_client.get_usd_price_range,
+                        asset,
+                        chunk_start - self.max_gap_seconds,
+                        chunk_end + self.max_gap_seconds,
+                    )
+                    self.range_requests += 1
+                    self._merge(asset, chunk_start, chunk_end, points)
+                    changed = True
+                    chunk_start = chunk_end + 1
+        if changed:
+            await asyncio.to_thread(self._save)
+
+    def get_usd_price_at(self, asset_id: str, timestamp: int) -> float:
+        asset = asset_id.strip().lower()
+        history = self._history.get(asset)
+        if history is None or not history.timestamps:
+            raise StalePriceError(f"No price history loaded for {asset}")
+
+        index = bisect.bisect_left(history.timestamps, timestamp)
+        neighbours = [i for i in (index - 1, index) if 0 <= i < len(history.timestamps)]
+        nearest = min(neighbours, key=lambda i: abs(history.timestamps[i] - timestamp))
+        if abs(history.timestamps[nearest] - timestamp) > self.max_gap_seconds:
+            raise StalePriceError(f"No price for {asset} within {self.max_gap_seconds}s of {timestamp}")
+        return history.prices[nearest]
+
+    def _missing_spans(self, asset: str, from_timestamp: int, to_timestamp: int) -> list[tuple[int, int]]:
+        history = self._history.get(asset)
+        if history is None:
+            return [(from_timestamp, to_timestamp)]
+        # Coverage stays contiguous, so any gap between it and the request is filled too.
+        spans = []
+        if from_timestamp < history.covered_from:
+            spans.append((from_timestamp, history.covered_from - 1))
+        # A live monitor asks for a little past the covered end every cycle; the last point answers
+        # those lookups while it is within tolerance, so the series is only extended once it is not.
+        last_point = history.timestamps[-1] if history.timestamps else None
+        last_point_serves_tail = last_point is not None and to_timestamp - last_point <= self.max_gap_seconds
+        if to_timestamp > history.covered_to and not last_point_serves_tail:
+            spans.append((history.covered_to + 1, to_timestamp))
+        return spans
+
+    def _merge(self, asset: str, covered_from: int, covered_to: int, points: list[tuple[int, float]]) -> None:
+        history = self._history.get(asset)
+        if history is None:
+            self._history[asset] = _AssetHistory(covered_from, covered_to, points)
+        else:
+            history.merge(covered_from, covered_to, points)
+
+    def _load(self) -> None:
+        if not self.cache_path.exists():
+            return
+        payload = json.loads(self.cache_path.read_text())
+        if payload.get("version") != CACHE_VERSION:
+            self.logger.warning("Ignoring price history cache with unknown version", extra={"path": str(self.cache_path)})
+            return
+        for asset, entry in payload.get("assets", {}).items():
+            self._history[asset] = _AssetHistory(
+                entry["covered_from"], entry["covered_to"], ((int(ts), float(price)) for ts, price in entry["points"])
+            )
+
+    def _save(self) -> None:
+        payload = {
+            "version": CACHE_VERSION,
+            "assets": {
+                asset: {
+                    "covered_from": history.covered_from,
+                    "covered_to": history.covered_to,
+                    "points": [[ts, price] for ts, price in zip(history.timestamps, history.prices)],
+                }
+                for asset, history in self._history.items()
+            },
+        }
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+        temporary.write_text(json.dumps(payload, separators=(",", ":")))
+        os.replace(temporary, self.cache_path)
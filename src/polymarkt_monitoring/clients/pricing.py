@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
 
 import requests
 
+from polymarkt_monitoring import metrics
+from polymarkt_monitoring.breaker import CircuitBreaker
+from polymarkt_monitoring.capture import TrafficCapture
 from polymarkt_monitoring.retry import with_retries
 
+T = TypeVar("T")
+
 
 class CoinGeckoPricingClient:
     def __init__(
@@ -15,12 +22,18 @@ class CoinGeckoPricingClient:
         api_base: str = "https://api.coingecko.com/api/v3",
         cache_ttl_seconds: int = 30,
         request_timeout: int = 10,
+        breaker: CircuitBreaker | None = None,
+        retry_deadline_seconds: float = 30.0,
+        capture: TrafficCapture | None = None,
         logger: logging.Logger | None = None,
     ) -> None:
         self.api_base = api_base.rstrip("/")
         self.cache_ttl_seconds = cache_ttl_seconds
+        self.capture = capture
         self.request_timeout = request_timeout
         self.logger = logger or logging.getLogger(__name__)
+        self.breaker = breaker or CircuitBreaker("coingecko", logger=self.logger)
+        self.retry_deadline_seconds = retry_deadline_seconds
         self._session = requests.Session()
         self._cache: dict[str, tuple[float, float]] = {}
 
@@ -35,18 +48,73 @@ class CoinGeckoPricingClient:
             return cached[0]
 
         def _request() -> float:
-            response = self._session.get(
-                f"{self.api_base}/simple/price",
-                params={"ids": asset, "vs_currencies": "usd"},
-                timeout=self.request_timeout,
-            )
-            response.raise_for_status()
-            payload = response.json()
+            payload = self._get("/simple/price", {"ids": asset, "vs_currencies": "usd"})
             usd = payload.get(asset, {}).get("usd")
             if usd is None:
                 raise ValueError(f"CoinGecko response missing usd price for {asset}")
             return float(usd)
 
-        price = with_retries(_request, attempts=3, logger=self.logger)
+        price = self._call(_request)
         self._cache[asset] = (price, now)
         return price
+
+    def get_usd_prices(self, asset_ids: Iterable[str]) -> dict[str, float]:
+        """Fetch every asset in one ``/simple/price`` request, bypassing and then refreshing the cache."""
+        assets = sorted({asset_id.strip().lower() for asset_id in asset_ids if asset_id.strip()})
+        if not assets:
+            return {}
+
+        def _request() -> dict[str, float]:
+            payload = self._get("/simple/price", {"ids": ",".join(assets), "vs_currencies": "usd"})
+            missing = [asset for asset in assets if payload.get(asset, {}).get("usd") is None]
+            if missing:
+                raise ValueError(f"CoinGecko response missing usd price for {', '.join(missing)}")
+            return {asset: float(payload[asset]["usd"]) for asset in assets}
+
+        prices = self._call(_request)
+        now = time.time()
+        for asset, price in prices.items():
+            self._cache[asset] = (price, now)
+        return prices
+
+    def get_usd_price_range(self, asset_id: str, from_timestamp: int, to_timestamp: int) -> list[tuple[int, float]]:
+        """Return ``(unix seconds, usd)`` points from ``/coins/{id}/market_chart/range``, oldest first.
+
+        CoinGecko picks the granularity from the span: 5-minutely up to a day, hourly up to
+        90 days and daily beyond that.
+        """
+        asset = asset_id.strip().lower()
+        if not asset:
+            raise ValueError("asset_id is required")
+
+        def _request() -> list[tuple[int, float]]:
+            payload = self._get(
+                f"/coins/{asset}/market_chart/range",
+                {"vs_currency": "usd", "from": from_timestamp, "to": to_timestamp},
+            )
+            points = payload.get("prices")
+            if points is None:
+                raise ValueError(f"CoinGecko response missing price history for {asset}")
+            return sorted((int(millis) // 1000, float(price)) for millis, price in points)
+
+        return self._call(_request)
+
+    def _get(self, path: str, params: dict[str, Any]) -> Any:
+        if self.capture is not None and self.capture.replaying:
+            return self.capture.replay("coingecko", path, params).body
+        started = time.monotonic()
+        response = self._session.get(f"{self.api_base}{path}", params=params, timeout=self.request_timeout)
+        response.raise_for_status()
+        payload = response.json()
+        if self.capture is not None:
+            self.capture.record("coingecko", path, params, payload, latency=time.monotonic() - started)
+        return payload
+
+    def _call(self, request: Callable[[], T]) -> T:
+        def _attempt() -> T:
+            with metrics.track_dependency("coingecko"):
+                return request()
+
+        return self.breaker.call(
+            lambda: with_retries(_attempt, attempts=3, deadline_seconds=self.retry_deadline_seconds, logger=self.logger)
+        )
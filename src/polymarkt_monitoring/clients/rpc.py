@@ -1,8 +1,15 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Callable, Iterable
 from typing import Any
 
+import requests
+
+from polymarkt_monitoring.capture import TrafficCapture
+from polymarkt_monitoring.clients import json_codec
+from polymarkt_monitoring.clients.endpoint_pool import EndpointPool
 from polymarkt_monitoring.retry import with_retries
 
 try:
@@ -12,14 +19,41 @@ except ImportError:  # pragma: no cover - import depends on runtime environment
 
 
 TRANSFER_EVENT_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+DEFAULT_LOG_TOPIC_CHUNK_SIZE = 100
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class RpcError(RuntimeError):
+    def __init__(self, code: int, message: str, *, rpc_url: str | None = None) -> None:
+        super().__init__(f"RPC error {code}: {message}")
+        self.code = code
+        self.message = message
+        self.rpc_url = rpc_url
 
 
 class RpcClient:
+    """Blocking web3 client with one provider per endpoint, routed through an ``EndpointPool``.
+
+    Benchmark-only: the monitor and backfills run on ``AsyncRpcClient``; this client serves
+    ``benchmarks/native_transfers.py`` as the web3 baseline. It has no ``LogRangePlanner``,
+    hedging or metrics, so ``eth_getLogs`` ranges must already fit every endpoint.
+
+    Calls go to the healthiest endpoint and fail over down the ranking; no connectivity probe
+    is sent ahead of a call. Full blocks skip web3 entirely: they are posted as raw JSON-RPC
+    and only matching transactions are converted.
+    """
+
     def __init__(
         self,
         *,
         rpc_urls: list[str],
         request_timeout: int = 10,
+        log_topic_chunk_size: int = DEFAULT_LOG_TOPIC_CHUNK_SIZE,
+        max_head_lag_blocks: int = 5,
+        head_check_interval_seconds: float = 30.0,
+        breaker_failure_threshold: int = 5,
+        breaker_reset_seconds: float = 30.0,
+        capture: TrafficCapture | None = None,
         logger: logging.Logger | None = None,
     ) -> None:
         if Web3 is None:
@@ -29,16 +63,60 @@ class RpcClient:
 
         self.rpc_urls = [url.strip() for url in rpc_urls if url.strip()]
         self.request_timeout = request_timeout
+        self.capture = capture
+        self.log_topic_chunk_size = log_topic_chunk_size
         self.logger = logger or logging.getLogger(__name__)
-        self._active_index = 0
-        self._web3: Web3 | None = None
-        self._connect_any()
+        self.pool = EndpointPool(
+            self.rpc_urls,
+            max_head_lag_blocks=max_head_lag_blocks,
+            breaker_failure_threshold=breaker_failure_threshold,
+            breaker_reset_seconds=breaker_reset_seconds,
+            logger=self.logger,
+        )
+        self.head_check_interval_seconds = head_check_interval_seconds
+        self._heads_checked_at: float | None = None
+        # HTTPProvider connects lazily, so building one per endpoint costs no round-trips.
+        request_kwargs = {"timeout": self.request_timeout}
+        self._clients = {
+            url: Web3(
+                Web3.HTTPProvider(url, request_kwargs=request_kwargs)
+                if capture is None
+                else _CapturingHTTPProvider(url, capture=capture, request_kwargs=request_kwargs)
+            )
+            for url in self.rpc_urls
+        }
+        self._session = requests.Session()
 
     def latest_block_number(self) -> int:
-        return int(self._request(lambda w3: w3.eth.block_number))
+        if len(self.rpc_urls) > 1 and (
+            self._heads_checked_at is None
+            or time.monotonic() - self._heads_checked_at >= self.head_check_interval_seconds
+        ):
+            return self.check_heads()
+        return int(self._request(lambda url: self._clients[url].eth.block_number))
+
+    def check_heads(self) -> int:
+        """Query every endpoint's head, flag laggards, and return the lowest head among the rest."""
+        self._heads_checked_at = time.monotonic()
+        heads: dict[str, int | None] = {}
+        for url in self.rpc_urls:
+            try:
+                heads[url] = int(self._timed_call(url, lambda url: self._clients[url].eth.block_number))
+            except Exception:
+                self.logger.warning("RPC head check failed", extra={"rpc_url": url}, exc_info=True)
+                heads[url] = None
+        self.pool.record_heads(heads)
+        in_sync = [
+            heads[snapshot.url]
+            for snapshot in self.pool.health()
+            if not snapshot.lagging and heads[snapshot.url] is not None
+        ]
+        if not in_sync:
+            raise RuntimeError("RPC head check failed on every endpoint")
+        return min(in_sync)
 
     def get_block_timestamp(self, block_number: int) -> int:
-        block = self._request(lambda w3: w3.eth.get_block(block_number, full_transactions=False))
+        block = self._request(lambda url: self._clients[url].eth.get_block(block_number, full_transactions=False))
         return int(block["timestamp"])
 
     def get_native_transfers(self, block_number: int, target_addresses: set[str]) -> list[dict[str, Any]]:
@@ -46,111 +124,231 @@ class RpcClient:
             return []
 
         target_set = {address.lower() for address in target_addresses}
-        block = self._request(lambda w3: w3.eth.get_block(block_number, full_transactions=True))
-
-        transfers: list[dict[str, Any]] = []
-        for tx in block["transactions"]:
-            to_address = tx.get("to")
-            if not to_address:
-                continue
-
-            to_normalized = str(to_address).lower()
-            if to_normalized not in target_set:
-                continue
-
-            value_wei = int(tx.get("value", 0))
-            if value_wei <= 0:
-                continue
-
-            transfers.append(
-                {
-                    "wallet_address": str(tx.get("from", "")).lower(),
-                    "contract_address": to_normalized,
-                    "tx_hash": _hexify(tx.get("hash")),
-                    "block_number": block_number,
-                    "raw_amount": value_wei,
-                }
-            )
-
-        return transfers
+        block = self._request(lambda url: self._raw_request(url, "eth_getBlockByNumber", [hex(block_number), True]))
+        return _scan_native_transfers(block["transactions"], block_number, target_set)
 
     def get_erc20_transfers(
         self,
         *,
-        token_address: str,
+        token_addresses: Iterable[str],
         from_block: int,
         to_block: int,
         target_addresses: set[str],
     ) -> list[dict[str, Any]]:
-        if not target_addresses:
+        tokens = [Web3.to_checksum_address(address) for address in token_addresses]
+        if not tokens or not target_addresses:
             return []
 
-        token_checksum = self._request(lambda w3: w3.to_checksum_address(token_address))
-
         logs: list[Any] = []
-        for target in target_addresses:
+        for recipient_topics in _recipient_topic_chunks(target_addresses, self.log_topic_chunk_size):
             params = {
                 "fromBlock": from_block,
                 "toBlock": to_block,
-                "address": token_checksum,
-                "topics": [TRANSFER_EVENT_TOPIC, None, _address_to_topic(target)],
+                "address": tokens,
+                "topics": [TRANSFER_EVENT_TOPIC, None, recipient_topics],
             }
-            log_batch = self._request(lambda w3, p=params: w3.eth.get_logs(p))
+            log_batch = self._request(lambda url, p=params: self._clients[url].eth.get_logs(p))
             logs.extend(log_batch)
 
-        transfers: list[dict[str, Any]] = []
-        for entry in logs:
-            topics = entry.get("topics", [])
-            if len(topics) < 3:
-                continue
-
-            raw_amount = _data_to_int(entry.get("data"))
-            if raw_amount <= 0:
-                continue
-
-            transfers.append(
-                {
-                    "wallet_address": _topic_to_address(topics[1]),
-                    "contract_address": _topic_to_address(topics[2]),
-                    "tx_hash": _hexify(entry.get("transactionHash")),
-                    "block_number": int(entry.get("blockNumber")),
-                    "raw_amount": raw_amount,
-                }
-            )
+        return _parse_transfer_logs(logs)
 
-        return transfers
-
-    def _connect_any(self) -> None:
-        errors: list[str] = []
-        for offset in range(len(self.rpc_urls)):
-            index = (self._active_index + offset) % len(self.rpc_urls)
-            url = self.rpc_urls[index]
-            provider = Web3.HTTPProvider(url, request_kwargs={"timeout": self.request_timeout})
-            web3 = Web3(provider)
-            if web3.is_connected():
-                self._web3 = web3
-                self._active_index = index
-                self.logger.info("Connected to RPC", extra={"rpc_url": url})
-                return
-            errors.append(url)
-
-        raise RuntimeError(f"Failed to connect to all RPC endpoints: {errors}")
-
-    def _request(self, call: Any) -> Any:
+    def _request(self, call: Callable[[str], Any]) -> Any:
         def _run() -> Any:
-            if self._web3 is None or not self._web3.is_connected():
-                self._connect_any()
-            assert self._web3 is not None
-            try:
-                return call(self._web3)
-            except Exception:
-                self.logger.warning("RPC call failed; rotating provider", exc_info=True)
-                self._active_index = (self._active_index + 1) % len(self.rpc_urls)
-                self._connect_any()
-                raise
+            last_error: Exception | None = None
+            for url in self.pool.ranked():
+                if not self.pool.breakers[url].allow_request():
+                    continue
+                try:
+                    return self._timed_call(url, call)
+                except Exception as exc:
+                    self.logger.warning("RPC call failed; trying next provider", extra={"rpc_url": url}, exc_info=True)
+                    last_error = exc
+            if last_error is None:
+                raise self.pool.circuit_open_error()
+            raise last_error
 
         return with_retries(_run, attempts=2, logger=self.logger)
 
+    def _timed_call(self, url: str, call: Callable[[str], Any]) -> Any:
+        started = time.monotonic()
+        try:
+            result = call(url)
+        except Exception:
+            self.pool.record_failure(url)
+            raise
+        self.pool.record_success(url, time.monotonic() - started)
+        return result
+
+    def _raw_request(self, url: str, method: str, params: list[Any]) -> Any:
+        if self.capture is not None and self.capture.replaying:
+            body = self.capture.replay("rpc", method, params).body
+            _raise_for_error(body)
+            return body.get("result")
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        started = time.monotonic()
+        response = self._session.post(
+            url, data=json_codec.dumps(payload), headers=JSON_HEADERS, timeout=self.request_timeout
+        )
+        response.raise_for_status()
+        body = json_codec.loads(response.content)
+        if self.capture is not None:
+            self.capture.record("rpc", method, params, _without_id(body), latency=time.monotonic() - started)
+        _raise_for_error(body)
+        return body.get("result")
+
+
+if Web3 is not None:
+
+    class _CapturingHTTPProvider(Web3.HTTPProvider):
+        """``HTTPProvider`` that records every response to, or replays it from, a ``TrafficCapture``."""
+
+        def __init__(self, endpoint_uri: str, *, capture: TrafficCapture, **kwargs: Any) -> None:
+            super().__init__(endpoint_uri, **kwargs)
+            self.capture = capture
+
+        def make_request(self, method: str, params: Any) -> Any:
+            if self.capture.replaying:
+                # web3 requires an id on the response but does not match it against the request.
+                return {**self.capture.replay("rpc", method, params).body, "id": 1}
+            started = time.monotonic()
+            response = super().make_request(method, params)
+            self.capture.record("rpc", method, params, _without_id(response), latency=time.monotonic() - started)
+            return response
+
+
+def _extract_native_transfers(block: Any, block_number: int, target_set: set[str]) -> list[dict[str, Any]]:
+    """Web3 ``get_block`` baseline for the benchmark; the clients scan raw blocks instead."""
+    transfers: list[dict[str, Any]] = []
+    for tx in block["transactions"]:
+        to_address = tx.get("to")
+        if not to_address:
+            continue
+
+        to_normalized = str(to_address).lower()
+        if to_normalized not in target_set:
+            continue
+
+        value_wei = _to_int(tx.get("value", 0))
+        if value_wei <= 0:
+            continue
+
+        transfers.append(
+            {
+                "wallet_address": str(tx.get("from", "")).lower(),
+                "contract_address": to_normalized,
+                "tx_hash": _hexify(tx.get("hash")),
+                "block_number": block_number,
+                "raw_amount": value_wei,
+            }
+        )
+
+    return transfers
+
+
+def _scan_native_transfers(
+    transactions: list[dict[str, Any]], block_number: int, target_set: set[str]
+) -> list[dict[str, Any]]:
+    """``_extract_native_transfers`` for raw JSON-RPC blocks.
+
+    Nodes return addresses as lowercase hex, so the raw ``to`` string is tested against
+    ``target_set`` directly and nothing is built for the transactions that miss.
+    """
+    transfers: list[dict[str, Any]] = []
+    for tx in transactions:
+        to_address = tx.get("to")
+        if to_address not in target_set:
+            continue
+        value_wei = _to_int(tx.get("value"))
+        if value_wei <= 0:
+            continue
+        transfers.append(
+            {
+                "wallet_address": tx["from"],
+                "contract_address": to_address,
+                "tx_hash": tx["hash"],
+                "block_number": block_number,
+                "raw_amount": value_wei,
+            }
+        )
+    return transfers
+
+
+def _parse_transfer_logs(logs: list[Any]) -> list[dict[str, Any]]:
+    transfers: list[dict[str, Any]] = []
+    for entry in logs:
+        topics = entry.get("topics", [])
+        if len(topics) < 3:
+            continue
+
+        raw_amount = _data_to_int(entry.get("data"))
+        if raw_amount <= 0:
+            continue
+
+        transfers.append(
+            {
+                "wallet_address": _topic_to_address(topics[1]),
+                "contract_address": _topic_to_address(topics[2]),
+                "token_address": _hexify(entry.get("address")).lower(),
+                "tx_hash": _hexify(entry.get("transactionHash")),
+                "block_number": _to_int(entry.get("blockNumber")),
+                "raw_amount": raw_amount,
+            }
+        )
+
+    return transfers
+
+
+def _recipient_topic_chunks(target_addresses: Iterable[str], chunk_size: int) -> list[list[str]]:
+    """Group padded recipient topics into OR-lists for ``topics[2]`` of ``eth_getLogs``."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    topics = sorted({_address_to_topic(address) for address in target_addresses})
+    return [topics[start : start + chunk_size] for start in range(0, len(topics), chunk_size)]
+
+
+def _raise_for_error(body: dict[str, Any], rpc_url: str | None = None) -> None:
+    error = body.get("error")
+    if error:
+        raise RpcError(int(error.get("code", 0)), str(error.get("message", "")), rpc_url=rpc_url)
+
+
+def _capture_request(payload: dict[str, Any] | list[dict[str, Any]]) -> tuple[str, Any]:
+    """Capture method and params of a JSON-RPC payload; ids are left out since every run numbers them anew."""
+    if isinstance(payload, list):
+        return "batch", [[call["method"], call["params"]] for call in payload]
+    return payload["method"], payload["params"]
+
+
+def _strip_ids(payload: dict[str, Any] | list[dict[str, Any]], body: Any) -> Any:
+    """Drop response ids, ordering batch items like the request (``None`` for a missing item)."""
+    if isinstance(payload, list) and isinstance(body, list):
+        items = {item.get("id"): item for item in body if isinstance(item, dict)}
+        return [_without_id(items.get(call["id"])) for call in payload]
+    return _without_id(body)
+
+
+def _restore_ids(payload: dict[str, Any] | list[dict[str, Any]], body: Any) -> Any:
+    """Give a captured response the ids of the request being replayed."""
+    if isinstance(payload, list) and isinstance(body, list):
+        return [{**item, "id": call["id"]} for call, item in zip(payload, body) if item is not None]
+    if isinstance(payload, dict) and isinstance(body, dict):
+        return {**body, "id": payload["id"]}
+    return body
+
+
+def _without_id(item: Any) -> Any:
+    if not isinstance(item, dict):
+        return item
+    return {key: value for key, value in item.items() if key != "id"}
+
+
+def _to_int(value: Any) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return int(value, 16) if value.startswith("0x") else int(value or "0")
+    return int(value)
+
 
 def _address_to_topic(address: str) -> str:
     clean = address.lower().strip()
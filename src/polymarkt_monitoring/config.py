@@ -4,6 +4,8 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 
+from polymarkt_monitoring.capture import CAPTURE_MODES, REPLAY_TIMINGS
+
 try:
     from dotenv import load_dotenv
 except ImportError:  # pragma: no cover - dependency should be installed in runtime env
@@ -15,6 +17,9 @@ DEFAULT_NATIVE_COINGECKO_ID = {
     "polygon": "matic-network",
 }
 
+NOVELTY_BACKENDS = ("explorer", "rpc")
+PRICING_MODES = ("spot", "historical")
+
 DEFAULT_EXPLORER_API_BASE = {
     "ethereum": "https://api.etherscan.io/api",
     "polygon": "https://api.polygonscan.com/api",
@@ -43,6 +48,42 @@ class MonitorConfig:
     telegram_bot_token: str
     telegram_chat_id: str
     log_level: str
+    rpc_max_concurrency: int = 8
+    rpc_batch_size: int = 20
+    dedup_window_blocks: int = 5_000
+    dedup_bloom_capacity: int = 0
+    state_db_path: str = ""
+    novelty_cache_size: int = 10_000
+    novelty_cache_ttl_seconds: int = 60
+    novelty_backend: str = "explorer"
+    explorer_concurrency: int = 4
+    explorer_calls_per_second: float = 5.0
+    explorer_daily_limit: int = 100_000
+    pending_retry_base_seconds: int = 15
+    pending_retry_max_seconds: int = 900
+    notifier_concurrency: int = 2
+    pipeline_range_queue_size: int = 4
+    pipeline_candidate_queue_size: int = 256
+    price_refresh_seconds: int = 20
+    price_max_staleness_seconds: int = 120
+    pricing_mode: str = "spot"
+    price_history_path: str = "state/price_history.json"
+    rpc_ws_url: str = ""
+    min_poll_interval_seconds: float = 1.0
+    max_catchup_blocks_per_cycle: int = 500
+    rpc_hedge_percentile: float = 0.0
+    rpc_max_head_lag_blocks: int = 5
+    rpc_head_check_seconds: int = 30
+    telegram_messages_per_minute: int = 20
+    breaker_failure_threshold: int = 5
+    breaker_reset_seconds: int = 30
+    metrics_port: int = 0
+    metrics_host: str = "0.0.0.0"
+    trace_path: str = ""
+    trace_otlp_endpoint: str = ""
+    capture_mode: str = "off"
+    capture_path: str = "state/capture.jsonl.gz"
+    capture_replay_timing: str = "fast"
 
 
 def load_config(env_file: str = ".env") -> MonitorConfig:
@@ -74,6 +115,54 @@ def load_config(env_file: str = ".env") -> MonitorConfig:
     poll_interval_seconds = _parse_int(os.getenv("POLL_INTERVAL_SECONDS", "15"), "POLL_INTERVAL_SECONDS")
     block_confirmations = _parse_int(os.getenv("BLOCK_CONFIRMATIONS", "2"), "BLOCK_CONFIRMATIONS")
     max_blocks_per_cycle = _parse_int(os.getenv("MAX_BLOCKS_PER_CYCLE", "50"), "MAX_BLOCKS_PER_CYCLE")
+    min_poll_interval_seconds = _parse_float(
+        os.getenv("MIN_POLL_INTERVAL_SECONDS", "1"), "MIN_POLL_INTERVAL_SECONDS"
+    )
+    raw_max_catchup_blocks = os.getenv("MAX_CATCHUP_BLOCKS_PER_CYCLE", "").strip()
+    # Unset, it never undercuts MAX_BLOCKS_PER_CYCLE, so configs predating the setting keep loading.
+    max_catchup_blocks_per_cycle = (
+        _parse_int(raw_max_catchup_blocks, "MAX_CATCHUP_BLOCKS_PER_CYCLE")
+        if raw_max_catchup_blocks
+        else max(500, max_blocks_per_cycle)
+    )
+    rpc_max_concurrency = _parse_int(os.getenv("RPC_MAX_CONCURRENCY", "8"), "RPC_MAX_CONCURRENCY")
+    rpc_ws_url = os.getenv("RPC_WS_URL", "").strip()
+    rpc_batch_size = _parse_int(os.getenv("RPC_BATCH_SIZE", "20"), "RPC_BATCH_SIZE")
+    rpc_hedge_percentile = _parse_float(os.getenv("RPC_HEDGE_PERCENTILE", "0"), "RPC_HEDGE_PERCENTILE")
+    rpc_max_head_lag_blocks = _parse_int(os.getenv("RPC_MAX_HEAD_LAG_BLOCKS", "5"), "RPC_MAX_HEAD_LAG_BLOCKS")
+    rpc_head_check_seconds = _parse_int(os.getenv("RPC_HEAD_CHECK_SECONDS", "30"), "RPC_HEAD_CHECK_SECONDS")
+    dedup_window_blocks = _parse_int(os.getenv("DEDUP_WINDOW_BLOCKS", "5000"), "DEDUP_WINDOW_BLOCKS")
+    dedup_bloom_capacity = _parse_int(os.getenv("DEDUP_BLOOM_CAPACITY", "0"), "DEDUP_BLOOM_CAPACITY")
+    state_db_path = os.getenv("STATE_DB_PATH", "").strip()
+    novelty_cache_size = _parse_int(os.getenv("NOVELTY_CACHE_SIZE", "10000"), "NOVELTY_CACHE_SIZE")
+    novelty_cache_ttl_seconds = _parse_int(
+        os.getenv("NOVELTY_CACHE_TTL_SECONDS", "60"), "NOVELTY_CACHE_TTL_SECONDS"
+    )
+    novelty_backend = os.getenv("NOVELTY_BACKEND", "explorer").strip().lower()
+    explorer_concurrency = _parse_int(os.getenv("EXPLORER_CONCURRENCY", "4"), "EXPLORER_CONCURRENCY")
+    explorer_calls_per_second = _parse_float(
+        os.getenv("EXPLORER_CALLS_PER_SECOND", "5"), "EXPLORER_CALLS_PER_SECOND"
+    )
+    explorer_daily_limit = _parse_int(os.getenv("EXPLORER_DAILY_LIMIT", "100000"), "EXPLORER_DAILY_LIMIT")
+    pending_retry_base_seconds = _parse_int(
+        os.getenv("PENDING_RETRY_BASE_SECONDS", "15"), "PENDING_RETRY_BASE_SECONDS"
+    )
+    pending_retry_max_seconds = _parse_int(
+        os.getenv("PENDING_RETRY_MAX_SECONDS", "900"), "PENDING_RETRY_MAX_SECONDS"
+    )
+    notifier_concurrency = _parse_int(os.getenv("NOTIFIER_CONCURRENCY", "2"), "NOTIFIER_CONCURRENCY")
+    pipeline_range_queue_size = _parse_int(
+        os.getenv("PIPELINE_RANGE_QUEUE_SIZE", "4"), "PIPELINE_RANGE_QUEUE_SIZE"
+    )
+    pipeline_candidate_queue_size = _parse_int(
+        os.getenv("PIPELINE_CANDIDATE_QUEUE_SIZE", "256"), "PIPELINE_CANDIDATE_QUEUE_SIZE"
+    )
+    price_refresh_seconds = _parse_int(os.getenv("PRICE_REFRESH_SECONDS", "20"), "PRICE_REFRESH_SECONDS")
+    price_max_staleness_seconds = _parse_int(
+        os.getenv("PRICE_MAX_STALENESS_SECONDS", "120"), "PRICE_MAX_STALENESS_SECONDS"
+    )
+    pricing_mode = os.getenv("PRICING_MODE", "spot").strip().lower()
+    price_history_path = os.getenv("PRICE_HISTORY_PATH", "state/price_history.json").strip()
 
     raw_start_block = os.getenv("START_BLOCK", "").strip()
     start_block = _parse_int(raw_start_block, "START_BLOCK") if raw_start_block else None
@@ -86,6 +175,20 @@ def load_config(env_file: str = ".env") -> MonitorConfig:
 
     telegram_bot_token = _required("TELEGRAM_BOT_TOKEN")
     telegram_chat_id = _required("TELEGRAM_CHAT_ID")
+    telegram_messages_per_minute = _parse_int(
+        os.getenv("TELEGRAM_MESSAGES_PER_MINUTE", "20"), "TELEGRAM_MESSAGES_PER_MINUTE"
+    )
+    breaker_failure_threshold = _parse_int(
+        os.getenv("BREAKER_FAILURE_THRESHOLD", "5"), "BREAKER_FAILURE_THRESHOLD"
+    )
+    breaker_reset_seconds = _parse_int(os.getenv("BREAKER_RESET_SECONDS", "30"), "BREAKER_RESET_SECONDS")
+    metrics_port = _parse_int(os.getenv("METRICS_PORT", "0"), "METRICS_PORT")
+    metrics_host = os.getenv("METRICS_HOST", "0.0.0.0").strip()
+    trace_path = os.getenv("TRACE_PATH", "").strip()
+    trace_otlp_endpoint = os.getenv("TRACE_OTLP_ENDPOINT", "").strip()
+    capture_mode = os.getenv("CAPTURE_MODE", "off").strip().lower()
+    capture_path = os.getenv("CAPTURE_PATH", "state/capture.jsonl.gz").strip()
+    capture_replay_timing = os.getenv("CAPTURE_REPLAY_TIMING", "fast").strip().lower()
     log_level = os.getenv("LOG_LEVEL", "INFO").strip().upper()
 
     if usd_threshold <= 0:
@@ -98,6 +201,72 @@ def load_config(env_file: str = ".env") -> MonitorConfig:
         raise ValueError("BLOCK_CONFIRMATIONS must be >= 0")
     if max_blocks_per_cycle < 1:
         raise ValueError("MAX_BLOCKS_PER_CYCLE must be >= 1")
+    if not 0 < min_poll_interval_seconds <= poll_interval_seconds:
+        raise ValueError("MIN_POLL_INTERVAL_SECONDS must be > 0 and <= POLL_INTERVAL_SECONDS")
+    if max_catchup_blocks_per_cycle < max_blocks_per_cycle:
+        raise ValueError("MAX_CATCHUP_BLOCKS_PER_CYCLE must be >= MAX_BLOCKS_PER_CYCLE")
+    if rpc_max_concurrency < 1:
+        raise ValueError("RPC_MAX_CONCURRENCY must be >= 1")
+    if rpc_ws_url and not rpc_ws_url.startswith(("ws://", "wss://")):
+        raise ValueError("RPC_WS_URL must start with ws:// or wss://")
+    if rpc_batch_size < 1:
+        raise ValueError("RPC_BATCH_SIZE must be >= 1")
+    if not 0 <= rpc_hedge_percentile < 100:
+        raise ValueError("RPC_HEDGE_PERCENTILE must be >= 0 and < 100")
+    if rpc_max_head_lag_blocks < 0:
+        raise ValueError("RPC_MAX_HEAD_LAG_BLOCKS must be >= 0")
+    if rpc_head_check_seconds < 1:
+        raise ValueError("RPC_HEAD_CHECK_SECONDS must be >= 1")
+    if telegram_messages_per_minute < 1:
+        raise ValueError("TELEGRAM_MESSAGES_PER_MINUTE must be >= 1")
+    if breaker_failure_threshold < 1:
+        raise ValueError("BREAKER_FAILURE_THRESHOLD must be >= 1")
+    if breaker_reset_seconds < 1:
+        raise ValueError("BREAKER_RESET_SECONDS must be >= 1")
+    if not 0 <= metrics_port <= 65_535:
+        raise ValueError("METRICS_PORT must be between 0 and 65535")
+    if trace_otlp_endpoint and not trace_otlp_endpoint.startswith(("http://", "https://")):
+        raise ValueError("TRACE_OTLP_ENDPOINT must start with http:// or https://")
+    if capture_mode not in ("off", *CAPTURE_MODES):
+        raise ValueError(f"CAPTURE_MODE must be one of: off, {', '.join(CAPTURE_MODES)}")
+    if capture_mode != "off" and not capture_path:
+        raise ValueError("CAPTURE_PATH is required when CAPTURE_MODE is set")
+    if capture_replay_timing not in REPLAY_TIMINGS:
+        raise ValueError(f"CAPTURE_REPLAY_TIMING must be one of: {', '.join(REPLAY_TIMINGS)}")
+    if dedup_window_blocks < 0:
+        raise ValueError("DEDUP_WINDOW_BLOCKS must be >= 0")
+    if dedup_bloom_capacity < 0:
+        raise ValueError("DEDUP_BLOOM_CAPACITY must be >= 0")
+    if novelty_cache_size < 0:
+        raise ValueError("NOVELTY_CACHE_SIZE must be >= 0")
+    if novelty_cache_ttl_seconds < 0:
+        raise ValueError("NOVELTY_CACHE_TTL_SECONDS must be >= 0")
+    if novelty_backend not in NOVELTY_BACKENDS:
+        raise ValueError(f"NOVELTY_BACKEND must be one of: {', '.join(NOVELTY_BACKENDS)}")
+    if explorer_concurrency < 1:
+        raise ValueError("EXPLORER_CONCURRENCY must be >= 1")
+    if explorer_calls_per_second <= 0:
+        raise ValueError("EXPLORER_CALLS_PER_SECOND must be > 0")
+    if explorer_daily_limit < 0:
+        raise ValueError("EXPLORER_DAILY_LIMIT must be >= 0")
+    if pending_retry_base_seconds < 0:
+        raise ValueError("PENDING_RETRY_BASE_SECONDS must be >= 0")
+    if pending_retry_max_seconds < pending_retry_base_seconds:
+        raise ValueError("PENDING_RETRY_MAX_SECONDS must be >= PENDING_RETRY_BASE_SECONDS")
+    if notifier_concurrency < 1:
+        raise ValueError("NOTIFIER_CONCURRENCY must be >= 1")
+    if pipeline_range_queue_size < 1:
+        raise ValueError("PIPELINE_RANGE_QUEUE_SIZE must be >= 1")
+    if pipeline_candidate_queue_size < 1:
+        raise ValueError("PIPELINE_CANDIDATE_QUEUE_SIZE must be >= 1")
+    if price_refresh_seconds < 1:
+        raise ValueError("PRICE_REFRESH_SECONDS must be >= 1")
+    if price_max_staleness_seconds < price_refresh_seconds:
+        raise ValueError("PRICE_MAX_STALENESS_SECONDS must be >= PRICE_REFRESH_SECONDS")
+    if pricing_mode not in PRICING_MODES:
+        raise ValueError(f"PRICING_MODE must be one of: {', '.join(PRICING_MODES)}")
+    if pricing_mode == "historical" and not price_history_path:
+        raise ValueError("PRICE_HISTORY_PATH is required when PRICING_MODE=historical")
 
     return MonitorConfig(
         chain_name=chain_name,
@@ -120,6 +289,42 @@ def load_config(env_file: str = ".env") -> MonitorConfig:
         telegram_bot_token=telegram_bot_token,
         telegram_chat_id=telegram_chat_id,
         log_level=log_level,
+        rpc_max_concurrency=rpc_max_concurrency,
+        rpc_batch_size=rpc_batch_size,
+        dedup_window_blocks=dedup_window_blocks,
+        dedup_bloom_capacity=dedup_bloom_capacity,
+        state_db_path=state_db_path,
+        novelty_cache_size=novelty_cache_size,
+        novelty_cache_ttl_seconds=novelty_cache_ttl_seconds,
+        novelty_backend=novelty_backend,
+        explorer_concurrency=explorer_concurrency,
+        explorer_calls_per_second=explorer_calls_per_second,
+        explorer_daily_limit=explorer_daily_limit,
+        pending_retry_base_seconds=pending_retry_base_seconds,
+        pending_retry_max_seconds=pending_retry_max_seconds,
+        notifier_concurrency=notifier_concurrency,
+        pipeline_range_queue_size=pipeline_range_queue_size,
+        pipeline_candidate_queue_size=pipeline_candidate_queue_size,
+        price_refresh_seconds=price_refresh_seconds,
+        price_max_staleness_seconds=price_max_staleness_seconds,
+        pricing_mode=pricing_mode,
+        price_history_path=price_history_path,
+        rpc_ws_url=rpc_ws_url,
+        min_poll_interval_seconds=min_poll_interval_seconds,
+        max_catchup_blocks_per_cycle=max_catchup_blocks_per_cycle,
+        rpc_hedge_percentile=rpc_hedge_percentile,
+        rpc_max_head_lag_blocks=rpc_max_head_lag_blocks,
+        rpc_head_check_seconds=rpc_head_check_seconds,
+        telegram_messages_per_minute=telegram_messages_per_minute,
+        breaker_failure_threshold=breaker_failure_threshold,
+        breaker_reset_seconds=breaker_reset_seconds,
+        metrics_port=metrics_port,
+        metrics_host=metrics_host,
+        trace_path=trace_path,
+        trace_otlp_endpoint=trace_otlp_endpoint,
+        capture_mode=capture_mode,
+        capture_path=capture_path,
+        capture_replay_timing=capture_replay_timing,
     )
 
 
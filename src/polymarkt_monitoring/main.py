@@ -2,17 +2,62 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import contextlib
 import logging
+import os
 
-from polymarkt_monitoring.clients import CoinGeckoPricingClient, ExplorerClient, RpcClient, TelegramNotifier
-from polymarkt_monitoring.config import load_config
-from polymarkt_monitoring.services import BetEvaluator, MonitoringService
+from polymarkt_monitoring.backfill import BackfillRunner, write_candidates
+from polymarkt_monitoring.builders import (
+    build_capture,
+    build_evaluator,
+    build_explorer_client,
+    build_head_stream,
+    build_metrics_server,
+    build_price_feed,
+    build_rpc_client,
+    build_telegram_notifier,
+    build_tracer,
+)
+from polymarkt_monitoring.clients import (
+    AsyncRpcClient,
+    AsyncTelegramNotifier,
+    FileNotifier,
+    HeadStream,
+    HistoricalPriceFeed,
+    PriceFeed,
+)
+from polymarkt_monitoring.config import MonitorConfig, load_config
+from polymarkt_monitoring.metrics import MetricsServer
+from polymarkt_monitoring.services import MonitoringService, SqliteStateStore
 
 
 def cli_entrypoint() -> None:
-    parser = argparse.ArgumentParser(description="Monitor high-value bets from new wallets")
-    parser.add_argument("--env-file", default=".env", help="Path to environment file")
+    common = argparse.ArgumentParser(add_help=False)
+    # SUPPRESS keeps a subcommand from resetting an --env-file given before it.
+    common.add_argument("--env-file", default=argparse.SUPPRESS, help="Path to environment file (default: .env)")
+
+    parser = argparse.ArgumentParser(description="Monitor high-value bets from new wallets", parents=[common])
+    parser.set_defaults(env_file=".env")
     parser.add_argument("--once", action="store_true", help="Process available confirmed blocks once then exit")
+    subcommands = parser.add_subparsers(dest="command")
+
+    backfill = subcommands.add_parser("backfill", parents=[common], help="Scan a past block range in parallel")
+    backfill.add_argument("--from", dest="from_block", type=int, required=True, help="First block to scan")
+    backfill.add_argument("--to", dest="to_block", type=int, required=True, help="Last block to scan (inclusive)")
+    backfill.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    backfill.add_argument(
+        "--state-dir",
+        default=None,
+        help="Per-shard progress directory; rerun with the same one to resume (default: state/backfill-FROM-TO)",
+    )
+    backfill.add_argument("--output", default=None, help="JSONL file for merged candidates")
+    backfill.add_argument(
+        "--alerts",
+        choices=("none", "file", "telegram"),
+        default="none",
+        help="Check novelty and alert on merged candidates, to a file or Telegram",
+    )
+    backfill.add_argument("--alerts-file", default=None, help="Alert file used with --alerts file")
     args = parser.parse_args()
 
     config = load_config(args.env_file)
@@ -22,34 +67,109 @@ def cli_entrypoint() -> None:
     )
     logger = logging.getLogger("polymarkt_monitoring")
 
-    rpc_client = RpcClient(rpc_urls=config.rpc_urls, logger=logger)
-    pricing_client = CoinGeckoPricingClient(api_base=config.coingecko_api_base, logger=logger)
-    explorer_client = ExplorerClient(
-        api_base=config.explorer_api_base,
-        api_key=config.explorer_api_key,
-        logger=logger,
-    )
-    notifier = TelegramNotifier(
-        bot_token=config.telegram_bot_token,
-        chat_id=config.telegram_chat_id,
-        logger=logger,
-    )
-    evaluator = BetEvaluator(
-        usd_threshold=config.usd_threshold,
-        wallet_max_tx_count=config.wallet_max_tx_count,
-    )
+    if args.command == "backfill":
+        _run_backfill(config, args, logger)
+        return
 
+    capture = build_capture(config, logger)
+    rpc_client = build_rpc_client(config, logger, capture=capture)
+    price_feed = build_price_feed(config, logger, capture=capture)
+    head_stream = build_head_stream(config, logger)
+    state_store = SqliteStateStore(config.state_db_path) if config.state_db_path else None
+
+    notifier = build_telegram_notifier(config, logger)
     service = MonitoringService(
         config=config,
         rpc_client=rpc_client,
-        pricing_client=pricing_client,
-        explorer_client=explorer_client,
+        pricing_client=price_feed,
+        explorer_client=build_explorer_client(config, logger, capture=capture),
         notifier=notifier,
-        evaluator=evaluator,
+        evaluator=build_evaluator(config),
+        state_store=state_store,
+        head_stream=head_stream,
+        tracer=build_tracer(config, logger),
         logger=logger,
     )
 
-    asyncio.run(service.run(once=args.once))
+    metrics_server = build_metrics_server(config, service, logger)
+
+    try:
+        asyncio.run(
+            _run_service(
+                service, rpc_client, price_feed, notifier, head_stream, metrics_server=metrics_server, once=args.once
+            )
+        )
+    finally:
+        if state_store is not None:
+            state_store.close()
+        if capture is not None:
+            capture.close()
+
+
+async def _run_service(
+    service: MonitoringService,
+    rpc_client: AsyncRpcClient,
+    price_feed: PriceFeed | HistoricalPriceFeed,
+    notifier: AsyncTelegramNotifier,
+    head_stream: HeadStream | None,
+    *,
+    metrics_server: MetricsServer | None = None,
+    once: bool,
+) -> None:
+    async with contextlib.AsyncExitStack() as stack:
+        if metrics_server is not None:
+            await stack.enter_async_context(metrics_server)
+        await stack.enter_async_context(rpc_client)
+        await stack.enter_async_context(price_feed)
+        await stack.enter_async_context(notifier)
+        # Entered after the notifier, so it is closed first and flushes traces of the last alerts.
+        await stack.enter_async_context(service.tracer)
+        if head_stream is not None and not once:
+            await stack.enter_async_context(head_stream)
+        await service.run(once=once)
+
+
+def _run_backfill(config: MonitorConfig, args: argparse.Namespace, logger: logging.Logger) -> None:
+    if args.from_block > args.to_block:
+        raise SystemExit("--from must be <= --to")
+    if args.workers < 1:
+        raise SystemExit("--workers must be >= 1")
+    if args.alerts == "file" and not args.alerts_file:
+        raise SystemExit("--alerts file requires --alerts-file")
+
+    span = f"{args.from_block}-{args.to_block}"
+    runner = BackfillRunner(
+        config=config,
+        from_block=args.from_block,
+        to_block=args.to_block,
+        workers=args.workers,
+        state_dir=args.state_dir or os.path.join("state", f"backfill-{span}"),
+        logger=logger,
+    )
+    candidates = runner.run()
+    output = args.output or f"backfill-{span}.jsonl"
+    write_candidates(output, candidates)
+    logger.info("Backfill candidates written", extra={"path": output, "candidate_count": len(candidates)})
+
+    if args.alerts == "none":
+        return
+    notifier = (
+        FileNotifier(path=args.alerts_file) if args.alerts == "file" else build_telegram_notifier(config, logger)
+    )
+    undelivered = asyncio.run(_send_backfill_alerts(runner, candidates, notifier))
+    if undelivered:
+        raise SystemExit(f"{len(undelivered)} backfill alert(s) were not delivered; see the logged tx hashes")
+
+
+async def _send_backfill_alerts(
+    runner: BackfillRunner,
+    candidates: list,
+    notifier: FileNotifier | AsyncTelegramNotifier,
+) -> list:
+    async with contextlib.AsyncExitStack() as stack:
+        if isinstance(notifier, AsyncTelegramNotifier):
+            await stack.enter_async_context(notifier)
+        return await runner.alert(candidates, notifier=notifier)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import abc
+import bisect
+import contextlib
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+
+try:
+    from aiohttp import web
+except ImportError:  # pragma: no cover - import depends on runtime environment
+    web = None
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Metric(abc.ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, values: tuple[str, ...]) -> tuple[str, ...]:
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        return tuple(str(value) for value in values)
+
+    @abc.abstractmethod
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        """Yield ``(sample name, labels, value)`` for every series of the metric."""
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            yield self.name, dict(zip(self.labelnames, key)), value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        *,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> (per-bucket counts with a trailing +Inf slot, sum)
+        self._values: dict[tuple[str, ...], tuple[list[int], float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, *labels: str) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            return sum(entry[0]) if entry else 0
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        with self._lock:
+            values = [(key, list(counts), total) for key, (counts, total) in self._values.items()]
+        for key, counts, total in values:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, cumulative
+
+
+class Gauge(_Metric):
+    """Read at scrape time from ``function``, so the value is never stale and costs nothing in between."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, function: Callable[[], float | None]) -> None:
+        super().__init__(name, documentation)
+        self.function = function
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        value = self.function()
+        if value is not None:
+            yield self.name, {}, float(value)
+
+
+class MetricsRegistry:
+    """Named metrics rendered in the Prometheus text exposition format."""
+
+    def __init__(self, *, logger: logging.Logger | None = None) -> None:
+        self.logger = logger or logging.getLogger(__name__)
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        *,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets=buckets))
+
+    def gauge(self, name: str, documentation: str, function: Callable[[], float | None]) -> Gauge:
+        """Register a gauge, replacing any earlier one of that name (a new service run rebinds it)."""
+        gauge = Gauge(name, documentation, function)
+        self._metrics[name] = gauge
+        return gauge
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                raise ValueError(f"Metric {metric.name} is already registered differently")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            try:
+                samples = list(metric.samples())
+            except Exception:
+                # One broken gauge callback must not take the whole scrape down.
+                self.logger.warning("Metric collection failed", extra={"metric": metric.name}, exc_info=True)
+                continue
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in samples:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Serves ``registry`` at ``GET /metrics`` on the running event loop."""
+
+    def __init__(
+        self,
+        *,
+        registry: MetricsRegistry,
+        host: str = "0.0.0.0",
+        port: int = 9100,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if web is None:
+            raise RuntimeError("aiohttp is required. Install dependencies with `pip install -e .`.")
+
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.logger = logger or logging.getLogger(__name__)
+        self._runner: web.AppRunner | None = None
+
+    async def __aenter__(self) -> MetricsServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        if self._runner is not None:
+            return
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        # With port 0 the OS picks one; report what is actually bound.
+        self.port = self._runner.addresses[0][1]
+        self.logger.info("Metrics endpoint listening", extra={"host": self.host, "port": self.port})
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        return web.Response(body=self.registry.render().encode(), headers={"Content-Type": CONTENT_TYPE})
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+REGISTRY = MetricsRegistry()
+
+BLOCKS_PROCESSED = REGISTRY.counter("polymarkt_blocks_processed_total", "Blocks checkpointed by the monitor.")
+ALERTS_SENT = REGISTRY.counter("polymarkt_alerts_sent_total", "Alerts acknowledged by the notifier.")
+RPC_REQUESTS = REGISTRY.counter(
+    "polymarkt_rpc_requests_total", "JSON-RPC HTTP requests by method and outcome.", ("method", "outcome")
+)
+RPC_LATENCY = REGISTRY.histogram(
+    "polymarkt_rpc_request_duration_seconds", "JSON-RPC HTTP request latency by method.", ("method",)
+)
+DEPENDENCY_REQUESTS = REGISTRY.counter(
+    "polymarkt_dependency_requests_total",
+    "Explorer, CoinGecko and Telegram HTTP requests by outcome.",
+    ("dependency", "outcome"),
+)
+DEPENDENCY_LATENCY = REGISTRY.histogram(
+    "polymarkt_dependency_request_duration_seconds",
+    "Explorer, CoinGecko and Telegram HTTP request latency.",
+    ("dependency",),
+)
+
+
+def record_dependency(dependency: str, latency_seconds: float, outcome: str) -> None:
+    DEPENDENCY_LATENCY.observe(latency_seconds, dependency)
+    DEPENDENCY_REQUESTS.inc(dependency, outcome)
+
+
+@contextlib.contextmanager
+def track_dependency(dependency: str) -> Iterator[None]:
+    """Time one request to ``dependency``; an exception counts it as an error."""
+    started = time.monotonic()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        record_dependency(dependency, time.monotonic() - started, outcome)
+
+
+def hit_ratio(hits: int, misses: int) -> float | None:
+    lookups = hits + misses
+    return hits / lookups if lookups else None
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import TypeVar
 
+from polymarkt_monitoring.breaker import CircuitOpenError
+
 T = TypeVar("T")
 
 
@@ -14,25 +18,123 @@ def with_retries(
     attempts: int = 3,
     base_delay_seconds: float = 1.0,
     backoff_multiplier: float = 2.0,
+    max_delay_seconds: float = 30.0,
+    deadline_seconds: float | None = None,
+    jitter: bool = True,
+    should_retry: Callable[[Exception], bool] | None = None,
     logger: logging.Logger | None = None,
 ) -> T:
+    """Blocking retry; only for code that already runs off the event loop (worker threads/processes)."""
     if attempts < 1:
         raise ValueError("attempts must be >= 1")
 
-    delay = base_delay_seconds
+    started = time.monotonic()
     for attempt in range(1, attempts + 1):
         try:
             return fn()
-        except Exception:  # noqa: BLE001 - caller supplies external I/O ops
-            if attempt == attempts:
+        except Exception as exc:  # noqa: BLE001 - caller supplies external I/O ops
+            sleep = _next_sleep(
+                exc,
+                attempt=attempt,
+                attempts=attempts,
+                started=started,
+                base_delay_seconds=base_delay_seconds,
+                backoff_multiplier=backoff_multiplier,
+                max_delay_seconds=max_delay_seconds,
+                deadline_seconds=deadline_seconds,
+                jitter=jitter,
+                should_retry=should_retry,
+                logger=logger,
+            )
+            if sleep is None:
                 raise
-            if logger:
-                logger.warning(
-                    "retrying operation",
-                    extra={"attempt": attempt, "remaining_attempts": attempts - attempt},
-                    exc_info=True,
-                )
-            time.sleep(delay)
-            delay *= backoff_multiplier
+            time.sleep(sleep)
 
     raise RuntimeError("unreachable")
+
+
+async def async_with_retries(
+    fn: Callable[[], Awaitable[T]],
+    *,
+    attempts: int = 3,
+    base_delay_seconds: float = 1.0,
+    backoff_multiplier: float = 2.0,
+    max_delay_seconds: float = 30.0,
+    deadline_seconds: float | None = None,
+    jitter: bool = True,
+    should_retry: Callable[[Exception], bool] | None = None,
+    logger: logging.Logger | None = None,
+) -> T:
+    """Retry ``fn`` with full-jitter exponential backoff, giving up at ``attempts`` or the deadline.
+
+    The deadline bounds the whole sequence including sleeps: a retry whose backoff would end
+    past it is not attempted. Open circuits are never retried.
+    """
+    if attempts < 1:
+        raise ValueError("attempts must be >= 1")
+
+    started = time.monotonic()
+    for attempt in range(1, attempts + 1):
+        try:
+            if deadline_seconds is None:
+                return await fn()
+            remaining = max(0.0, deadline_seconds - (time.monotonic() - started))
+            return await asyncio.wait_for(fn(), timeout=remaining)
+        except Exception as exc:  # noqa: BLE001 - caller supplies external I/O ops
+            sleep = _next_sleep(
+                exc,
+                attempt=attempt,
+                attempts=attempts,
+                started=started,
+                base_delay_seconds=base_delay_seconds,
+                backoff_multiplier=backoff_multiplier,
+                max_delay_seconds=max_delay_seconds,
+                deadline_seconds=deadline_seconds,
+                jitter=jitter,
+                should_retry=should_retry,
+                logger=logger,
+            )
+            if sleep is None:
+                raise
+            await asyncio.sleep(sleep)
+
+    raise RuntimeError("unreachable")
+
+
+def _next_sleep(
+    exc: Exception,
+    *,
+    attempt: int,
+    attempts: int,
+    started: float,
+    base_delay_seconds: float,
+    backoff_multiplier: float,
+    max_delay_seconds: float,
+    deadline_seconds: float | None,
+    jitter: bool,
+    should_retry: Callable[[Exception], bool] | None,
+    logger: logging.Logger | None,
+) -> float | None:
+    """Seconds to back off before the next attempt, or ``None`` to give up and re-raise."""
+    if attempt == attempts or isinstance(exc, CircuitOpenError):
+        return None
+    if should_retry is not None and not should_retry(exc):
+        return None
+
+    ceiling = min(max_delay_seconds, base_delay_seconds * backoff_multiplier ** (attempt - 1))
+    # Full jitter: concurrent callers that failed together do not retry together.
+    sleep = random.uniform(0, ceiling) if jitter else ceiling
+    if deadline_seconds is not None and time.monotonic() - started + sleep >= deadline_seconds:
+        return None
+
+    if logger:
+        logger.warning(
+            "retrying operation",
+            extra={
+                "attempt": attempt,
+                "remaining_attempts": attempts - attempt,
+                "delay_seconds": round(sleep, 3),
+            },
+            exc_info=True,
+        )
+    return sleep
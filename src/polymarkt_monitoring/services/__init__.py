@@ -2,5 +2,6 @@
 
 from .evaluator import BetEvaluator
 from .monitor import MonitoringService
+from .state_store import SqliteStateStore
 
-__all__ = ["BetEvaluator", "MonitoringService"]
+__all__ = ["BetEvaluator", "MonitoringService", "SqliteStateStore"]
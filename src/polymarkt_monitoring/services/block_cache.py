@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+
+
+class BlockTimestampCache:
+    """Block number -> timestamp map bounded by size and by a low-water block mark.
+
+    Blocks are inserted in roughly ascending order, so when the cache is full the
+    earliest-inserted entries are evicted first.
+    """
+
+    def __init__(self, *, max_entries: int = 4_096) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, block_number: object) -> bool:
+        return block_number in self._entries
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._entries)
+
+    def get(self, block_number: int) -> int | None:
+        timestamp = self._entries.get(block_number)
+        if timestamp is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return timestamp
+
+    def put(self, block_number: int, timestamp: int) -> None:
+        self._entries[block_number] = timestamp
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+            self.evictions += 1
+
+    def update(self, timestamps: Mapping[int, int]) -> None:
+        for block_number, timestamp in timestamps.items():
+            self.put(block_number, timestamp)
+
+    def prune_below(self, low_water_block: int) -> int:
+        stale = [block_number for block_number in self._entries if block_number < low_water_block]
+        for block_number in stale:
+            del self._entries[block_number]
+        self.evictions += len(stale)
+        return len(stale)
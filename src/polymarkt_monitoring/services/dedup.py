@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import hashlib
+import math
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+
+def compact_key(key: Hashable) -> bytes:
+    """Hash a dedup key tuple into a fixed 16-byte digest."""
+    parts = key if isinstance(key, tuple) else (key,)
+    return hashlib.blake2b("\x1f".join(str(part) for part in parts).encode(), digest_size=16).digest()
+
+
+class RotatingBloomFilter:
+    """Bloom filter made of generations; the oldest generation is dropped once the newest fills up."""
+
+    def __init__(self, *, capacity: int, error_rate: float = 0.001, generations: int = 2) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        if generations < 1:
+            raise ValueError("generations must be >= 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.generations = generations
+        self.bit_count = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.rotations = 0
+        self._filters: list[bytearray] = [self._new_filter()]
+        self._counts: list[int] = [0]
+
+    def __contains__(self, key: bytes) -> bool:
+        positions = self._positions(key)
+        return any(all(bits[p >> 3] & (1 << (p & 7)) for p in positions) for bits in self._filters)
+
+    def __len__(self) -> int:
+        return sum(self._counts)
+
+    def add(self, key: bytes) -> None:
+        if self._counts[-1] >= self.capacity:
+            self._rotate()
+        bits = self._filters[-1]
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self._counts[-1] += 1
+
+    def false_positive_rate(self) -> float:
+        miss_all = 1.0
+        for count in self._counts:
+            generation_rate = (1 - math.exp(-self.hash_count * count / self.bit_count)) ** self.hash_count
+            miss_all *= 1 - generation_rate
+        return 1 - miss_all
+
+    def _rotate(self) -> None:
+        self._filters.append(self._new_filter())
+        self._counts.append(0)
+        if len(self._filters) > self.generations:
+            self._filters.pop(0)
+            self._counts.pop(0)
+        self.rotations += 1
+
+    def _new_filter(self) -> bytearray:
+        return bytearray((self.bit_count + 7) // 8)
+
+    def _positions(self, key: bytes) -> list[int]:
+        # Kirsch-Mitzenmacher double hashing over the two halves of a 16-byte digest.
+        first = int.from_bytes(key[:8], "big")
+        second = int.from_bytes(key[8:16], "big") | 1
+        return [(first + index * second) % self.bit_count for index in range(self.hash_count)]
+
+
+@dataclass(slots=True, frozen=True)
+class DedupStats:
+    size: int
+    evictions: int
+    bloom_entries: int
+    bloom_hits: int
+    false_positive_rate: float
+
+
+class DedupStore:
+    """Exact dedup keys for the recent block window, optionally backed by a Bloom filter beyond it."""
+
+    def __init__(
+        self,
+        *,
+        window_blocks: int,
+        bloom_capacity: int = 0,
+        bloom_error_rate: float = 0.001,
+        track_unsaved: bool = False,
+    ) -> None:
+        if window_blocks < 0:
+            raise ValueError("window_blocks must be >= 0")
+
+        self.window_blocks = window_blocks
+        self.evictions = 0
+        self.bloom_hits = 0
+        self._bloom = (
+            RotatingBloomFilter(capacity=bloom_capacity, error_rate=bloom_error_rate) if bloom_capacity > 0 else None
+        )
+        self._blocks_by_key: dict[bytes, int] = {}
+        self._keys_by_block: dict[int, list[bytes]] = {}
+        self._unsaved: list[tuple[bytes, int]] | None = [] if track_unsaved else None
+
+    def __len__(self) -> int:
+        return len(self._blocks_by_key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        digest = compact_key(key)
+        if digest in self._blocks_by_key:
+            return True
+        if self._bloom is not None and digest in self._bloom:
+            self.bloom_hits += 1
+            return True
+        return False
+
+    def add(self, key: Hashable, block_number: int) -> None:
+        digest = compact_key(key)
+        if digest in self._blocks_by_key:
+            return
+        self.restore(digest, block_number)
+        if self._unsaved is not None:
+            self._unsaved.append((digest, block_number))
+
+    def restore(self, digest: bytes, block_number: int) -> None:
+        """Insert an already-compacted key, e.g. one loaded from a state store."""
+        if digest in self._blocks_by_key:
+            return
+        self._blocks_by_key[digest] = block_number
+        self._keys_by_block.setdefault(block_number, []).append(digest)
+
+    def take_unsaved(self) -> list[tuple[bytes, int]]:
+        """Return keys added since the previous call (requires ``track_unsaved=True``)."""
+        if self._unsaved is None:
+            return []
+        unsaved, self._unsaved = self._unsaved, []
+        return unsaved
+
+    def low_water(self, checkpoint_block: int) -> int:
+        return checkpoint_block - self.window_blocks
+
+    def prune(self, checkpoint_block: int) -> int:
+        """Forget exact keys from blocks older than ``checkpoint_block - window_blocks``."""
+        low_water = self.low_water(checkpoint_block)
+        stale_blocks = [block_number for block_number in self._keys_by_block if block_number < low_water]
+
+        evicted = 0
+        for block_number in stale_blocks:
+            for digest in self._keys_by_block.pop(block_number):
+                del self._blocks_by_key[digest]
+                if self._bloom is not None:
+                    self._bloom.add(digest)
+                evicted += 1
+        self.evictions += evicted
+        return evicted
+
+    def stats(self) -> DedupStats:
+        return DedupStats(
+            size=len(self._blocks_by_key),
+            evictions=self.evictions,
+            bloom_entries=len(self._bloom) if self._bloom is not None else 0,
+            bloom_hits=self.bloom_hits,
+            false_positive_rate=self._bloom.false_positive_rate() if self._bloom is not None else 0.0,
+        )
@@ -1,12 +1,38 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
-from collections.abc import Iterable
-
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+
+from polymarkt_monitoring import metrics
+from polymarkt_monitoring.breaker import CircuitOpenError
+from polymarkt_monitoring.clients.head_stream import HeadStream
+from polymarkt_monitoring.clients.price_feed import StalePriceError
 from polymarkt_monitoring.config import MonitorConfig
 from polymarkt_monitoring.models import BetCandidate
+from polymarkt_monitoring.services.block_cache import BlockTimestampCache
+from polymarkt_monitoring.services.dedup import DedupStore
 from polymarkt_monitoring.services.evaluator import BetEvaluator
+from polymarkt_monitoring.services.pipeline import CommitBatch, ShardedQueue, StageGroup
+from polymarkt_monitoring.services.quota import ExplorerQuota, RetryBackoff
+from polymarkt_monitoring.services.scheduler import PollScheduler
+from polymarkt_monitoring.services.state_store import SqliteStateStore
+from polymarkt_monitoring.tracing import AlertTracer
+
+MIN_TIMESTAMP_CACHE_ENTRIES = 1_024
+THROUGHPUT_WINDOW_SECONDS = 60.0
+
+
+@dataclass(slots=True)
+class _WorkItem:
+    candidate: BetCandidate
+    batch: CommitBatch
+    wallet_tx_count: int | None = None
+    retry: bool = False
 
 
 class MonitoringService:
@@ -19,6 +45,9 @@ class MonitoringService:
         explorer_client,
         notifier,
         evaluator: BetEvaluator,
+        state_store: SqliteStateStore | None = None,
+        head_stream: HeadStream | None = None,
+        tracer: AlertTracer | None = None,
         logger: logging.Logger | None = None,
     ) -> None:
         self.config = config
@@ -27,66 +56,271 @@ class MonitoringService:
         self.explorer_client = explorer_client
         self.notifier = notifier
         self.evaluator = evaluator
+        self.state_store = state_store
+        self.head_stream = head_stream
         self.logger = logger or logging.getLogger(__name__)
-        self._seen_event_keys: set[tuple[str, str, str, str]] = set()
+        self.tracer = tracer if tracer is not None else AlertTracer(logger=self.logger)
+        self._seen_event_keys = DedupStore(
+            window_blocks=config.dedup_window_blocks,
+            bloom_capacity=config.dedup_bloom_capacity,
+            track_unsaved=state_store is not None,
+        )
         self._pending_candidates: dict[tuple[str, str, str, str], BetCandidate] = {}
-        self._timestamp_cache: dict[int, int] = {}
+        self._in_flight: set[tuple[str, str, str, str]] = set()
+        self._deliveries: set[asyncio.Task[None]] = set()
+        self._open_ranges: deque[CommitBatch] = deque()
+        self._checkpoint: int | None = None
+        self._checkpoint_timestamp: int | None = None
+        self._latest_confirmed: int | None = None
+        # Head the HTTP endpoints last reported; a streamed head is never trusted past it.
+        self._served_head: int | None = None
+        # (monotonic time, checkpoint) of recent commits, for blocks_per_second.
+        self._throughput: deque[tuple[float, int]] = deque()
+        self._stages: StageGroup | None = None
+        self._range_queue: asyncio.Queue[tuple[int, int]]
+        self._enrich_queue: ShardedQueue[_WorkItem]
+        self._notify_queue: ShardedQueue[_WorkItem]
+        self._commit_lock: asyncio.Lock
+        self.scheduler = PollScheduler(
+            min_interval_seconds=min(config.min_poll_interval_seconds, config.poll_interval_seconds),
+            max_interval_seconds=config.poll_interval_seconds,
+            base_range_blocks=config.max_blocks_per_cycle,
+            max_range_blocks=max(config.max_blocks_per_cycle, config.max_catchup_blocks_per_cycle),
+        )
+        self.explorer_quota = ExplorerQuota(
+            calls_per_second=config.explorer_calls_per_second,
+            daily_limit=config.explorer_daily_limit,
+            logger=self.logger,
+        )
+        self._retry_backoff = RetryBackoff(
+            base_seconds=config.pending_retry_base_seconds,
+            max_seconds=config.pending_retry_max_seconds,
+        )
+        self._timestamp_cache = BlockTimestampCache(
+            max_entries=max(MIN_TIMESTAMP_CACHE_ENTRIES, config.max_blocks_per_cycle * 4)
+        )
 
     async def run(self, *, once: bool = False) -> None:
-        current_block = self._initial_block()
+        current_block = await self._initial_block()
+        self._checkpoint = current_block
+        self._throughput.append((time.monotonic(), current_block))
         self.logger.info("Monitor started", extra={"start_block": current_block, "once": once})
 
-        while True:
-            self._retry_pending_candidates()
+        async with self._pipeline():
+            await self._ingest(current_block, once=once)
+            await self._drain()
 
-            latest_confirmed = max(0, self.rpc_client.latest_block_number() - self.config.block_confirmations)
-            if latest_confirmed <= current_block:
+        if self._pending_candidates:
+            self.logger.warning(
+                "Exiting with pending candidates after failed downstream operations",
+                extra={"pending_count": len(self._pending_candidates)},
+            )
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending_candidates)
+
+    @property
+    def pending_candidates(self) -> list[BetCandidate]:
+        """Candidates whose novelty check or alert failed and awaits a retry."""
+        return list(self._pending_candidates.values())
+
+    @property
+    def dedup_size(self) -> int:
+        return len(self._seen_event_keys)
+
+    @property
+    def head_lag_blocks(self) -> int | None:
+        """Confirmed blocks past the checkpoint, scheduled or not, or ``None`` before the first head."""
+        if self._latest_confirmed is None or self._checkpoint is None:
+            return None
+        return max(0, self._latest_confirmed - self._checkpoint)
+
+    @property
+    def head_lag_seconds(self) -> float | None:
+        """Wall-clock age of the newest checkpointed block, or ``None`` before the first range."""
+        if self._checkpoint_timestamp is None:
+            return None
+        return max(0.0, time.time() - self._checkpoint_timestamp)
+
+    @property
+    def blocks_per_second(self) -> float:
+        """Checkpointed blocks per second over the last ``THROUGHPUT_WINDOW_SECONDS``."""
+        if not self._throughput:
+            return 0.0
+        now = time.monotonic()
+        started_at, first_checkpoint = self._throughput[0]
+        elapsed = now - started_at
+        return (self._throughput[-1][1] - first_checkpoint) / elapsed if elapsed > 0 else 0.0
+
+    def timestamp_cache_hit_ratio(self) -> float | None:
+        return metrics.hit_ratio(self._timestamp_cache.hits, self._timestamp_cache.misses)
+
+    def queue_depths(self) -> dict[str, int]:
+        """Items waiting in front of each pipeline stage, plus ranges not yet checkpointed."""
+        if self._stages is None:
+            return {"ranges": 0, "enrich": 0, "notify": 0, "open_ranges": len(self._open_ranges)}
+        return {
+            "ranges": self._range_queue.qsize(),
+            "enrich": self._enrich_queue.qsize(),
+            "notify": self._notify_queue.qsize(),
+            "open_ranges": len(self._open_ranges),
+        }
+
+    @contextlib.asynccontextmanager
+    async def _pipeline(self) -> AsyncIterator[None]:
+        """Start the extract, enrich and notify stages unless they are already running."""
+        if self._stages is not None:
+            yield
+            return
+
+        queue_size = self.config.pipeline_candidate_queue_size
+        self._range_queue = asyncio.Queue(maxsize=self.config.pipeline_range_queue_size)
+        self._enrich_queue = ShardedQueue(shards=self.config.explorer_concurrency, maxsize=queue_size)
+        self._notify_queue = ShardedQueue(shards=self.config.notifier_concurrency, maxsize=queue_size)
+        self._commit_lock = asyncio.Lock()
+        stages = StageGroup(logger=self.logger)
+        stages.start("extract", self._extract_stage())
+        for index, queue in enumerate(self._enrich_queue.queues):
+            stages.start(f"enrich-{index}", self._enrich_stage(queue))
+        for index, queue in enumerate(self._notify_queue.queues):
+            stages.start(f"notify-{index}", self._notify_stage(queue))
+        self._stages = stages
+        try:
+            yield
+        finally:
+            self._stages = None
+            for delivery in self._deliveries:
+                delivery.cancel()
+            await stages.stop()
+
+    async def _ingest(self, current_block: int, *, once: bool) -> None:
+        """Queue confirmed block ranges for extraction; a full range queue pauses polling."""
+        scheduled_block = current_block
+        while True:
+            self._stages.raise_if_failed()
+            if self._pending_candidates:
+                await self._stages.wait_for(self._dispatch_pending())
+
+            latest_confirmed = max(0, await self._latest_block_number() - self.config.block_confirmations)
+            self._latest_confirmed = latest_confirmed
+            self.scheduler.observe_head(latest_confirmed, scheduled_block)
+            self.tracer.observe_confirmed(latest_confirmed)
+            if latest_confirmed <= scheduled_block:
                 if once:
-                    if self._pending_candidates:
-                        self.logger.warning(
-                            "Exiting with pending candidates after failed downstream operations",
-                            extra={"pending_count": len(self._pending_candidates)},
-                        )
                     self.logger.info("No new confirmed blocks to process")
                     return
-                await asyncio.sleep(self.config.poll_interval_seconds)
+                await self._stages.wait_for(self._wait_for_new_blocks(scheduled_block))
                 continue
 
-            from_block = current_block + 1
-            to_block = min(current_block + self.config.max_blocks_per_cycle, latest_confirmed)
-            candidates = self._collect_candidates(from_block, to_block)
-            self._evaluate_and_alert(candidates)
+            from_block = scheduled_block + 1
+            to_block = min(scheduled_block + self.scheduler.range_blocks(), latest_confirmed)
+            await self._stages.wait_for(self._range_queue.put((from_block, to_block)))
+            scheduled_block = to_block
 
-            current_block = to_block
-            self.logger.info(
-                "Processed block range",
-                extra={
-                    "from_block": from_block,
-                    "to_block": to_block,
-                    "latest_confirmed": latest_confirmed,
-                },
+            if once and scheduled_block >= latest_confirmed:
+                return
+
+    async def _latest_block_number(self) -> int:
+        head = self.head_stream.fresh_head() if self.head_stream is not None else None
+        if head is None:
+            return await self.rpc_client.latest_block_number()
+        # The stream can run ahead of the HTTP endpoints that serve the blocks, which would answer
+        # with null blocks. Re-reading their head, which also runs the pool's periodic head check,
+        # is only needed once the stream has passed the last one.
+        if self._served_head is None or head > self._served_head:
+            self._served_head = await self.rpc_client.latest_block_number()
+        return min(head, self._served_head)
+
+    async def _wait_for_new_blocks(self, scheduled_block: int) -> None:
+        if self.head_stream is None:
+            delay = self.scheduler.next_delay(
+                scheduled_block=scheduled_block,
+                confirmations=self.config.block_confirmations,
+            )
+            self.logger.debug(
+                "Waiting for next confirmed block",
+                extra={"delay_seconds": round(delay, 2), "block_time_seconds": self.scheduler.block_time_seconds},
             )
+            await asyncio.sleep(delay)
+            return
+        # Wakes on the head that confirms the next block; times out into a regular poll.
+        await self.head_stream.wait_for_head(
+            scheduled_block + self.config.block_confirmations + 1,
+            timeout=self.config.poll_interval_seconds,
+        )
 
-            if once and current_block >= latest_confirmed:
-                return
+    async def _drain(self) -> None:
+        # Stage order matters: each join only returns once upstream has stopped feeding it.
+        await self._stages.wait_for(self._range_queue.join())
+        await self._stages.wait_for(self._enrich_queue.join())
+        await self._stages.wait_for(self._notify_queue.join())
+        while self._deliveries:
+            await self._stages.wait_for(asyncio.wait(set(self._deliveries)))
+
+    async def _extract_stage(self) -> None:
+        # A single consumer keeps ranges, and therefore per-wallet alerts, in block order.
+        while True:
+            from_block, to_block = await self._range_queue.get()
+            try:
+                candidates = self._fresh_candidates(await self.collect_candidates(from_block, to_block))
+                # Usually already cached by the native path; feeds the scheduler's cadence estimate.
+                last_timestamp = (await self._block_timestamps([to_block]))[to_block]
+                self.scheduler.observe_block(to_block, last_timestamp)
+                tx_counts = await self._prefetch_wallet_tx_counts(candidates, to_block)
+                batch = CommitBatch(
+                    len(candidates), from_block=from_block, to_block=to_block, to_timestamp=last_timestamp
+                )
+                self._open_ranges.append(batch)
+                await self._dispatch(candidates, batch, tx_counts)
+            finally:
+                self._range_queue.task_done()
+
+    async def _initial_block(self) -> int:
+        if self.state_store is not None:
+            state = await self.state_store.load_async()
+            if state.checkpoint is not None:
+                for candidate in state.pending_candidates:
+                    self._pending_candidates[candidate.dedup_key] = candidate
+                for digest, block_number in state.dedup_keys:
+                    self._seen_event_keys.restore(digest, block_number)
+                self.logger.info(
+                    "Resuming from state store",
+                    extra={
+                        "checkpoint": state.checkpoint,
+                        "pending_count": len(state.pending_candidates),
+                        "dedup_size": len(state.dedup_keys),
+                    },
+                )
+                return state.checkpoint
 
-    def _initial_block(self) -> int:
         if self.config.start_block is not None:
             return max(-1, self.config.start_block - 1)
 
-        latest = self.rpc_client.latest_block_number()
+        latest = await self.rpc_client.latest_block_number()
         return max(0, latest - self.config.block_confirmations - 1)
 
-    def _collect_candidates(self, from_block: int, to_block: int) -> list[BetCandidate]:
+    async def _persist_state(self, checkpoint: int) -> None:
+        if self.state_store is None:
+            return
+        await self.state_store.commit_range_async(
+            checkpoint=checkpoint,
+            pending_candidates=self._pending_candidates.values(),
+            new_dedup_keys=self._seen_event_keys.take_unsaved(),
+            dedup_low_water=self._seen_event_keys.low_water(checkpoint),
+        )
+
+    async def collect_candidates(self, from_block: int, to_block: int) -> list[BetCandidate]:
+        """Read and price the qualifying transfers of one block range, without novelty checks."""
         addresses = set(self.config.bet_contract_addresses)
         candidates: list[BetCandidate] = []
 
-        candidates.extend(self._collect_native_candidates(from_block, to_block, addresses))
-        candidates.extend(self._collect_erc20_candidates(from_block, to_block, addresses))
+        candidates.extend(await self._collect_native_candidates(from_block, to_block, addresses))
+        candidates.extend(await self._collect_erc20_candidates(from_block, to_block, addresses))
 
         return candidates
 
-    def _collect_native_candidates(
+    async def _collect_native_candidates(
         self,
         from_block: int,
         to_block: int,
@@ -95,35 +329,41 @@ class MonitoringService:
         if not target_addresses:
             return []
 
-        native_price = self.pricing_client.get_usd_price(self.config.native_coingecko_id)
         candidates: list[BetCandidate] = []
 
-        for block_number in range(from_block, to_block + 1):
-            transfers = self.rpc_client.get_native_transfers(block_number, target_addresses)
-            timestamp = self._block_timestamp(block_number)
-            for transfer in transfers:
+        blocks = await self.rpc_client.get_native_transfers_range(from_block, to_block, target_addresses)
+        fetched_at = self.tracer.now()
+        await self._prepare_prices(block["timestamp"] for block in blocks if block["transfers"])
+
+        for block in blocks:
+            timestamp = block["timestamp"]
+            self._timestamp_cache.put(block["block_number"], timestamp)
+            for transfer in block["transfers"]:
                 amount = transfer["raw_amount"] / (10**18)
-                usd_value = amount * native_price
+                price = self._usd_price(self.config.native_coingecko_id, timestamp, transfer["tx_hash"])
+                if price is None:
+                    continue
+                usd_value = amount * price
                 if not self.evaluator.is_above_threshold(usd_value):
                     continue
 
-                candidates.append(
-                    BetCandidate(
-                        wallet_address=transfer["wallet_address"],
-                        tx_hash=transfer["tx_hash"],
-                        block_number=transfer["block_number"],
-                        timestamp=timestamp,
-                        contract_address=transfer["contract_address"],
-                        token_symbol=self.config.native_symbol,
-                        token_amount=amount,
-                        usd_value=usd_value,
-                        source="native_transfer",
-                    )
+                candidate = BetCandidate(
+                    wallet_address=transfer["wallet_address"],
+                    tx_hash=transfer["tx_hash"],
+                    block_number=transfer["block_number"],
+                    timestamp=timestamp,
+                    contract_address=transfer["contract_address"],
+                    token_symbol=self.config.native_symbol,
+                    token_amount=amount,
+                    usd_value=usd_value,
+                    source="native_transfer",
                 )
+                self.tracer.candidate_built(candidate, range_fetched_at=fetched_at)
+                candidates.append(candidate)
 
         return candidates
 
-    def _collect_erc20_candidates(
+    async def _collect_erc20_candidates(
         self,
         from_block: int,
         to_block: int,
@@ -132,99 +372,347 @@ class MonitoringService:
         if not self.config.token_contracts:
             return []
 
-        candidates: list[BetCandidate] = []
-
-        for token_symbol, token_address in self.config.token_contracts.items():
-            decimals = self.config.token_decimals.get(token_symbol, 18)
-            price_id = self.config.token_coingecko_ids.get(token_symbol, "")
-            price = self.pricing_client.get_usd_price(price_id) if price_id else 1.0
-
-            transfers = self.rpc_client.get_erc20_transfers(
-                token_address=token_address,
+        symbols_by_address = {address.lower(): symbol for symbol, address in self.config.token_contracts.items()}
+        transfers = self.head_stream.transfers(from_block, to_block) if self.head_stream is not None else None
+        if transfers is None:
+            transfers = await self.rpc_client.get_erc20_transfers(
+                token_addresses=symbols_by_address.keys(),
                 from_block=from_block,
                 to_block=to_block,
                 target_addresses=target_addresses,
             )
+        fetched_at = self.tracer.now()
+
+        transfer_timestamps: dict[int, int] = {}
+        if self._historical_pricing:
+            # Historical prices depend on the block, so every transfer needs its timestamp up front.
+            transfer_timestamps = await self._block_timestamps(transfer["block_number"] for transfer in transfers)
+            await self._prepare_prices(transfer_timestamps.values())
+
+        qualifying: list[tuple[dict, str, float, float]] = []
+        for transfer in transfers:
+            token_symbol = symbols_by_address.get(transfer["token_address"])
+            if token_symbol is None:
+                continue
 
-            for transfer in transfers:
-                amount = transfer["raw_amount"] / (10**decimals)
-                usd_value = amount * price
-                if not self.evaluator.is_above_threshold(usd_value):
-                    continue
+            decimals = self.config.token_decimals.get(token_symbol, 18)
+            amount = transfer["raw_amount"] / (10**decimals)
+            price_id = self.config.token_coingecko_ids.get(token_symbol, "")
+            price = self._usd_price(price_id, transfer_timestamps.get(transfer["block_number"]), transfer["tx_hash"])
+            if price is None:
+                continue
+            usd_value = amount * price
+            if self.evaluator.is_above_threshold(usd_value):
+                qualifying.append((transfer, token_symbol, amount, usd_value))
 
-                block_number = transfer["block_number"]
-                candidates.append(
-                    BetCandidate(
-                        wallet_address=transfer["wallet_address"],
-                        tx_hash=transfer["tx_hash"],
-                        block_number=block_number,
-                        timestamp=self._block_timestamp(block_number),
-                        contract_address=transfer["contract_address"],
-                        token_symbol=token_symbol,
-                        token_amount=amount,
-                        usd_value=usd_value,
-                        source="erc20_transfer",
-                    )
-                )
+        timestamps = await self._block_timestamps(transfer["block_number"] for transfer, *_ in qualifying)
+
+        candidates: list[BetCandidate] = []
+        for transfer, token_symbol, amount, usd_value in qualifying:
+            block_number = transfer["block_number"]
+            candidate = BetCandidate(
+                wallet_address=transfer["wallet_address"],
+                tx_hash=transfer["tx_hash"],
+                block_number=block_number,
+                timestamp=timestamps[block_number],
+                contract_address=transfer["contract_address"],
+                token_symbol=token_symbol,
+                token_amount=amount,
+                usd_value=usd_value,
+                source="erc20_transfer",
+            )
+            self.tracer.candidate_built(candidate, range_fetched_at=fetched_at)
+            candidates.append(candidate)
 
         return candidates
 
-    def _evaluate_and_alert(self, candidates: Iterable[BetCandidate]) -> None:
+    async def _prefetch_wallet_tx_counts(self, candidates: Iterable[BetCandidate], block_number: int) -> dict[str, int]:
+        """With the ``rpc`` novelty backend, resolve every wallet of a range in one nonce batch."""
+        if self.config.novelty_backend != "rpc":
+            return {}
+
+        wallets = {candidate.wallet_address.lower() for candidate in candidates}
+        if not wallets:
+            return {}
+
+        try:
+            return await self.rpc_client.get_transaction_counts(wallets, block_number)
+        except Exception:
+            # Without prefetched counts the enrich stage falls back to the explorer per candidate.
+            self.logger.warning(
+                "Batched RPC nonce lookup failed; falling back to explorer",
+                extra={"wallet_count": len(wallets), "block_number": block_number},
+                exc_info=True,
+            )
+            return {}
+
+    async def _wallet_tx_count(self, item: _WorkItem) -> int:
+        wallet_address = item.candidate.wallet_address
+        cached = self.explorer_client.cached_transaction_count(wallet_address)
+        if cached is not None:
+            return cached
+        # Cache misses are the only lookups that spend explorer quota. One token buys one request:
+        # a failure parks the candidate, and its retry queues for a token in the retry lane.
+        await self.explorer_quota.acquire(usd_value=item.candidate.usd_value, retry=item.retry)
+        return await asyncio.to_thread(self.explorer_client.get_transaction_count, wallet_address, attempts=1)
+
+    def _fresh_candidates(self, candidates: Iterable[BetCandidate]) -> list[BetCandidate]:
+        fresh: dict[tuple[str, str, str, str], BetCandidate] = {}
         for candidate in candidates:
-            if candidate.dedup_key in self._seen_event_keys or candidate.dedup_key in self._pending_candidates:
+            key = candidate.dedup_key
+            if (
+                key in self._seen_event_keys
+                or key in self._pending_candidates
+                or key in self._in_flight
+                or key in fresh
+            ):
                 continue
-            self._process_candidate(candidate)
+            fresh[key] = candidate
+        return list(fresh.values())
 
-    def _retry_pending_candidates(self) -> None:
-        if not self._pending_candidates:
+    async def evaluate_and_alert(
+        self,
+        candidates: Iterable[BetCandidate],
+        *,
+        block_number: int | None = None,
+    ) -> None:
+        """Push candidates through the enrich and notify stages and wait until each is committed."""
+        async with self._pipeline():
+            fresh = self._fresh_candidates(candidates)
+            tx_counts = await self._prefetch_wallet_tx_counts(fresh, block_number) if block_number is not None else {}
+            batch = CommitBatch(len(fresh))
+            await self._stages.wait_for(self._dispatch(fresh, batch, tx_counts))
+            await self._stages.wait_for(batch.wait())
+
+    async def _retry_pending_candidates(self) -> None:
+        """Retry every pending candidate now, ignoring their backoff."""
+        async with self._pipeline():
+            batch = await self._stages.wait_for(self._dispatch_pending(due_only=False))
+            await self._stages.wait_for(batch.wait())
+
+    async def _dispatch_pending(self, *, due_only: bool = True) -> CommitBatch:
+        retry = [
+            candidate
+            for key, candidate in self._pending_candidates.items()
+            if key not in self._in_flight and (not due_only or self._retry_backoff.due(key))
+        ]
+        batch = CommitBatch(len(retry))
+        if retry:
+            self.logger.info(
+                "Retrying pending candidates",
+                extra={"retry_count": len(retry), "pending_count": len(self._pending_candidates)},
+            )
+            await self._dispatch(retry, batch, {}, retry=True)
+        return batch
+
+    async def _dispatch(
+        self,
+        candidates: list[BetCandidate],
+        batch: CommitBatch,
+        tx_counts: dict[str, int],
+        *,
+        retry: bool = False,
+    ) -> None:
+        if batch.complete:
+            if batch.to_block is not None:
+                await self._on_batch_committed(batch)
             return
 
-        self.logger.info("Retrying pending candidates", extra={"pending_count": len(self._pending_candidates)})
-        for candidate in list(self._pending_candidates.values()):
-            self._process_candidate(candidate)
+        for candidate in sorted(candidates, key=lambda item: item.block_number):
+            wallet = candidate.wallet_address.lower()
+            self._in_flight.add(candidate.dedup_key)
+            await self._enrich_queue.put(wallet, _WorkItem(candidate, batch, tx_counts.get(wallet), retry))
 
-    def _process_candidate(self, candidate: BetCandidate) -> None:
+    async def _enrich_stage(self, queue: asyncio.Queue[_WorkItem]) -> None:
+        while True:
+            item = await queue.get()
+            try:
+                await self._enrich(item)
+            finally:
+                queue.task_done()
+
+    async def _enrich(self, item: _WorkItem) -> None:
+        candidate = item.candidate
         try:
-            wallet_tx_count = self.explorer_client.get_transaction_count(candidate.wallet_address)
+            if item.wallet_tx_count is None:
+                item.wallet_tx_count = await self._wallet_tx_count(item)
+        except CircuitOpenError as exc:
+            self.logger.warning(
+                "Wallet novelty check skipped; circuit open",
+                extra={"breaker": exc.name, "retry_in_seconds": round(exc.retry_in_seconds, 1)},
+            )
+            await self._commit(item, pending=True)
+            return
         except Exception:
-            self._pending_candidates[candidate.dedup_key] = candidate
             self.logger.error(
                 "Failed wallet novelty check",
                 extra={"wallet_address": candidate.wallet_address, "tx_hash": candidate.tx_hash},
                 exc_info=True,
             )
+            await self._commit(item, pending=True)
             return
 
-        if not self.evaluator.is_new_wallet(wallet_tx_count):
-            self._pending_candidates.pop(candidate.dedup_key, None)
-            self._seen_event_keys.add(candidate.dedup_key)
+        self.tracer.novelty_resolved(candidate)
+        if not self.evaluator.is_new_wallet(item.wallet_tx_count):
+            self.tracer.discard(candidate)
+            await self._commit(item, pending=False)
             return
+        await self._notify_queue.put(candidate.wallet_address.lower(), item)
 
-        message = self._format_alert_message(candidate, wallet_tx_count)
+    async def _notify_stage(self, queue: asyncio.Queue[_WorkItem]) -> None:
+        while True:
+            item = await queue.get()
+            try:
+                await self._notify(item)
+            finally:
+                queue.task_done()
+
+    async def _notify(self, item: _WorkItem) -> None:
+        message = self._format_alert_message(item.candidate, item.wallet_tx_count)
+        if not asyncio.iscoroutinefunction(self.notifier.send_message):
+            await self._deliver(item, message)
+            return
+        # Queued notifiers acknowledge when the message is out; the stage moves on meanwhile so a
+        # throttled chat never holds up extraction. The range stays open until the ack commits it.
+        delivery = asyncio.create_task(self._deliver(item, message))
+        self._deliveries.add(delivery)
+        delivery.add_done_callback(self._on_delivery_done)
+
+    def _on_delivery_done(self, delivery: asyncio.Task[None]) -> None:
+        self._deliveries.discard(delivery)
+        if not delivery.cancelled() and delivery.exception() is not None:
+            self.logger.error("Alert delivery task failed", exc_info=delivery.exception())
+
+    async def _deliver(self, item: _WorkItem, message: str) -> None:
+        candidate = item.candidate
         try:
-            self.notifier.send_message(message)
-            self._pending_candidates.pop(candidate.dedup_key, None)
-            self._seen_event_keys.add(candidate.dedup_key)
+            if asyncio.iscoroutinefunction(self.notifier.send_message):
+                await self.notifier.send_message(message)
+            else:
+                await asyncio.to_thread(self.notifier.send_message, message)
+        except CircuitOpenError as exc:
+            self.logger.warning(
+                "Alert deferred; circuit open",
+                extra={"breaker": exc.name, "retry_in_seconds": round(exc.retry_in_seconds, 1)},
+            )
+            await self._commit(item, pending=True)
+            return
+        except Exception:
+            self.logger.error("Failed to send alert", exc_info=True)
+            await self._commit(item, pending=True)
+            return
+
+        metrics.ALERTS_SENT.inc()
+        self.tracer.acknowledged(candidate)
+        self.logger.info(
+            "Alert sent",
+            extra={
+                "tx_hash": candidate.tx_hash,
+                "wallet_address": candidate.wallet_address,
+                "usd_value": round(candidate.usd_value, 2),
+            },
+        )
+        await self._commit(item, pending=False)
+
+    async def _commit(self, item: _WorkItem, *, pending: bool) -> None:
+        candidate = item.candidate
+        key = candidate.dedup_key
+        if pending:
+            self._pending_candidates[key] = candidate
+            self._retry_backoff.failed(key)
+        else:
+            self._pending_candidates.pop(key, None)
+            self._retry_backoff.clear(key)
+            self._seen_event_keys.add(key, candidate.block_number)
+        self._in_flight.discard(key)
+        if item.batch.commit_one():
+            await self._on_batch_committed(item.batch)
+
+    async def _on_batch_committed(self, batch: CommitBatch) -> None:
+        """Advance the checkpoint over every leading range whose candidates are all committed."""
+        async with self._commit_lock:
+            if batch.to_block is None:
+                # Retry sweeps have no range; persist so resolved pending candidates stay resolved.
+                if self._checkpoint is not None and self.state_store is not None:
+                    await self._persist_state(self._checkpoint)
+                return
+
+            completed: list[CommitBatch] = []
+            while self._open_ranges and self._open_ranges[0].complete:
+                completed.append(self._open_ranges.popleft())
+            if not completed:
+                return
+
+            from_block = completed[0].from_block
+            self._checkpoint = completed[-1].to_block
+            self._checkpoint_timestamp = completed[-1].to_timestamp
+            self._record_throughput(self._checkpoint - from_block + 1)
+            # Reorgs inside the confirmation window can only touch blocks above this mark.
+            self._timestamp_cache.prune_below(self._checkpoint - self.config.block_confirmations)
+            self._seen_event_keys.prune(self._checkpoint)
+            self.tracer.prune(self._checkpoint, keep=self._pending_candidates)
+            await self._persist_state(self._checkpoint)
             self.logger.info(
-                "Alert sent",
+                "Processed block range",
                 extra={
-                    "tx_hash": candidate.tx_hash,
-                    "wallet_address": candidate.wallet_address,
-                    "usd_value": round(candidate.usd_value, 2),
+                    "from_block": from_block,
+                    "to_block": self._checkpoint,
+                    "dedup_size": len(self._seen_event_keys),
+                    "lag_blocks": self.scheduler.lag_blocks,
+                    "queue_depths": self.queue_depths(),
                 },
             )
-        except Exception:
-            self._pending_candidates[candidate.dedup_key] = candidate
-            self.logger.error("Failed to send alert", exc_info=True)
 
-    def _block_timestamp(self, block_number: int) -> int:
-        cached = self._timestamp_cache.get(block_number)
-        if cached is not None:
-            return cached
+    def _record_throughput(self, block_count: int) -> None:
+        metrics.BLOCKS_PROCESSED.inc(amount=block_count)
+        now = time.monotonic()
+        self._throughput.append((now, self._checkpoint))
+        while len(self._throughput) > 2 and now - self._throughput[1][0] > THROUGHPUT_WINDOW_SECONDS:
+            self._throughput.popleft()
+
+    @property
+    def _historical_pricing(self) -> bool:
+        return self.config.pricing_mode == "historical"
 
-        timestamp = self.rpc_client.get_block_timestamp(block_number)
-        self._timestamp_cache[block_number] = timestamp
-        return timestamp
+    async def _prepare_prices(self, timestamps: Iterable[int]) -> None:
+        if not self._historical_pricing:
+            return
+        timestamps = list(timestamps)
+        if timestamps:
+            await self.pricing_client.prepare(min(timestamps), max(timestamps))
+
+    def _usd_price(self, asset_id: str, timestamp: int | None, tx_hash: str) -> float | None:
+        """USD price of ``asset_id``; ``None`` when history has no point near ``timestamp``."""
+        if not asset_id:
+            return 1.0
+        if not self._historical_pricing:
+            return self.pricing_client.get_usd_price(asset_id)
+        try:
+            return self.pricing_client.get_usd_price_at(asset_id, timestamp)
+        except StalePriceError:
+            # Refetching would not help: CoinGecko has no point near this block time.
+            self.logger.warning(
+                "Skipping transfer without a historical price",
+                extra={"asset_id": asset_id, "timestamp": timestamp, "tx_hash": tx_hash},
+                exc_info=True,
+            )
+            return None
+
+    async def _block_timestamps(self, block_numbers: Iterable[int]) -> dict[int, int]:
+        timestamps: dict[int, int] = {}
+        missing: set[int] = set()
+        for block_number in block_numbers:
+            cached = self._timestamp_cache.get(block_number)
+            if cached is None:
+                missing.add(block_number)
+            else:
+                timestamps[block_number] = cached
+
+        if missing:
+            fetched = await self.rpc_client.get_block_timestamps(missing)
+            self._timestamp_cache.update(fetched)
+            timestamps.update(fetched)
+        return timestamps
 
     @staticmethod
     def _format_alert_message(candidate: BetCandidate, wallet_tx_count: int) -> str:
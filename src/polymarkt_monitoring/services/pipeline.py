@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import zlib
+from collections.abc import Awaitable, Coroutine
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class CommitBatch:
+    """Counts the candidates of one block range (or retry sweep) until each has been committed.
+
+    A candidate is committed once its outcome is durable in memory: alerted, rejected as an
+    old wallet, or parked in the pending set for a later retry.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        *,
+        from_block: int | None = None,
+        to_block: int | None = None,
+        to_timestamp: int | None = None,
+    ) -> None:
+        if count < 0:
+            raise ValueError("count must be >= 0")
+        self.from_block = from_block
+        self.to_block = to_block
+        self.to_timestamp = to_timestamp
+        self.remaining = count
+        self._done = asyncio.Event()
+        if count == 0:
+            self._done.set()
+
+    @property
+    def complete(self) -> bool:
+        return self.remaining == 0
+
+    def commit_one(self) -> bool:
+        """Record one committed candidate; returns True when this completes the batch."""
+        if self.remaining == 0:
+            raise RuntimeError("batch is already complete")
+        self.remaining -= 1
+        if self.remaining == 0:
+            self._done.set()
+            return True
+        return False
+
+    async def wait(self) -> None:
+        await self._done.wait()
+
+
+class ShardedQueue(Generic[T]):
+    """Bounded queues with one consumer each; items with the same key always use the same shard.
+
+    Routing by key keeps per-key FIFO order across the whole stage while different keys
+    proceed in parallel, and a full shard makes producers wait (backpressure).
+    """
+
+    def __init__(self, *, shards: int, maxsize: int) -> None:
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        self.queues: list[asyncio.Queue[T]] = [asyncio.Queue(maxsize=maxsize) for _ in range(shards)]
+
+    def shard_for(self, key: str) -> int:
+        # crc32 rather than hash(): stable across processes, so routing is reproducible.
+        return zlib.crc32(key.encode()) % len(self.queues)
+
+    async def put(self, key: str, item: T) -> None:
+        await self.queues[self.shard_for(key)].put(item)
+
+    def qsize(self) -> int:
+        return sum(queue.qsize() for queue in self.queues)
+
+    async def join(self) -> None:
+        for queue in self.queues:
+            await queue.join()
+
+
+class StageGroup:
+    """Long-running stage tasks that are expected to run until stopped.
+
+    ``wait_for`` lets the supervising coroutine await something (a queue put, a drain)
+    while surfacing the first stage crash instead of hanging on a dead consumer.
+    """
+
+    def __init__(self, *, logger: logging.Logger | None = None) -> None:
+        self.logger = logger or logging.getLogger(__name__)
+        self._tasks: dict[asyncio.Task[Any], str] = {}
+
+    def start(self, name: str, coroutine: Coroutine[Any, Any, None]) -> None:
+        self._tasks[asyncio.create_task(coroutine, name=name)] = name
+
+    def raise_if_failed(self) -> None:
+        for task, name in self._tasks.items():
+            if not task.done():
+                continue
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+            raise RuntimeError(f"Pipeline stage {name} stopped unexpectedly")
+
+    async def wait_for(self, awaitable: Awaitable[T]) -> T:
+        waiter = asyncio.ensure_future(awaitable)
+        try:
+            while not waiter.done():
+                await asyncio.wait({waiter, *self._tasks}, return_when=asyncio.FIRST_COMPLETED)
+                if not waiter.done():
+                    self.raise_if_failed()
+            return waiter.result()
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        results = await asyncio.gather(*self._tasks, return_exceptions=True)
+        for name, result in zip(self._tasks.values(), results):
+            if isinstance(result, Exception):
+                self.logger.debug("Pipeline stage exited with error", extra={"stage": name}, exc_info=result)
+        self._tasks.clear()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import itertools
+import logging
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+from polymarkt_monitoring.breaker import CircuitOpenError
+from polymarkt_monitoring.ratelimit import TokenBucket
+
+SECONDS_PER_DAY = 86_400
+FRESH_LANE = 0
+RETRY_LANE = 1
+
+
+@dataclass(slots=True)
+class _Waiter:
+    lane: int
+    usd_value: float
+    sequence: int
+    wakeup: asyncio.Future[None] | None = None
+
+    def priority(self) -> tuple[int, float, int]:
+        return (self.lane, -self.usd_value, self.sequence)
+
+
+class ExplorerQuota:
+    """Hands out explorer calls within the API key's per-second rate and daily cap.
+
+    Waiting callers are served by lane, then by USD value: fresh candidates before pending
+    retries, bigger bets before smaller ones, arrival order on ties. Only the front waiter
+    watches the token bucket; the rest wait their turn, so a higher-priority arrival simply
+    takes the front. Once the daily cap is spent ``acquire`` raises ``CircuitOpenError`` until
+    the next UTC day, which callers already treat as "park and retry later".
+    """
+
+    def __init__(
+        self,
+        *,
+        calls_per_second: float,
+        daily_limit: int = 0,
+        clock: Callable[[], float] = time.time,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if daily_limit < 0:
+            raise ValueError("daily_limit must be >= 0")
+
+        # Capacity 1 spaces calls evenly; a burst would let two windows' worth land in one second.
+        self._bucket = TokenBucket(rate=calls_per_second, capacity=1, clock=clock)
+        self.daily_limit = daily_limit
+        self.used_today = 0
+        self.logger = logger or logging.getLogger(__name__)
+        self._clock = clock
+        self._day = self._today()
+        self._exhausted_day: int | None = None
+        self._waiting: list[_Waiter] = []
+        self._sequence = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiting)
+
+    @property
+    def remaining_today(self) -> int | None:
+        """Calls left in the current UTC day, or ``None`` without a daily cap."""
+        if not self.daily_limit:
+            return None
+        self._roll_day()
+        return max(0, self.daily_limit - self.used_today)
+
+    async def acquire(self, *, usd_value: float, retry: bool = False) -> None:
+        """Wait for one explorer call; the caller is expected to make exactly one request."""
+        self._raise_if_exhausted()
+        waiter = _Waiter(RETRY_LANE if retry else FRESH_LANE, usd_value, next(self._sequence))
+        bisect.insort(self._waiting, waiter, key=_Waiter.priority)
+        try:
+            while True:
+                if self._waiting[0] is waiter:
+                    delay = self._bucket.delay()
+                    if delay <= 0:
+                        break
+                    await asyncio.sleep(delay)
+                else:
+                    waiter.wakeup = asyncio.get_running_loop().create_future()
+                    await waiter.wakeup
+            # The day may have rolled over or run out while this caller waited.
+            self._raise_if_exhausted()
+            self._bucket.try_acquire()
+            self.used_today += 1
+        finally:
+            self._waiting.remove(waiter)
+            if self._waiting:
+                front = self._waiting[0].wakeup
+                if front is not None and not front.done():
+                    front.set_result(None)
+
+    def _today(self) -> int:
+        return int(self._clock() // SECONDS_PER_DAY)
+
+    def _roll_day(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self.used_today = 0
+
+    def _raise_if_exhausted(self) -> None:
+        self._roll_day()
+        if not self.daily_limit or self.used_today < self.daily_limit:
+            return
+        if self._exhausted_day != self._day:
+            self._exhausted_day = self._day
+            self.logger.warning("Explorer daily quota exhausted", extra={"daily_limit": self.daily_limit})
+        retry_in_seconds = (self._day + 1) * SECONDS_PER_DAY - self._clock()
+        raise CircuitOpenError("explorer daily quota", retry_in_seconds)
+
+
+class RetryBackoff:
+    """Per-key exponential backoff: each consecutive failure doubles the wait before the next retry."""
+
+    def __init__(
+        self,
+        *,
+        base_seconds: float,
+        max_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 <= base_seconds <= max_seconds:
+            raise ValueError("delays must satisfy 0 <= base_seconds <= max_seconds")
+
+        self.base_seconds = base_seconds
+        self.max_seconds = max_seconds
+        self._clock = clock
+        # key -> (consecutive failures, retry not before)
+        self._entries: dict[Hashable, tuple[int, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def due(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is None or self._clock() >= entry[1]
+
+    def failed(self, key: Hashable) -> float:
+        """Record a failure and return seconds until ``key`` is due again."""
+        failures = self._entries.get(key, (0, 0.0))[0] + 1
+        delay = min(self.max_seconds, self.base_seconds * 2 ** (failures - 1))
+        self._entries[key] = (failures, self._clock() + delay)
+        return delay
+
+    def clear(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable
+
+
+class PollScheduler:
+    """Chooses how long to sleep between head polls and how many blocks to take per range.
+
+    Block cadence comes from header timestamps of recently processed blocks. The next wake-up
+    is when the block that confirms the next unprocessed block should exist; polls that still
+    find nothing back off towards ``max_interval_seconds``. Ranges widen while far behind head,
+    so a backlog is cleared in roughly ``catch_up_cycles`` ranges, and return to
+    ``base_range_blocks`` near head.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval_seconds: float,
+        max_interval_seconds: float,
+        base_range_blocks: int,
+        max_range_blocks: int,
+        catch_up_cycles: int = 4,
+        sample_size: int = 64,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if not 0 < min_interval_seconds <= max_interval_seconds:
+            raise ValueError("intervals must satisfy 0 < min_interval_seconds <= max_interval_seconds")
+        if not 1 <= base_range_blocks <= max_range_blocks:
+            raise ValueError("ranges must satisfy 1 <= base_range_blocks <= max_range_blocks")
+
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max_interval_seconds
+        self.base_range_blocks = base_range_blocks
+        self.max_range_blocks = max_range_blocks
+        self.catch_up_cycles = catch_up_cycles
+        self.lag_blocks = 0
+        self.next_wake_at: float | None = None
+        self.empty_polls = 0
+        self._clock = clock
+        # (block number, header timestamp), ascending by block number.
+        self._samples: deque[tuple[int, int]] = deque(maxlen=sample_size)
+
+    def observe_block(self, block_number: int, timestamp: int) -> None:
+        if self._samples and block_number <= self._samples[-1][0]:
+            return
+        self._samples.append((block_number, timestamp))
+
+    @property
+    def block_time_seconds(self) -> float | None:
+        if len(self._samples) < 2:
+            return None
+        (first_block, first_time), (last_block, last_time) = self._samples[0], self._samples[-1]
+        if last_time <= first_time:
+            return None
+        return (last_time - first_time) / (last_block - first_block)
+
+    def observe_head(self, latest_confirmed: int, scheduled_block: int) -> None:
+        self.lag_blocks = max(0, latest_confirmed - scheduled_block)
+        if self.lag_blocks:
+            self.empty_polls = 0
+
+    def range_blocks(self) -> int:
+        """Blocks to take in the next range given the current lag."""
+        if self.lag_blocks <= self.base_range_blocks:
+            return max(1, self.lag_blocks)
+        return min(self.max_range_blocks, max(self.base_range_blocks, -(-self.lag_blocks // self.catch_up_cycles)))
+
+    def next_delay(self, *, scheduled_block: int, confirmations: int) -> float:
+        """Seconds to sleep after a poll found no new confirmed block."""
+        self.empty_polls += 1
+        backoff = min(self.max_interval_seconds, self.min_interval_seconds * 2 ** (self.empty_polls - 1))
+        delay = backoff
+        block_time = self.block_time_seconds
+        if block_time is not None:
+            last_block, last_time = self._samples[-1]
+            # Head that confirms scheduled_block + 1, projected from the newest known header.
+            needed_head = scheduled_block + 1 + confirmations
+            expected_at = last_time + (needed_head - last_block) * block_time
+            delay = max(backoff, expected_at - self._clock())
+        delay = min(self.max_interval_seconds, delay)
+        self.next_wake_at = self._clock() + delay
+        return delay
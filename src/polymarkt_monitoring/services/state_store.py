@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from polymarkt_monitoring.models import BetCandidate
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoint (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pending_candidates (
+    dedup_key TEXT PRIMARY KEY,
+    block_number INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dedup_keys (
+    digest BLOB PRIMARY KEY,
+    block_number INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dedup_keys_block_number ON dedup_keys (block_number);
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class StoredState:
+    checkpoint: int | None
+    pending_candidates: list[BetCandidate]
+    dedup_keys: list[tuple[bytes, int]]
+
+
+class SqliteStateStore:
+    """Checkpoint, pending candidates and recent dedup keys in a WAL-mode SQLite file.
+
+    Each ``commit_range`` call is a single transaction, and the ``*_async`` variants run
+    on a worker thread so the event loop never waits on disk.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL only fsyncs at checkpoints; a crash can lose the last commit but never corrupts.
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def load(self) -> StoredState:
+        with self._lock:
+            row = self._connection.execute("SELECT block_number FROM checkpoint WHERE id = 1").fetchone()
+            pending_rows = self._connection.execute(
+                "SELECT payload FROM pending_candidates ORDER BY block_number"
+            ).fetchall()
+            dedup_rows = self._connection.execute("SELECT digest, block_number FROM dedup_keys").fetchall()
+
+        return StoredState(
+            checkpoint=row[0] if row else None,
+            pending_candidates=[BetCandidate(**json.loads(payload)) for (payload,) in pending_rows],
+            dedup_keys=[(bytes(digest), block_number) for digest, block_number in dedup_rows],
+        )
+
+    def commit_range(
+        self,
+        *,
+        checkpoint: int,
+        pending_candidates: Iterable[BetCandidate],
+        new_dedup_keys: Iterable[tuple[bytes, int]],
+        dedup_low_water: int,
+    ) -> None:
+        pending_rows = [
+            (json.dumps(list(candidate.dedup_key)), candidate.block_number, json.dumps(asdict(candidate)))
+            for candidate in pending_candidates
+        ]
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT INTO checkpoint (id, block_number) VALUES (1, ?) "
+                    "ON CONFLICT (id) DO UPDATE SET block_number = excluded.block_number",
+                    (checkpoint,),
+                )
+                connection.execute("DELETE FROM pending_candidates")
+                connection.executemany(
+                    "INSERT INTO pending_candidates (dedup_key, block_number, payload) VALUES (?, ?, ?)",
+                    pending_rows,
+                )
+                connection.executemany(
+                    "INSERT OR IGNORE INTO dedup_keys (digest, block_number) VALUES (?, ?)",
+                    list(new_dedup_keys),
+                )
+                connection.execute("DELETE FROM dedup_keys WHERE block_number < ?", (dedup_low_water,))
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    async def load_async(self) -> StoredState:
+        return await asyncio.to_thread(self.load)
+
+    async def commit_range_async(
+        self,
+        *,
+        checkpoint: int,
+        pending_candidates: Iterable[BetCandidate],
+        new_dedup_keys: Iterable[tuple[bytes, int]],
+        dedup_low_water: int,
+    ) -> None:
+        # Materialise inputs on the loop thread so the worker never sees them mutate.
+        await asyncio.to_thread(
+            self.commit_range,
+            checkpoint=checkpoint,
+            pending_candidates=list(pending_candidates),
+            new_dedup_keys=list(new_dedup_keys),
+            dedup_low_water=dedup_low_water,
+        )
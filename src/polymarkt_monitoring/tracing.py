@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Container, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+from polymarkt_monitoring import metrics
+from polymarkt_monitoring.models import BetCandidate
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - import depends on runtime environment
+    aiohttp = None
+
+# Stage name -> (start mark, end mark) on an ``AlertTrace``.
+STAGES = {
+    "confirmation": ("block_timestamp", "confirmed_at"),
+    "fetch": ("confirmed_at", "range_fetched_at"),
+    "extract": ("range_fetched_at", "candidate_built_at"),
+    "novelty": ("candidate_built_at", "novelty_resolved_at"),
+    "notify": ("novelty_resolved_at", "acknowledged_at"),
+}
+LATENCY_BUCKETS = (1.0, 2.0, 5.0, 10.0, 15.0, 20.0, 30.0, 45.0, 60.0, 90.0, 120.0, 300.0, 600.0)
+
+ALERT_LATENCY = metrics.REGISTRY.histogram(
+    "polymarkt_alert_latency_seconds",
+    "Block timestamp to notifier acknowledgement, per alert.",
+    buckets=LATENCY_BUCKETS,
+)
+STAGE_LATENCY = metrics.REGISTRY.histogram(
+    "polymarkt_alert_stage_duration_seconds",
+    "Time each alert spent per pipeline stage.",
+    ("stage",),
+    buckets=LATENCY_BUCKETS,
+)
+
+
+@dataclass(slots=True)
+class AlertTrace:
+    """Unix-time marks of one candidate on its way from block to alert; ``None`` when not observed."""
+
+    tx_hash: str
+    wallet_address: str
+    block_number: int
+    usd_value: float
+    block_timestamp: float
+    confirmed_at: float | None
+    range_fetched_at: float | None
+    candidate_built_at: float
+    novelty_resolved_at: float | None = None
+    acknowledged_at: float | None = None
+
+    def stage_seconds(self) -> dict[str, float | None]:
+        durations: dict[str, float | None] = {}
+        for stage, (start, end) in STAGES.items():
+            started, ended = getattr(self, start), getattr(self, end)
+            durations[stage] = None if started is None or ended is None else max(0.0, ended - started)
+        return durations
+
+    @property
+    def total_seconds(self) -> float | None:
+        if self.acknowledged_at is None:
+            return None
+        return max(0.0, self.acknowledged_at - self.block_timestamp)
+
+    def to_record(self) -> dict[str, Any]:
+        return {
+            "tx_hash": self.tx_hash,
+            "wallet_address": self.wallet_address,
+            "block_number": self.block_number,
+            "usd_value": round(self.usd_value, 2),
+            "marks": {
+                "block_timestamp": self.block_timestamp,
+                "confirmed_at": self.confirmed_at,
+                "range_fetched_at": self.range_fetched_at,
+                "candidate_built_at": self.candidate_built_at,
+                "novelty_resolved_at": self.novelty_resolved_at,
+                "acknowledged_at": self.acknowledged_at,
+            },
+            "stage_seconds": {
+                stage: None if seconds is None else round(seconds, 3) for stage, seconds in self.stage_seconds().items()
+            },
+            "total_seconds": None if self.total_seconds is None else round(self.total_seconds, 3),
+        }
+
+
+class TraceExporter(Protocol):
+    async def export(self, trace: AlertTrace) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class JsonlTraceExporter:
+    """Appends one JSON object per acknowledged alert to ``path``."""
+
+    def __init__(self, *, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    async def export(self, trace: AlertTrace) -> None:
+        await asyncio.to_thread(self._write, json.dumps(trace.to_record(), separators=(",", ":")))
+
+    async def close(self) -> None:
+        return None
+
+    def _write(self, line: str) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+
+
+class OtlpHttpTraceExporter:
+    """Posts each alert as OTLP/HTTP JSON: an ``alert`` root span with one child span per stage.
+
+    ``endpoint`` is the collector's traces URL, e.g. ``http://localhost:4318/v1/traces``.
+    """
+
+    def __init__(
+        self,
+        *,
+        endpoint: str,
+        service_name: str = "polymarkt-monitor",
+        request_timeout: float = 5.0,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required. Install dependencies with `pip install -e .`.")
+
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.request_timeout = request_timeout
+        self.logger = logger or logging.getLogger(__name__)
+        self._session: aiohttp.ClientSession | None = None
+
+    async def export(self, trace: AlertTrace) -> None:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.request_timeout))
+        async with self._session.post(self.endpoint, json=self.payload(trace)) as response:
+            response.raise_for_status()
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def payload(self, trace: AlertTrace) -> dict[str, Any]:
+        trace_id = os.urandom(16).hex()
+        root_id = os.urandom(8).hex()
+        attributes = [
+            _attribute("tx_hash", trace.tx_hash),
+            _attribute("wallet_address", trace.wallet_address),
+            _attribute("block_number", trace.block_number),
+            _attribute("usd_value", trace.usd_value),
+        ]
+        spans = [_span(trace_id, root_id, None, "alert", trace.block_timestamp, trace.acknowledged_at, attributes)]
+        for stage, (start, end) in STAGES.items():
+            started, ended = getattr(trace, start), getattr(trace, end)
+            if started is not None and ended is not None:
+                spans.append(_span(trace_id, os.urandom(8).hex(), root_id, stage, started, ended, []))
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_attribute("service.name", self.service_name)]},
+                    "scopeSpans": [{"scope": {"name": "polymarkt_monitoring"}, "spans": spans}],
+                }
+            ]
+        }
+
+
+class AlertTracer:
+    """Collects per-candidate stage marks and exports a trace once the alert is acknowledged.
+
+    The monitor reports each mark as it happens; traces of candidates that turn out to be old
+    wallets are dropped. Every finished trace also feeds the alert latency histograms, so
+    end-to-end latency is visible in ``/metrics`` even without an exporter. Exports run in
+    the background and never hold up the pipeline; a failing exporter is only logged.
+    """
+
+    def __init__(
+        self,
+        *,
+        exporters: Iterable[TraceExporter] = (),
+        clock: Callable[[], float] = time.time,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.exporters = list(exporters)
+        self.logger = logger or logging.getLogger(__name__)
+        self._clock = clock
+        self._traces: dict[tuple[str, str, str, str], AlertTrace] = {}
+        # Ascending (confirmed head, first time it was seen), to date each block's confirmation.
+        self._confirmed_blocks: list[int] = []
+        self._confirmed_times: list[float] = []
+        self._exports: set[asyncio.Task[None]] = set()
+
+    async def __aenter__(self) -> AlertTracer:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def __len__(self) -> int:
+        return len(self._traces)
+
+    def now(self) -> float:
+        return self._clock()
+
+    def observe_confirmed(self, latest_confirmed: int) -> None:
+        if self._confirmed_blocks and latest_confirmed <= self._confirmed_blocks[-1]:
+            return
+        self._confirmed_blocks.append(latest_confirmed)
+        self._confirmed_times.append(self._clock())
+
+    def confirmed_at(self, block_number: int) -> float | None:
+        index = bisect.bisect_left(self._confirmed_blocks, block_number)
+        return self._confirmed_times[index] if index < len(self._confirmed_times) else None
+
+    def candidate_built(self, candidate: BetCandidate, *, range_fetched_at: float | None) -> None:
+        key = candidate.dedup_key
+        if key in self._traces:
+            # A pending candidate seen again keeps the marks of its first pass.
+            return
+        self._traces[key] = AlertTrace(
+            tx_hash=candidate.tx_hash,
+            wallet_address=candidate.wallet_address,
+            block_number=candidate.block_number,
+            usd_value=candidate.usd_value,
+            block_timestamp=float(candidate.timestamp),
+            confirmed_at=self.confirmed_at(candidate.block_number),
+            range_fetched_at=range_fetched_at,
+            candidate_built_at=self._clock(),
+        )
+
+    def novelty_resolved(self, candidate: BetCandidate) -> None:
+        trace = self._traces.get(candidate.dedup_key)
+        if trace is not None and trace.novelty_resolved_at is None:
+            trace.novelty_resolved_at = self._clock()
+
+    def discard(self, candidate: BetCandidate) -> None:
+        self._traces.pop(candidate.dedup_key, None)
+
+    def acknowledged(self, candidate: BetCandidate) -> AlertTrace | None:
+        trace = self._traces.pop(candidate.dedup_key, None)
+        if trace is None:
+            return None
+        trace.acknowledged_at = self._clock()
+        ALERT_LATENCY.observe(trace.total_seconds)
+        for stage, seconds in trace.stage_seconds().items():
+            if seconds is not None:
+                STAGE_LATENCY.observe(seconds, stage)
+        for exporter in self.exporters:
+            export = asyncio.create_task(self._export(exporter, trace))
+            self._exports.add(export)
+            export.add_done_callback(self._exports.discard)
+        return trace
+
+    def prune(self, checkpoint: int, *, keep: Container[tuple[str, str, str, str]]) -> None:
+        """Forget traces of committed blocks that are not pending, and confirmation marks below them."""
+        for key in [key for key, trace in self._traces.items() if trace.block_number <= checkpoint and key not in keep]:
+            del self._traces[key]
+        index = bisect.bisect_left(self._confirmed_blocks, checkpoint)
+        del self._confirmed_blocks[:index]
+        del self._confirmed_times[:index]
+
+    async def close(self) -> None:
+        if self._exports:
+            await asyncio.gather(*self._exports, return_exceptions=True)
+        for exporter in self.exporters:
+            await exporter.close()
+
+    async def _export(self, exporter: TraceExporter, trace: AlertTrace) -> None:
+        try:
+            await exporter.export(trace)
+        except Exception:
+            self.logger.warning(
+                "Alert trace export failed",
+                extra={"exporter": type(exporter).__name__, "tx_hash": trace.tx_hash},
+                exc_info=True,
+            )
+
+
+def _attribute(key: str, value: str | int | float) -> dict[str, Any]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return {"key": key, "value": {"stringValue": str(value)}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    return {"key": key, "value": {"doubleValue": value}}
+
+
+def _span(
+    trace_id: str,
+    span_id: str,
+    parent_id: str | None,
+    name: str,
+    started: float,
+    ended: float,
+    attributes: list[dict[str, Any]],
+) -> dict[str, Any]:
+    span = {
+        "traceId": trace_id,
+        "spanId": span_id,
+        "name": name,
+        "kind": 1,
+        "startTimeUnixNano": str(int(started * 1e9)),
+        "endTimeUnixNano": str(int(max(started, ended) * 1e9)),
+        "attributes": attributes,
+    }
+    if parent_id is not None:
+        span["parentSpanId"] = parent_id
+    return span
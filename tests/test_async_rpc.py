@@ -0,0 +1,295 @@
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from polymarkt_monitoring.clients.async_rpc import AsyncRpcClient
+from polymarkt_monitoring.clients.rpc import _extract_native_transfers, _scan_native_transfers
+
+TARGET = "0x1111111111111111111111111111111111111111"
+WALLET = "0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
+USDC = "0x2222222222222222222222222222222222222222"
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+
+def build_transfer_log(token: str, block_number: int, recipient: str, amount: int) -> dict:
+    return {
+        "address": token,
+        "blockNumber": hex(block_number),
+        "transactionHash": f"0x{block_number:064x}",
+        "topics": [TRANSFER_TOPIC, "0x" + WALLET[2:].rjust(64, "0"), "0x" + recipient[2:].rjust(64, "0")],
+        "data": hex(amount),
+    }
+
+
+def build_block(number: int) -> dict:
+    return {
+        "number": hex(number),
+        "timestamp": hex(1700000000 + number),
+        "transactions": [
+            {"hash": f"0x{number:064x}", "from": WALLET, "to": TARGET, "value": hex(5 * 10**18)},
+            {"hash": "0x01", "from": WALLET, "to": "0x2222222222222222222222222222222222222222", "value": "0x1"},
+            {"hash": "0x02", "from": WALLET, "to": None, "value": "0x1"},
+        ],
+    }
+
+
+class FakeJsonRpcServer:
+    def __init__(
+        self,
+        *,
+        fail_first: int = 0,
+        flaky_blocks: set[int] | None = None,
+        max_log_range: int | None = None,
+        log_error: str = "",
+        head: int = 120,
+        latency: float = 0.0,
+    ) -> None:
+        self.fail_first = fail_first
+        self.head = head
+        self.latency = latency
+        self.max_log_range = max_log_range
+        self.log_error = log_error
+        self.flaky_blocks = set(flaky_blocks or ())
+        self.requests: list[dict] = []
+        app = web.Application()
+        app.router.add_post("/", self._handle)
+        self.server = TestServer(app)
+
+    @property
+    def url(self) -> str:
+        return str(self.server.make_url("/"))
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.requests.append(payload)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail_first > 0:
+            self.fail_first -= 1
+            return web.Response(status=503)
+        if isinstance(payload, list):
+            return web.json_response([self.respond(item) for item in payload])
+        if payload["method"] == "eth_getLogs" and self.log_error:
+            error = {"code": -32000, "message": self.log_error}
+            return web.json_response({"jsonrpc": "2.0", "id": payload["id"], "error": error}, status=400)
+        if payload["method"] == "eth_getLogs" and self.max_log_range is not None:
+            query = payload["params"][0]
+            if int(query["toBlock"], 16) - int(query["fromBlock"], 16) + 1 > self.max_log_range:
+                error = {"code": -32005, "message": f"block range too large, max {self.max_log_range}"}
+                return web.json_response({"jsonrpc": "2.0", "id": payload["id"], "error": error}, status=400)
+        return web.json_response(self.respond(payload))
+
+    def respond(self, payload: dict) -> dict:
+        if payload["method"] == "eth_getBlockByNumber":
+            number = int(payload["params"][0], 16)
+            if number in self.flaky_blocks:
+                self.flaky_blocks.discard(number)
+                return {"jsonrpc": "2.0", "id": payload["id"], "error": {"code": -32000, "message": "header not found"}}
+        return {"jsonrpc": "2.0", "id": payload["id"], "result": self.result(payload)}
+
+    def result(self, payload: dict):
+        method, params = payload["method"], payload["params"]
+        if method == "eth_blockNumber":
+            return hex(self.head)
+        if method == "eth_getBlockByNumber":
+            return build_block(int(params[0], 16))
+        if method == "eth_getTransactionCount":
+            return hex(int(params[0][-1], 16))
+        if method == "eth_getLogs":
+            return [build_transfer_log(USDC, int(params[0]["fromBlock"], 16), TARGET, 7_000_000_000)]
+        raise AssertionError(f"unexpected method {method}")
+
+
+class AsyncRpcClientTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.rpc = FakeJsonRpcServer()
+        await self.rpc.server.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.rpc.server.close()
+
+    async def test_reads_head_and_native_transfers(self) -> None:
+        async with AsyncRpcClient(rpc_urls=[self.rpc.url]) as client:
+            latest = await client.latest_block_number()
+            timestamp = await client.get_block_timestamp(7)
+            transfers = await client.get_native_transfers(7, {TARGET.upper().replace("0X", "0x")})
+
+        self.assertEqual(latest, 120)
+        self.assertEqual(timestamp, 1700000007)
+        self.assertEqual(len(transfers), 1)
+        self.assertEqual(transfers[0]["wallet_address"], WALLET)
+        self.assertEqual(transfers[0]["raw_amount"], 5 * 10**18)
+        self.assertEqual(transfers[0]["block_number"], 7)
+
+    async def test_rotates_to_next_endpoint_on_failure(self) -> None:
+        broken = FakeJsonRpcServer(fail_first=10)
+        await broken.server.start_server()
+        try:
+            async with AsyncRpcClient(rpc_urls=[broken.url, self.rpc.url], retry_delay_seconds=0) as client:
+                latest = await client.latest_block_number()
+        finally:
+            await broken.server.close()
+
+        self.assertEqual(latest, 120)
+        self.assertEqual(len(broken.requests), 1)
+        self.assertEqual(len(self.rpc.requests), 1)
+
+    async def test_calls_go_to_faster_endpoint(self) -> None:
+        slow = FakeJsonRpcServer(latency=0.05)
+        await slow.server.start_server()
+        try:
+            async with AsyncRpcClient(rpc_urls=[slow.url, self.rpc.url], hedge_percentile=0) as client:
+                await client.latest_block_number()
+                for number in range(5):
+                    await client.get_block_timestamp(number)
+        finally:
+            await slow.server.close()
+
+        # Both endpoints answered the initial head check; afterwards only the fast one is used.
+        self.assertEqual(len(slow.requests), 1)
+        self.assertEqual(len(self.rpc.requests), 6)
+
+    async def test_slow_call_is_hedged_to_second_endpoint(self) -> None:
+        primary = FakeJsonRpcServer()
+        await primary.server.start_server()
+        try:
+            async with AsyncRpcClient(rpc_urls=[primary.url, self.rpc.url], hedge_percentile=90) as client:
+                client.pool.min_hedge_samples = 5
+                client.pool.min_hedge_delay_seconds = 0.01
+                for url in (primary.url, self.rpc.url):
+                    for _ in range(5):
+                        client.pool.record_success(url, 0.001 if url == primary.url else 0.002)
+                primary.latency = 1.0
+                timestamp = await asyncio.wait_for(client.get_block_timestamp(3), timeout=0.5)
+        finally:
+            await primary.server.close()
+
+        self.assertEqual(timestamp, 1700000003)
+        self.assertEqual(client.hedged_requests, 1)
+        self.assertEqual(len(self.rpc.requests), 1)
+
+    async def test_head_check_uses_in_sync_endpoints(self) -> None:
+        stale = FakeJsonRpcServer(head=100)
+        ahead = FakeJsonRpcServer(head=123)
+        await stale.server.start_server()
+        await ahead.server.start_server()
+        stale_url = stale.url
+        try:
+            async with AsyncRpcClient(rpc_urls=[stale.url, self.rpc.url, ahead.url], max_head_lag_blocks=5) as client:
+                latest = await client.latest_block_number()
+                await client.get_block_timestamp(1)
+                lagging = {snapshot.url for snapshot in client.pool.health() if snapshot.lagging}
+        finally:
+            await stale.server.close()
+            await ahead.server.close()
+
+        self.assertEqual(latest, 120)
+        self.assertEqual(lagging, {stale_url})
+        self.assertEqual(len(stale.requests), 1)
+
+    def test_raw_scan_matches_extracted_transfers(self) -> None:
+        block = build_block(42)
+        targets = {TARGET, "0x2222222222222222222222222222222222222222"}
+
+        self.assertEqual(
+            _scan_native_transfers(block["transactions"], 42, targets),
+            _extract_native_transfers(block, 42, targets),
+        )
+
+    async def test_block_range_is_fetched_in_chunked_batches(self) -> None:
+        async with AsyncRpcClient(rpc_urls=[self.rpc.url], batch_size=4) as client:
+            blocks = await client.get_native_transfers_range(10, 19, {TARGET})
+
+        self.assertEqual(len(self.rpc.requests), 3)
+        self.assertEqual(sorted(len(batch) for batch in self.rpc.requests), [2, 4, 4])
+        self.assertEqual([block["block_number"] for block in blocks], list(range(10, 20)))
+        self.assertEqual([block["timestamp"] for block in blocks], [1700000000 + n for n in range(10, 20)])
+        self.assertTrue(all(len(block["transfers"]) == 1 for block in blocks))
+
+    async def test_failed_batch_items_are_retried_individually(self) -> None:
+        self.rpc.flaky_blocks = {12}
+        async with AsyncRpcClient(rpc_urls=[self.rpc.url], batch_size=5, retry_delay_seconds=0) as client:
+            blocks = await client.get_blocks(10, 14)
+
+        self.assertEqual([int(block["number"], 16) for block in blocks], list(range(10, 15)))
+        self.assertEqual(len(self.rpc.requests), 2)
+        self.assertEqual([item["params"][0] for item in self.rpc.requests[1]], [hex(12)])
+
+    async def test_transaction_counts_are_batched_at_given_block(self) -> None:
+        wallets = [f"0x{index:040x}" for index in range(1, 6)]
+        async with AsyncRpcClient(rpc_urls=[self.rpc.url], batch_size=10) as client:
+            counts = await client.get_transaction_counts(wallets + [wallets[0].upper().replace("0X", "0x")], 99)
+
+        self.assertEqual(counts, {wallet: index for index, wallet in enumerate(wallets, start=1)})
+        self.assertEqual(len(self.rpc.requests), 1)
+        self.assertEqual({item["params"][1] for item in self.rpc.requests[0]}, {hex(99)})
+
+    async def test_erc20_logs_use_one_query_for_all_tokens_and_targets(self) -> None:
+        targets = {f"0x{index:040x}" for index in range(1, 6)} | {TARGET}
+        tokens = [USDC.upper().replace("0X", "0x"), "0x3333333333333333333333333333333333333333"]
+        async with AsyncRpcClient(rpc_urls=[self.rpc.url], log_topic_chunk_size=4) as client:
+            transfers = await client.get_erc20_transfers(
+                token_addresses=tokens,
+                from_block=50,
+                to_block=60,
+                target_addresses=targets,
+            )
+
+        self.assertEqual(len(self.rpc.requests), 2)
+        query = self.rpc.requests[0]["params"][0]
+        self.assertEqual(query["address"], sorted(token.lower() for token in tokens))
+        self.assertEqual(query["topics"][0], TRANSFER_TOPIC)
+        self.assertIsNone(query["topics"][1])
+        self.assertEqual(
+            sorted(len(request["params"][0]["topics"][2]) for request in self.rpc.requests),
+            [2, 4],
+        )
+        self.assertEqual(transfers[0]["token_address"], USDC)
+        self.assertEqual(transfers[0]["contract_address"], TARGET)
+        self.assertEqual(transfers[0]["raw_amount"], 7_000_000_000)
+
+    async def test_oversized_log_range_is_split_without_rotating_provider(self) -> None:
+        strict = FakeJsonRpcServer(max_log_range=10)
+        await strict.server.start_server()
+        try:
+            async with AsyncRpcClient(rpc_urls=[strict.url, self.rpc.url], retry_delay_seconds=0) as client:
+                transfers = await client.get_erc20_transfers(
+                    token_addresses=[USDC],
+                    from_block=1,
+                    to_block=40,
+                    target_addresses={TARGET},
+                )
+        finally:
+            await strict.server.close()
+
+        self.assertEqual(self.rpc.requests, [])
+        accepted_starts = sorted(transfer["block_number"] for transfer in transfers)
+        self.assertEqual(accepted_starts[0], 1)
+        self.assertGreater(len(strict.requests), 4)
+
+    async def test_lagging_head_error_fails_over_without_shrinking_windows(self) -> None:
+        lagging = FakeJsonRpcServer(log_error="block range extends beyond current head block")
+        await lagging.server.start_server()
+        try:
+            async with AsyncRpcClient(rpc_urls=[lagging.url, self.rpc.url], retry_delay_seconds=0) as client:
+                transfers = await client.get_erc20_transfers(
+                    token_addresses=[USDC],
+                    from_block=1,
+                    to_block=40,
+                    target_addresses={TARGET},
+                )
+                budgets = client.log_range_planner.budgets
+        finally:
+            await lagging.server.close()
+
+        self.assertEqual(len(lagging.requests), 1)
+        self.assertEqual(len(self.rpc.requests), 1)
+        self.assertEqual(len(transfers), 1)
+        self.assertTrue(all(budget.rejections == 0 and budget.range_ceiling is None for budget in budgets.values()))
+        self.assertTrue(all(budget.window == client.log_range_planner.initial_window for budget in budgets.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
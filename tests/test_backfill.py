@@ -0,0 +1,166 @@
+import asyncio
+import dataclasses
+import socket
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from aiohttp import web
+
+from polymarkt_monitoring.backfill import BackfillRunner, BackfillShard, ShardProgress, merge_candidates, plan_shards
+from polymarkt_monitoring.models import BetCandidate
+
+from test_async_rpc import FakeJsonRpcServer
+from test_monitor import build_config
+
+
+def make_candidate(block_number: int, tx_hash: str | None = None) -> BetCandidate:
+    return BetCandidate(
+        wallet_address="0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        tx_hash=tx_hash or f"0x{block_number:064x}",
+        block_number=block_number,
+        timestamp=1700000000 + block_number,
+        contract_address="0x1111111111111111111111111111111111111111",
+        token_symbol="MATIC",
+        token_amount=5.0,
+        usd_value=10_000.0,
+        source="native_transfer",
+    )
+
+
+class ThreadedChainServer:
+    """JSON-RPC and CoinGecko stand-ins on a background thread, reachable from worker processes."""
+
+    def __init__(self) -> None:
+        self.rpc = FakeJsonRpcServer()
+        self._loop = asyncio.new_event_loop()
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            self.port = probe.getsockname()[1]
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> None:
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result(timeout=5)
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    async def _start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/", self.rpc._handle)
+        app.router.add_get("/simple/price", self._price)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", self.port).start()
+
+    async def _price(self, request: web.Request) -> web.Response:
+        return web.json_response({asset: {"usd": 2000.0} for asset in request.query["ids"].split(",")})
+
+
+class BackfillTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.state_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_plan_shards_covers_range_contiguously(self) -> None:
+        shards = plan_shards(10, 1_009, shard_blocks=125)
+
+        self.assertEqual(len(shards), 8)
+        self.assertEqual(shards[0], BackfillShard(10, 134))
+        self.assertEqual(shards[-1].to_block, 1_009)
+        self.assertTrue(all(left.to_block + 1 == right.from_block for left, right in zip(shards, shards[1:])))
+        self.assertEqual(len(plan_shards(1, 20, shard_blocks=50)), 1)
+
+    def test_shard_progress_resumes_after_torn_write(self) -> None:
+        shard = BackfillShard(1, 100)
+        progress = ShardProgress(self.state_dir, shard)
+        progress.append(50, [make_candidate(7)])
+        with progress.path.open("a") as handle:
+            handle.write('{"to_block": 100, "candi')
+
+        next_block, candidates = ShardProgress(self.state_dir, shard).load()
+
+        self.assertEqual(next_block, 51)
+        self.assertEqual(candidates, [make_candidate(7)])
+        self.assertFalse(progress.complete)
+
+        progress.append(100, [make_candidate(80)])
+
+        self.assertTrue(progress.complete)
+        self.assertEqual(progress.load()[1], [make_candidate(7), make_candidate(80)])
+
+    def test_merge_orders_by_block_and_drops_duplicates(self) -> None:
+        merged = merge_candidates([[make_candidate(30), make_candidate(31)], [make_candidate(5), make_candidate(30)]])
+
+        self.assertEqual([candidate.block_number for candidate in merged], [5, 30, 31])
+
+    def test_process_pool_scan_matches_sequential_extraction_and_resumes(self) -> None:
+        server = ThreadedChainServer()
+        server.start()
+        config = dataclasses.replace(
+            build_config(),
+            rpc_urls=[server.url],
+            coingecko_api_base=server.url,
+            # Shards of 20 one-block chunks, so the range spans two shards.
+            max_blocks_per_cycle=1,
+        )
+        try:
+            candidates = BackfillRunner(
+                config=config, from_block=1, to_block=40, workers=2, state_dir=self.state_dir
+            ).run()
+        finally:
+            server.stop()
+
+        self.assertEqual([candidate.block_number for candidate in candidates], list(range(1, 41)))
+        self.assertEqual(candidates[0].usd_value, 10_000.0)
+
+        # Every shard is checkpointed, so a rerun needs no RPC at all, whatever its worker count.
+        rerun = BackfillRunner(config=config, from_block=1, to_block=40, workers=3, state_dir=self.state_dir).run()
+        self.assertEqual(rerun, candidates)
+
+
+class PickyNotifier:
+    def __init__(self, rejected_tx_hash: str) -> None:
+        self.rejected_tx_hash = rejected_tx_hash
+        self.messages: list[str] = []
+
+    def send_message(self, text: str) -> None:
+        if self.rejected_tx_hash in text:
+            raise RuntimeError("Telegram rejected the message")
+        self.messages.append(text)
+
+
+class BackfillAlertTests(unittest.IsolatedAsyncioTestCase):
+    async def test_undelivered_alerts_are_reported(self) -> None:
+        rpc = FakeJsonRpcServer()
+        await rpc.server.start_server()
+        self.addAsyncCleanup(rpc.server.close)
+        config = dataclasses.replace(build_config(novelty_backend="rpc"), rpc_urls=[rpc.url], max_blocks_per_cycle=5)
+        with tempfile.TemporaryDirectory() as state_dir:
+            runner = BackfillRunner(config=config, from_block=1, to_block=300, workers=2, state_dir=state_dir)
+        # The fake node reports a nonce equal to the wallet's last hex digit, so these wallets are new.
+        delivered = dataclasses.replace(make_candidate(10), wallet_address="0x" + "b" * 39 + "1")
+        rejected = dataclasses.replace(make_candidate(250), wallet_address="0x" + "c" * 39 + "2")
+        notifier = PickyNotifier(rejected.tx_hash)
+
+        with self.assertLogs("polymarkt_monitoring.backfill", level="ERROR") as logs:
+            undelivered = await runner.alert([delivered, rejected], notifier=notifier)
+
+        self.assertEqual(undelivered, [rejected])
+        self.assertEqual(len(notifier.messages), 1)
+        self.assertIn("Backfill alert not delivered", logs.output[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from polymarkt_monitoring.services.block_cache import BlockTimestampCache
+
+
+class BlockTimestampCacheTests(unittest.TestCase):
+    def test_evicts_earliest_blocks_when_full(self) -> None:
+        cache = BlockTimestampCache(max_entries=3)
+        for block_number in range(10, 15):
+            cache.put(block_number, 1700000000 + block_number)
+
+        self.assertEqual(list(cache), [12, 13, 14])
+        self.assertEqual(cache.evictions, 2)
+        self.assertIsNone(cache.get(10))
+        self.assertEqual(cache.get(14), 1700000014)
+
+    def test_prune_below_low_water_mark(self) -> None:
+        cache = BlockTimestampCache(max_entries=100)
+        cache.update({block_number: block_number for block_number in (5, 9, 7, 12)})
+
+        evicted = cache.prune_below(9)
+
+        self.assertEqual(evicted, 2)
+        self.assertEqual(sorted(cache), [9, 12])
+
+
+if __name__ == "__main__":
+    unittest.main()
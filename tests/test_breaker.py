@@ -0,0 +1,97 @@
+import asyncio
+import unittest
+
+from polymarkt_monitoring.breaker import CircuitBreaker, CircuitOpenError
+from polymarkt_monitoring.retry import async_with_retries
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def fail() -> None:
+    raise RuntimeError("down")
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def test_opens_after_threshold_and_fails_fast(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("explorer", failure_threshold=2, reset_timeout_seconds=10, clock=clock)
+        calls = []
+
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                breaker.call(fail)
+        with self.assertRaises(CircuitOpenError) as raised:
+            breaker.call(lambda: calls.append(1))
+
+        self.assertEqual(breaker.state, "open")
+        self.assertEqual(calls, [])
+        self.assertEqual(raised.exception.retry_in_seconds, 10)
+
+    def test_half_open_probe_closes_or_reopens(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("telegram", failure_threshold=1, reset_timeout_seconds=10, clock=clock)
+        with self.assertRaises(RuntimeError):
+            breaker.call(fail)
+
+        clock.now = 10
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.state, "half_open")
+        self.assertFalse(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+
+        clock.now = 20
+        self.assertEqual(breaker.call(lambda: "ok"), "ok")
+        self.assertEqual(breaker.state, "closed")
+        self.assertEqual(breaker.opened, 2)
+
+    def test_success_resets_consecutive_failures(self) -> None:
+        breaker = CircuitBreaker("coingecko", failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, "closed")
+
+
+class AsyncRetryTests(unittest.IsolatedAsyncioTestCase):
+    async def test_deadline_stops_retrying(self) -> None:
+        attempts = 0
+
+        async def failure() -> None:
+            nonlocal attempts
+            attempts += 1
+            raise RuntimeError("down")
+
+        with self.assertRaises(RuntimeError):
+            await async_with_retries(failure, attempts=10, base_delay_seconds=0.2, jitter=False, deadline_seconds=0.3)
+
+        # Second backoff (0.4s) would end past the 0.3s deadline, so there is no third attempt.
+        self.assertEqual(attempts, 2)
+
+    async def test_deadline_bounds_a_hanging_attempt(self) -> None:
+        with self.assertRaises(TimeoutError):
+            await async_with_retries(lambda: asyncio.sleep(10), attempts=3, deadline_seconds=0.05)
+
+    async def test_open_circuit_is_not_retried(self) -> None:
+        attempts = 0
+
+        async def rejected() -> None:
+            nonlocal attempts
+            attempts += 1
+            raise CircuitOpenError("rpc", 5)
+
+        with self.assertRaises(CircuitOpenError):
+            await async_with_retries(rejected, attempts=3, base_delay_seconds=0)
+
+        self.assertEqual(attempts, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
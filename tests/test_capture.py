@@ -0,0 +1,120 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from polymarkt_monitoring.capture import CaptureMissError, TrafficCapture
+from polymarkt_monitoring.clients.async_rpc import AsyncRpcClient
+from polymarkt_monitoring.clients.explorer import ExplorerClient
+from polymarkt_monitoring.clients.pricing import CoinGeckoPricingClient
+
+from test_async_rpc import TARGET, USDC, FakeJsonRpcServer
+
+# Nothing listens here; a replay that reaches the network fails.
+OFFLINE_URL = "http://127.0.0.1:9/"
+
+
+class TrafficCaptureTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "capture.jsonl.gz"
+
+    def test_repeated_requests_replay_in_order_then_repeat_the_last(self) -> None:
+        with TrafficCapture(self.path, mode="record") as capture:
+            for head in ("0x10", "0x11"):
+                capture.record("rpc", "eth_blockNumber", [], {"result": head}, latency=0.01)
+            capture.record("rpc", "eth_getBlockByNumber", ["0x10", False], {"result": {"number": "0x10"}}, latency=0.01)
+
+        replay = TrafficCapture(self.path, mode="replay")
+
+        heads = [replay.replay("rpc", "eth_blockNumber", []).body["result"] for _ in range(3)]
+        self.assertEqual(heads, ["0x10", "0x11", "0x11"])
+        self.assertEqual(replay.replay("rpc", "eth_getBlockByNumber", ("0x10", False)).body["result"]["number"], "0x10")
+        with self.assertRaises(CaptureMissError):
+            replay.replay("rpc", "eth_getBlockByNumber", ["0x11", False])
+
+    def test_later_runs_append_and_an_unclosed_capture_is_readable(self) -> None:
+        with TrafficCapture(self.path, mode="record") as capture:
+            capture.record("explorer", "eth_getTransactionCount", {"address": "0xa"}, {"result": "0x1"}, latency=0)
+        # A recorder killed mid-run never writes the gzip trailer.
+        crashed = TrafficCapture(self.path, mode="record")
+        crashed.record("explorer", "eth_getTransactionCount", {"address": "0xb"}, {"result": "0x2"}, latency=0)
+
+        with self.assertLogs("polymarkt_monitoring.capture", level="WARNING"):
+            replay = TrafficCapture(self.path, mode="replay")
+
+        self.assertEqual(len(replay), 2)
+        self.assertEqual(replay.replay("explorer", "eth_getTransactionCount", {"address": "0xb"}).body["result"], "0x2")
+        crashed.close()
+
+    def test_original_timing_waits_out_the_recorded_latency(self) -> None:
+        with TrafficCapture(self.path, mode="record") as capture:
+            capture.record("coingecko", "/simple/price", {"ids": "x"}, {"x": {"usd": 1.0}}, latency=0.05)
+
+        started = time.monotonic()
+        TrafficCapture(self.path, mode="replay", timing="original").replay("coingecko", "/simple/price", {"ids": "x"})
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+
+        started = time.monotonic()
+        TrafficCapture(self.path, mode="replay").replay("coingecko", "/simple/price", {"ids": "x"})
+        self.assertLess(time.monotonic() - started, 0.05)
+
+    def test_http_clients_replay_without_the_network(self) -> None:
+        with TrafficCapture(self.path, mode="record") as capture:
+            capture.record(
+                "explorer",
+                "eth_getTransactionCount",
+                {"module": "proxy", "action": "eth_getTransactionCount", "address": "0xabc", "tag": "latest"},
+                {"jsonrpc": "2.0", "id": 1, "result": "0x3"},
+                latency=0,
+            )
+            capture.record(
+                "coingecko",
+                "/simple/price",
+                {"ids": "matic-network,usd-coin", "vs_currencies": "usd"},
+                {"matic-network": {"usd": 0.5}, "usd-coin": {"usd": 1.0}},
+                latency=0,
+            )
+
+        replay = TrafficCapture(self.path, mode="replay")
+        explorer = ExplorerClient(api_base=OFFLINE_URL, api_key="secret", capture=replay)
+        pricing = CoinGeckoPricingClient(api_base=OFFLINE_URL, capture=replay)
+
+        self.assertEqual(explorer.get_transaction_count("0xABC"), 3)
+        self.assertEqual(pricing.get_usd_prices(["usd-coin", "matic-network"]), {"matic-network": 0.5, "usd-coin": 1.0})
+
+
+class AsyncRpcCaptureTests(unittest.IsolatedAsyncioTestCase):
+    async def test_recorded_rpc_session_replays_offline(self) -> None:
+        rpc = FakeJsonRpcServer(max_log_range=4)
+        await rpc.server.start_server()
+        self.addAsyncCleanup(rpc.server.close)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "capture.jsonl.gz"
+
+            async def session(client: AsyncRpcClient) -> tuple:
+                return (
+                    await client.latest_block_number(),
+                    await client.get_block_timestamps([5, 6, 7]),
+                    await client.get_erc20_transfers(
+                        token_addresses=[USDC], from_block=1, to_block=10, target_addresses={TARGET}
+                    ),
+                )
+
+            with TrafficCapture(path, mode="record") as capture:
+                async with AsyncRpcClient(rpc_urls=[rpc.url], batch_size=2, capture=capture) as client:
+                    recorded = await session(client)
+            requests_sent = len(rpc.requests)
+
+            replay = TrafficCapture(path, mode="replay")
+            async with AsyncRpcClient(rpc_urls=[OFFLINE_URL], batch_size=2, capture=replay) as client:
+                replayed = await session(client)
+
+        self.assertEqual(replayed, recorded)
+        self.assertEqual(len(rpc.requests), requests_sent)
+        self.assertEqual(replay.replayed, capture.recorded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -52,6 +52,105 @@ class ConfigTests(unittest.TestCase):
             with self.assertRaises(ValueError):
                 load_config(env_file=".env.does-not-exist")
 
+    def test_tuning_settings_default_when_unset(self) -> None:
+        with patch.dict(os.environ, BASE_ENV, clear=True):
+            config = load_config(env_file=".env.does-not-exist")
+
+        self.assertEqual(config.rpc_hedge_percentile, 0.0)
+        self.assertEqual(config.novelty_backend, "explorer")
+        self.assertEqual(config.pricing_mode, "spot")
+        self.assertEqual(config.capture_mode, "off")
+        self.assertEqual(config.capture_replay_timing, "fast")
+        self.assertEqual(config.metrics_port, 0)
+
+    def test_catchup_range_follows_a_large_cycle_when_unset(self) -> None:
+        with patch.dict(os.environ, {**BASE_ENV, "MAX_BLOCKS_PER_CYCLE": "1000"}, clear=True):
+            config = load_config(env_file=".env.does-not-exist")
+
+        self.assertEqual(config.max_blocks_per_cycle, 1_000)
+        self.assertEqual(config.max_catchup_blocks_per_cycle, 1_000)
+
+    def test_tuning_settings_are_parsed(self) -> None:
+        env = {
+            **BASE_ENV,
+            "RPC_WS_URL": "wss://polygon.example/ws",
+            "RPC_BATCH_SIZE": "50",
+            "RPC_HEDGE_PERCENTILE": "90.5",
+            "RPC_MAX_HEAD_LAG_BLOCKS": "3",
+            "MIN_POLL_INTERVAL_SECONDS": "0.5",
+            "MAX_CATCHUP_BLOCKS_PER_CYCLE": "800",
+            "DEDUP_WINDOW_BLOCKS": "10000",
+            "NOVELTY_BACKEND": "RPC",
+            "EXPLORER_CALLS_PER_SECOND": "2.5",
+            "EXPLORER_DAILY_LIMIT": "0",
+            "PENDING_RETRY_BASE_SECONDS": "30",
+            "PENDING_RETRY_MAX_SECONDS": "600",
+            "PRICING_MODE": "Historical",
+            "TELEGRAM_MESSAGES_PER_MINUTE": "10",
+            "BREAKER_FAILURE_THRESHOLD": "3",
+            "METRICS_PORT": "9100",
+            "TRACE_OTLP_ENDPOINT": "http://localhost:4318/v1/traces",
+            "CAPTURE_MODE": "Replay",
+            "CAPTURE_PATH": "state/incident.jsonl.gz",
+            "CAPTURE_REPLAY_TIMING": "original",
+        }
+
+        with patch.dict(os.environ, env, clear=True):
+            config = load_config(env_file=".env.does-not-exist")
+
+        self.assertEqual(config.rpc_ws_url, "wss://polygon.example/ws")
+        self.assertEqual(config.rpc_batch_size, 50)
+        self.assertEqual(config.rpc_hedge_percentile, 90.5)
+        self.assertEqual(config.rpc_max_head_lag_blocks, 3)
+        self.assertEqual(config.min_poll_interval_seconds, 0.5)
+        self.assertEqual(config.max_catchup_blocks_per_cycle, 800)
+        self.assertEqual(config.dedup_window_blocks, 10_000)
+        self.assertEqual(config.novelty_backend, "rpc")
+        self.assertEqual(config.explorer_calls_per_second, 2.5)
+        self.assertEqual(config.explorer_daily_limit, 0)
+        self.assertEqual(config.pending_retry_max_seconds, 600)
+        self.assertEqual(config.pricing_mode, "historical")
+        self.assertEqual(config.telegram_messages_per_minute, 10)
+        self.assertEqual(config.breaker_failure_threshold, 3)
+        self.assertEqual(config.metrics_port, 9100)
+        self.assertEqual(config.trace_otlp_endpoint, "http://localhost:4318/v1/traces")
+        self.assertEqual(config.capture_mode, "replay")
+        self.assertEqual(config.capture_path, "state/incident.jsonl.gz")
+        self.assertEqual(config.capture_replay_timing, "original")
+
+    def test_invalid_tuning_settings_raise(self) -> None:
+        cases = {
+            "RPC_BATCH_SIZE": "0",
+            "RPC_HEDGE_PERCENTILE": "100",
+            "RPC_MAX_CONCURRENCY": "many",
+            "RPC_WS_URL": "https://polygon.example/ws",
+            "MIN_POLL_INTERVAL_SECONDS": "30",
+            "MAX_CATCHUP_BLOCKS_PER_CYCLE": "10",
+            "NOVELTY_BACKEND": "graph",
+            "EXPLORER_CALLS_PER_SECOND": "0",
+            "PENDING_RETRY_MAX_SECONDS": "1",
+            "PRICING_MODE": "live",
+            "PRICE_MAX_STALENESS_SECONDS": "5",
+            "TELEGRAM_MESSAGES_PER_MINUTE": "0",
+            "BREAKER_RESET_SECONDS": "0",
+            "METRICS_PORT": "70000",
+            "TRACE_OTLP_ENDPOINT": "localhost:4318",
+            "CAPTURE_MODE": "rewind",
+            "CAPTURE_REPLAY_TIMING": "slow",
+        }
+        for key, value in cases.items():
+            with self.subTest(key=key, value=value):
+                with patch.dict(os.environ, {**BASE_ENV, key: value}, clear=True):
+                    with self.assertRaisesRegex(ValueError, key):
+                        load_config(env_file=".env.does-not-exist")
+
+    def test_capture_requires_a_path(self) -> None:
+        env = {**BASE_ENV, "CAPTURE_MODE": "record", "CAPTURE_PATH": ""}
+
+        with patch.dict(os.environ, env, clear=True):
+            with self.assertRaisesRegex(ValueError, "CAPTURE_PATH"):
+                load_config(env_file=".env.does-not-exist")
+
 
 if __name__ == "__main__":
     unittest.main()
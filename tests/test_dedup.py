@@ -0,0 +1,50 @@
+import unittest
+
+from polymarkt_monitoring.services.dedup import DedupStore, RotatingBloomFilter, compact_key
+
+
+def make_key(index: int) -> tuple[str, str, str, str]:
+    return (f"0x{index:064x}", "0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa", "0x1111", "USDC")
+
+
+class DedupStoreTests(unittest.TestCase):
+    def test_prunes_keys_older_than_window(self) -> None:
+        store = DedupStore(window_blocks=10)
+        for block_number in range(100, 130):
+            store.add(make_key(block_number), block_number)
+
+        evicted = store.prune(checkpoint_block=129)
+
+        self.assertEqual(evicted, 19)
+        self.assertEqual(len(store), 11)
+        self.assertNotIn(make_key(118), store)
+        self.assertIn(make_key(119), store)
+        self.assertEqual(store.stats().evictions, 19)
+
+    def test_bloom_filter_remembers_pruned_keys(self) -> None:
+        store = DedupStore(window_blocks=0, bloom_capacity=1_000)
+        store.add(make_key(1), 1)
+        store.prune(checkpoint_block=50)
+
+        self.assertEqual(len(store), 0)
+        self.assertIn(make_key(1), store)
+        stats = store.stats()
+        self.assertEqual(stats.bloom_entries, 1)
+        self.assertEqual(stats.bloom_hits, 1)
+        self.assertLess(stats.false_positive_rate, 0.001)
+
+    def test_rotating_bloom_filter_drops_oldest_generation(self) -> None:
+        bloom = RotatingBloomFilter(capacity=100, error_rate=0.01, generations=2)
+        keys = [compact_key(make_key(index)) for index in range(250)]
+        for key in keys:
+            bloom.add(key)
+
+        self.assertEqual(bloom.rotations, 2)
+        self.assertEqual(len(bloom), 150)
+        self.assertTrue(all(key in bloom for key in keys[200:]))
+        false_positives = sum(key in bloom for key in keys[:100])
+        self.assertLess(false_positives, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
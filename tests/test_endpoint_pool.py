@@ -0,0 +1,80 @@
+import unittest
+
+from polymarkt_monitoring.clients.endpoint_pool import EndpointPool
+
+A = "https://a.example"
+B = "https://b.example"
+C = "https://c.example"
+
+
+class EndpointPoolTests(unittest.TestCase):
+    def test_untried_endpoints_keep_configured_order(self) -> None:
+        pool = EndpointPool([A, B, C])
+
+        self.assertEqual(pool.ranked(), [A, B, C])
+
+    def test_ranking_prefers_low_latency_and_penalises_errors(self) -> None:
+        pool = EndpointPool([A, B, C])
+        pool.record_success(A, 0.30)
+        pool.record_success(B, 0.10)
+        pool.record_success(C, 0.05)
+        self.assertEqual(pool.ranked(), [C, B, A])
+
+        for _ in range(4):
+            pool.record_failure(C)
+
+        # C's error rate is now ~0.59: 0.05 / 0.41 ~ 0.12s per success, still ahead of A.
+        self.assertEqual(pool.ranked(), [B, C, A])
+        self.assertEqual(pool.best(), B)
+
+    def test_error_rate_decays_after_successes(self) -> None:
+        pool = EndpointPool([A], smoothing=0.5)
+        pool.record_failure(A)
+        self.assertAlmostEqual(pool.health()[0].error_rate, 0.5)
+
+        pool.record_success(A, 0.1)
+        pool.record_success(A, 0.1)
+
+        self.assertAlmostEqual(pool.health()[0].error_rate, 0.125)
+
+    def test_hedge_delay_uses_latency_percentile(self) -> None:
+        pool = EndpointPool([A, B], hedge_percentile=90, min_hedge_samples=10, min_hedge_delay_seconds=0.0)
+        self.assertIsNone(pool.hedge_delay(A))
+
+        for index in range(1, 11):
+            pool.record_success(A, index / 100)
+
+        self.assertAlmostEqual(pool.hedge_delay(A), 0.09)
+        self.assertIsNone(EndpointPool([A], hedge_percentile=90).hedge_delay(A))
+        self.assertIsNone(EndpointPool([A, B]).hedge_delay(A))
+
+    def test_lagging_and_unreachable_endpoints_rank_last(self) -> None:
+        pool = EndpointPool([A, B, C], max_head_lag_blocks=3)
+        pool.record_success(A, 0.01)
+        pool.record_success(B, 0.50)
+        pool.record_success(C, 0.02)
+
+        pool.record_heads({A: 90, B: 100, C: None})
+
+        self.assertEqual(pool.ranked(), [B, A, C])
+        self.assertEqual({snapshot.url: snapshot.lagging for snapshot in pool.health()}, {A: True, B: False, C: True})
+
+        pool.record_heads({A: 98, B: 100, C: 100})
+
+        self.assertEqual(pool.ranked(), [A, C, B])
+
+    def test_open_breaker_ranks_last_and_blocks_requests(self) -> None:
+        pool = EndpointPool([A, B], breaker_failure_threshold=2, breaker_reset_seconds=60)
+        pool.record_success(A, 0.01)
+        pool.record_success(B, 0.50)
+        pool.record_failure(A)
+        pool.record_failure(A)
+
+        self.assertEqual(pool.ranked(), [B, A])
+        self.assertEqual(pool.acquire([A]), None)
+        self.assertEqual(pool.acquire([A, B]), B)
+        self.assertEqual(pool.health()[0].breaker_state, "open")
+
+
+if __name__ == "__main__":
+    unittest.main()
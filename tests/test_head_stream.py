@@ -0,0 +1,185 @@
+import asyncio
+import json
+import time
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from polymarkt_monitoring.clients.head_stream import HeadStream
+from polymarkt_monitoring.services import BetEvaluator, MonitoringService
+
+from test_async_rpc import TARGET, USDC, build_transfer_log
+from test_monitor import FakeExplorerClient, FakeNotifier, FakePricingClient, FakeRpcClient, build_config
+
+
+class FakeWsNode:
+    """Minimal ``eth_subscribe`` WebSocket endpoint driven by the test."""
+
+    def __init__(self) -> None:
+        self.subscriptions: list[list] = []
+        self.connections = 0
+        self._sockets: list[web.WebSocketResponse] = []
+        app = web.Application()
+        app.router.add_get("/", self._handle)
+        self.server = TestServer(app)
+
+    @property
+    def url(self) -> str:
+        return str(self.server.make_url("/")).replace("http://", "ws://")
+
+    async def _handle(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+        self._sockets.append(ws)
+        async for message in ws:
+            payload = json.loads(message.data)
+            self.subscriptions.append(payload["params"])
+            kind = payload["params"][0]
+            await ws.send_json({"jsonrpc": "2.0", "id": payload["id"], "result": f"0x{kind}{payload['id']}"})
+        return ws
+
+    async def push_head(self, number: int) -> None:
+        await self._push("0xnewHeads1", {"number": hex(number)})
+
+    async def push_log(self, log: dict) -> None:
+        await self._push("0xlogs2", log)
+
+    async def drop(self) -> None:
+        await self._sockets.pop().close()
+
+    async def _push(self, subscription: str, result: dict) -> None:
+        message = {"jsonrpc": "2.0", "method": "eth_subscription", "params": {"subscription": subscription, "result": result}}
+        await self._sockets[-1].send_json(message)
+
+
+async def wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        await asyncio.sleep(0.01)
+
+
+def transfer_log(block_number: int, **extra) -> dict:
+    return {**build_transfer_log(USDC, block_number, TARGET, 7_000_000_000), "logIndex": "0x0", **extra}
+
+
+class HeadStreamTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.node = FakeWsNode()
+        await self.node.server.start_server()
+        self.stream = HeadStream(
+            ws_url=self.node.url,
+            token_addresses=[USDC],
+            target_addresses=[TARGET],
+            reconnect_delay_seconds=0.01,
+        )
+        await self.stream.start()
+        await wait_until(lambda: self.stream.connected)
+
+    async def asyncTearDown(self) -> None:
+        await self.stream.close()
+        await self.node.server.close()
+
+    async def test_subscribes_to_heads_and_filtered_logs(self) -> None:
+        waiter = asyncio.create_task(self.stream.wait_for_head(50, timeout=2))
+        await self.node.push_head(49)
+        await self.node.push_head(50)
+
+        self.assertEqual(await waiter, 50)
+        self.assertEqual(self.node.subscriptions[0], ["newHeads"])
+        log_filter = self.node.subscriptions[1][1]
+        self.assertEqual(log_filter["address"], [USDC])
+        self.assertEqual(log_filter["topics"][2], ["0x" + TARGET[2:].rjust(64, "0")])
+        self.assertIsNone(await self.stream.wait_for_head(60, timeout=0.05))
+
+    async def test_serves_buffered_transfers_only_for_covered_blocks(self) -> None:
+        await self.node.push_head(10)
+        await self.node.push_log(transfer_log(11))
+        await self.node.push_log(transfer_log(12))
+        await self.node.push_log(transfer_log(12, removed=True))
+        await self.node.push_head(13)
+        await wait_until(lambda: self.stream.latest_head == 13)
+
+        self.assertIsNone(self.stream.transfers(10, 12))
+        self.assertIsNone(self.stream.transfers(11, 13))
+        transfers = self.stream.transfers(11, 12)
+        self.assertEqual([transfer["block_number"] for transfer in transfers], [11])
+        self.assertEqual(transfers[0]["token_address"], USDC)
+
+    async def test_reconnects_and_resets_coverage_after_drop(self) -> None:
+        await self.node.push_head(10)
+        await wait_until(lambda: self.stream.latest_head == 10)
+        await self.node.drop()
+        await wait_until(lambda: self.node.connections == 2 and self.stream.connected)
+
+        await self.node.push_head(20)
+        await self.node.push_head(22)
+        await wait_until(lambda: self.stream.latest_head == 22)
+        self.assertIsNone(self.stream.transfers(15, 21))
+        self.assertEqual(self.stream.transfers(21, 21), [])
+
+    async def test_monitor_processes_block_when_streamed_head_confirms_it(self) -> None:
+        rpc = FakeRpcClient(
+            native_transfers={
+                101: [
+                    {
+                        "wallet_address": "0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+                        "contract_address": TARGET,
+                        "tx_hash": "0xbeef",
+                        "block_number": 101,
+                        "raw_amount": 6000 * 10**18,
+                    }
+                ]
+            }
+        )
+        notifier = FakeNotifier()
+        service = MonitoringService(
+            config=build_config(start_block=101),
+            rpc_client=rpc,
+            pricing_client=FakePricingClient(),
+            explorer_client=FakeExplorerClient([1]),
+            notifier=notifier,
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+            head_stream=self.stream,
+        )
+        run = asyncio.create_task(service.run())
+        try:
+            await asyncio.sleep(0.05)
+            started = time.monotonic()
+            rpc._latest_block_number = 103
+            await self.node.push_head(103)
+            await wait_until(lambda: notifier.messages)
+            elapsed = time.monotonic() - started
+        finally:
+            run.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await run
+
+        self.assertLess(elapsed, 2.0)
+        self.assertIn("Block: 101", notifier.messages[0])
+
+    async def test_streamed_head_is_capped_at_the_rpc_head(self) -> None:
+        rpc = FakeRpcClient(latest_block_number=100)
+        service = MonitoringService(
+            config=build_config(),
+            rpc_client=rpc,
+            pricing_client=FakePricingClient(),
+            explorer_client=FakeExplorerClient([1]),
+            notifier=FakeNotifier(),
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+            head_stream=self.stream,
+        )
+
+        await self.node.push_head(110)
+        await wait_until(lambda: self.stream.latest_head == 110)
+        self.assertEqual(await service._latest_block_number(), 100)
+
+        rpc._latest_block_number = 120
+        self.assertEqual(await service._latest_block_number(), 110)
+
+
+if __name__ == "__main__":
+    unittest.main()
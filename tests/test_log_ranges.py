@@ -0,0 +1,107 @@
+import asyncio
+import unittest
+
+from polymarkt_monitoring.clients.log_ranges import LogRangePlanner, is_range_error
+from polymarkt_monitoring.clients.rpc import RpcError
+
+
+class FakeLogProvider:
+    def __init__(
+        self,
+        *,
+        name: str = "rpc-a",
+        max_span: int | None = None,
+        logs_per_block: int = 0,
+        max_results: int = 10_000,
+    ) -> None:
+        self.name = name
+        self.max_span = max_span
+        self.logs_per_block = logs_per_block
+        self.max_results = max_results
+        self.calls: list[tuple[int, int]] = []
+
+    async def fetch(self, start: int, end: int) -> tuple[str, list[int]]:
+        self.calls.append((start, end))
+        span = end - start + 1
+        if self.max_span is not None and span > self.max_span:
+            raise RpcError(-32005, f"block range too large, max {self.max_span}", rpc_url=self.name)
+        logs = [block for block in range(start, end + 1) for _ in range(self.logs_per_block)]
+        if len(logs) > self.max_results:
+            raise RpcError(-32005, f"query returned more than {self.max_results} results", rpc_url=self.name)
+        return self.name, logs
+
+
+class LogRangePlannerTests(unittest.TestCase):
+    def test_recognises_provider_range_errors(self) -> None:
+        self.assertTrue(is_range_error(RuntimeError("query returned more than 10000 results")))
+        self.assertTrue(is_range_error(RuntimeError("eth_getLogs block range too large")))
+        self.assertTrue(is_range_error(RuntimeError("Log response size exceeded. Use a 2K block range")))
+        self.assertTrue(is_range_error(RuntimeError("exceed maximum block range: 1000")))
+        self.assertTrue(is_range_error(RuntimeError("block range is too wide")))
+        self.assertFalse(is_range_error(RuntimeError("connection reset by peer")))
+        self.assertFalse(is_range_error(RuntimeError("block range extends beyond current head block")))
+        self.assertFalse(is_range_error(RuntimeError("invalid block range params")))
+        self.assertFalse(is_range_error(RuntimeError("rate limit exceeded")))
+        self.assertFalse(is_range_error(RuntimeError("daily request count limit exceeded")))
+        self.assertFalse(is_range_error(RuntimeError("Too many requests, exceeded more than 100 req/s")))
+        self.assertFalse(is_range_error(RuntimeError("429, message='Too Many Requests', url='https://rpc'")))
+
+    def test_bisects_rejected_range_and_converges_on_provider_limit(self) -> None:
+        provider = FakeLogProvider(max_span=100)
+        planner = LogRangePlanner(initial_window=1_000)
+
+        for start in range(1, 4_001, 400):
+            asyncio.run(planner.fetch(provider.fetch, start, start + 399, provider=lambda: "rpc-a"))
+        first_rejections = planner.budget("rpc-a").rejections
+        provider.calls.clear()
+        asyncio.run(planner.fetch(provider.fetch, 4_001, 8_000, provider=lambda: "rpc-a"))
+
+        budget = planner.budget("rpc-a")
+        self.assertEqual(budget.window, 100)
+        self.assertEqual(budget.range_ceiling, 100)
+        self.assertEqual(budget.rejections, first_rejections)
+        self.assertEqual(len(provider.calls), 40)
+
+    def test_result_limit_splits_dense_ranges_without_losing_logs(self) -> None:
+        provider = FakeLogProvider(logs_per_block=30, max_results=1_000)
+        planner = LogRangePlanner(initial_window=500)
+
+        logs = asyncio.run(planner.fetch(provider.fetch, 1, 200, provider=lambda: "rpc-a"))
+
+        self.assertEqual(len(logs), 200 * 30)
+        self.assertEqual(logs, sorted(logs))
+        self.assertEqual(planner.budget("rpc-a").max_results, 1_000)
+
+    def test_sparse_results_grow_window_up_to_ceiling(self) -> None:
+        provider = FakeLogProvider()
+        planner = LogRangePlanner(initial_window=10, max_window=80)
+
+        asyncio.run(planner.fetch(provider.fetch, 1, 1_000, provider=lambda: "rpc-a"))
+
+        self.assertEqual(planner.budget("rpc-a").window, 80)
+        self.assertEqual(provider.calls[:3], [(1, 10), (11, 30), (31, 70)])
+
+    def test_budgets_are_tracked_per_provider(self) -> None:
+        strict = FakeLogProvider(name="strict", max_span=10)
+        planner = LogRangePlanner(initial_window=100)
+
+        asyncio.run(planner.fetch(strict.fetch, 1, 1_000, provider=lambda: "strict"))
+
+        self.assertEqual(planner.budget("strict").window, 10)
+        self.assertEqual(planner.budget("lenient").window, 100)
+
+    def test_outcome_is_charged_to_the_endpoint_that_served_the_window(self) -> None:
+        # The planner expected "lenient", but failover sent every window to "strict".
+        strict = FakeLogProvider(name="strict", max_span=10)
+        planner = LogRangePlanner(initial_window=100)
+
+        asyncio.run(planner.fetch(strict.fetch, 1, 1_000, provider=lambda: "lenient"))
+
+        self.assertGreater(planner.budget("strict").rejections, 0)
+        self.assertLessEqual(planner.budget("strict").range_ceiling, 11)
+        self.assertEqual(planner.budget("lenient").rejections, 0)
+        self.assertIsNone(planner.budget("lenient").range_ceiling)
+
+
+if __name__ == "__main__":
+    unittest.main()
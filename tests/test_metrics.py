@@ -0,0 +1,90 @@
+import unittest
+
+import aiohttp
+
+from polymarkt_monitoring import metrics
+from polymarkt_monitoring.clients.async_rpc import AsyncRpcClient
+from polymarkt_monitoring.metrics import MetricsRegistry, MetricsServer, _Metric
+
+from test_async_rpc import FakeJsonRpcServer
+
+
+class MetricsRegistryTests(unittest.TestCase):
+    def test_renders_prometheus_text_format(self) -> None:
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls made.", ("method",))
+        latency = registry.histogram("latency_seconds", "Call latency.", buckets=(0.1, 1.0))
+        registry.gauge("lag_blocks", "Blocks behind.", lambda: 7)
+        registry.gauge("ratio", "Not measured yet.", lambda: None)
+
+        calls.inc("eth_call")
+        calls.inc("eth_call", amount=2)
+        latency.observe(0.05)
+        latency.observe(0.5)
+        latency.observe(3.0)
+
+        self.assertEqual(
+            registry.render().splitlines(),
+            [
+                "# HELP calls_total Calls made.",
+                "# TYPE calls_total counter",
+                'calls_total{method="eth_call"} 3',
+                "# HELP latency_seconds Call latency.",
+                "# TYPE latency_seconds histogram",
+                'latency_seconds_bucket{le="0.1"} 1',
+                'latency_seconds_bucket{le="1"} 2',
+                'latency_seconds_bucket{le="+Inf"} 3',
+                "latency_seconds_sum 3.55",
+                "latency_seconds_count 3",
+                "# HELP lag_blocks Blocks behind.",
+                "# TYPE lag_blocks gauge",
+                "lag_blocks 7",
+                "# HELP ratio Not measured yet.",
+                "# TYPE ratio gauge",
+            ],
+        )
+
+    def test_reregistering_returns_the_same_metric(self) -> None:
+        registry = MetricsRegistry()
+        first = registry.counter("calls_total", "Calls made.", ("method",))
+
+        self.assertIs(registry.counter("calls_total", "Calls made.", ("method",)), first)
+        with self.assertRaises(ValueError):
+            registry.histogram("calls_total", "Calls made.", ("method",))
+
+    def test_metric_kinds_must_define_samples(self) -> None:
+        with self.assertRaises(TypeError):
+            _Metric("plain", "No samples.")
+
+    def test_failing_gauge_is_skipped(self) -> None:
+        registry = MetricsRegistry()
+        registry.gauge("broken", "Raises.", lambda: 1 / 0)
+        registry.gauge("ok", "Works.", lambda: 1)
+
+        self.assertEqual(registry.render().splitlines()[-1], "ok 1")
+
+
+class MetricsServerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_serves_rpc_metrics_by_method(self) -> None:
+        rpc = FakeJsonRpcServer()
+        await rpc.server.start_server()
+        self.addAsyncCleanup(rpc.server.close)
+        before = metrics.RPC_REQUESTS.value("eth_blockNumber", "ok")
+
+        async with AsyncRpcClient(rpc_urls=[rpc.url]) as client:
+            await client.latest_block_number()
+
+        async with MetricsServer(registry=metrics.REGISTRY, host="127.0.0.1", port=0) as server:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(f"http://127.0.0.1:{server.port}/metrics") as response:
+                    body = await response.text()
+                    content_type = response.headers["Content-Type"]
+
+        self.assertEqual(metrics.RPC_REQUESTS.value("eth_blockNumber", "ok"), before + 1)
+        self.assertTrue(content_type.startswith("text/plain; version=0.0.4"))
+        self.assertIn('polymarkt_rpc_requests_total{method="eth_blockNumber",outcome="ok"}', body)
+        self.assertIn('polymarkt_rpc_request_duration_seconds_count{method="eth_blockNumber"}', body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,19 +1,59 @@
+import asyncio
+import threading
+import time
 import unittest
 
+from polymarkt_monitoring.clients.price_feed import StalePriceError
 from polymarkt_monitoring.config import MonitorConfig
 from polymarkt_monitoring.models import BetCandidate
 from polymarkt_monitoring.services import BetEvaluator, MonitoringService
+from polymarkt_monitoring.services.pipeline import CommitBatch
+from polymarkt_monitoring.tracing import AlertTracer
 
 
 class FakeRpcClient:
-    def __init__(self, latest_block_number: int = 100) -> None:
+    def __init__(
+        self,
+        latest_block_number: int = 100,
+        native_transfers: dict[int, list[dict]] | None = None,
+        erc20_transfers: list[dict] | None = None,
+        tx_counts: dict[str, int] | Exception | None = None,
+    ) -> None:
         self._latest_block_number = latest_block_number
+        self.tx_counts = tx_counts if tx_counts is not None else {}
+        self.tx_count_requests: list[tuple[set[str], int]] = []
+        self.native_transfers = native_transfers or {}
+        self.erc20_transfers = erc20_transfers or []
+        self.erc20_queries: list[dict] = []
+        self.timestamp_requests: list[set[int]] = []
 
-    def latest_block_number(self) -> int:
+    async def latest_block_number(self) -> int:
         return self._latest_block_number
 
-    def get_block_timestamp(self, block_number: int) -> int:
-        return 1700000000 + block_number
+    async def get_block_timestamps(self, block_numbers) -> dict[int, int]:
+        requested = set(block_numbers)
+        self.timestamp_requests.append(requested)
+        return {number: 1700000000 + number for number in requested}
+
+    async def get_native_transfers_range(self, from_block: int, to_block: int, target_addresses: set[str]) -> list[dict]:
+        return [
+            {
+                "block_number": number,
+                "timestamp": 1700000000 + number,
+                "transfers": self.native_transfers.get(number, []),
+            }
+            for number in range(from_block, to_block + 1)
+        ]
+
+    async def get_transaction_counts(self, wallet_addresses, block_number: int) -> dict[str, int]:
+        self.tx_count_requests.append((set(wallet_addresses), block_number))
+        if isinstance(self.tx_counts, Exception):
+            raise self.tx_counts
+        return dict(self.tx_counts)
+
+    async def get_erc20_transfers(self, **query) -> list[dict]:
+        self.erc20_queries.append(query)
+        return self.erc20_transfers
 
 
 class FakePricingClient:
@@ -21,19 +61,59 @@ class FakePricingClient:
         return 1.0
 
 
+class FakeHistoricalPricingClient:
+    def __init__(self, missing_after: int | None = None) -> None:
+        self.prepared: list[tuple[int, int]] = []
+        self.missing_after = missing_after
+
+    async def prepare(self, from_timestamp: int, to_timestamp: int) -> None:
+        self.prepared.append((from_timestamp, to_timestamp))
+
+    def get_usd_price_at(self, asset_id: str, timestamp: int) -> float:
+        if self.missing_after is not None and timestamp >= self.missing_after:
+            raise StalePriceError(f"No price for {asset_id} near {timestamp}")
+        # Price doubles after block 15 so only later transfers clear the threshold.
+        return 2.0 if timestamp >= 1700000015 else 1.0
+
+
 class FakeExplorerClient:
     def __init__(self, responses: list[int | Exception]) -> None:
         self.responses = list(responses)
         self.calls = 0
+        self.attempts: list[int] = []
+
+    def cached_transaction_count(self, wallet_address: str) -> None:
+        return None
 
-    def get_transaction_count(self, wallet_address: str) -> int:
+    def get_transaction_count(self, wallet_address: str, *, attempts: int = 3) -> int:
         self.calls += 1
+        self.attempts.append(attempts)
         response = self.responses.pop(0)
         if isinstance(response, Exception):
             raise response
         return response
 
 
+class SlowExplorerClient:
+    def __init__(self, tx_count: int = 1) -> None:
+        self.tx_count = tx_count
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def cached_transaction_count(self, wallet_address: str) -> None:
+        return None
+
+    def get_transaction_count(self, wallet_address: str, *, attempts: int = 3) -> int:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self.in_flight -= 1
+        return self.tx_count
+
+
 class FakeNotifier:
     def __init__(self, failures: int = 0) -> None:
         self.failures = failures
@@ -48,13 +128,47 @@ class FakeNotifier:
         self.messages.append(text)
 
 
-def build_config(*, start_block: int | None = None) -> MonitorConfig:
+class RecordingTraceExporter:
+    def __init__(self) -> None:
+        self.traces = []
+
+    async def export(self, trace) -> None:
+        self.traces.append(trace)
+
+    async def close(self) -> None:
+        return None
+
+
+class GatedAsyncNotifier:
+    """Queued notifier stand-in: accepts alerts at once but acknowledges them only when released."""
+
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+        self.waiting = 0
+        self.release = asyncio.Event()
+
+    async def send_message(self, text: str) -> None:
+        self.messages.append(text)
+        self.waiting += 1
+        await self.release.wait()
+
+
+def build_config(
+    *,
+    start_block: int | None = None,
+    token_contracts: dict[str, str] | None = None,
+    token_decimals: dict[str, int] | None = None,
+    novelty_backend: str = "explorer",
+    explorer_concurrency: int = 4,
+    explorer_calls_per_second: float = 1_000.0,
+    pricing_mode: str = "spot",
+) -> MonitorConfig:
     return MonitorConfig(
         chain_name="polygon",
         rpc_urls=["https://polygon-rpc.com"],
         bet_contract_addresses=["0x1111111111111111111111111111111111111111"],
-        token_contracts={},
-        token_decimals={},
+        token_contracts=token_contracts or {},
+        token_decimals=token_decimals or {},
         token_coingecko_ids={},
         native_symbol="MATIC",
         native_coingecko_id="matic-network",
@@ -70,6 +184,24 @@ def build_config(*, start_block: int | None = None) -> MonitorConfig:
         telegram_bot_token="token",
         telegram_chat_id="chat",
         log_level="INFO",
+        novelty_backend=novelty_backend,
+        explorer_concurrency=explorer_concurrency,
+        explorer_calls_per_second=explorer_calls_per_second,
+        pricing_mode=pricing_mode,
+    )
+
+
+def make_candidate(wallet_address: str, tx_hash: str) -> BetCandidate:
+    return BetCandidate(
+        wallet_address=wallet_address,
+        tx_hash=tx_hash,
+        block_number=77,
+        timestamp=1700000077,
+        contract_address="0x1111111111111111111111111111111111111111",
+        token_symbol="USDC",
+        token_amount=6000.0,
+        usd_value=6000.0,
+        source="erc20_transfer",
     )
 
 
@@ -84,7 +216,201 @@ class MonitoringServiceTests(unittest.TestCase):
             evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
         )
 
-        self.assertEqual(service._initial_block(), 41)
+        self.assertEqual(asyncio.run(service._initial_block()), 41)
+
+    def test_native_candidates_take_timestamps_from_fetched_blocks(self) -> None:
+        rpc = FakeRpcClient(
+            native_transfers={
+                12: [
+                    {
+                        "wallet_address": "0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+                        "contract_address": "0x1111111111111111111111111111111111111111",
+                        "tx_hash": "0xbeef",
+                        "block_number": 12,
+                        "raw_amount": 6000 * 10**18,
+                    }
+                ]
+            }
+        )
+        service = MonitoringService(
+            config=build_config(),
+            rpc_client=rpc,
+            pricing_client=FakePricingClient(),
+            explorer_client=FakeExplorerClient([]),
+            notifier=FakeNotifier(),
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+        )
+
+        candidates = asyncio.run(
+            service._collect_native_candidates(1, 20, {"0x1111111111111111111111111111111111111111"})
+        )
+
+        self.assertEqual([candidate.tx_hash for candidate in candidates], ["0xbeef"])
+        self.assertEqual(candidates[0].timestamp, 1700000012)
+        self.assertEqual(rpc.timestamp_requests, [])
+        self.assertEqual(len(service._timestamp_cache), 20)
+
+    def test_historical_pricing_values_transfers_at_their_block_time(self) -> None:
+        contract = "0x1111111111111111111111111111111111111111"
+        rpc = FakeRpcClient(
+            native_transfers={
+                number: [
+                    {
+                        "wallet_address": "0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+                        "contract_address": contract,
+                        "tx_hash": f"0x{number:02x}",
+                        "block_number": number,
+                        "raw_amount": 3000 * 10**18,
+                    }
+                ]
+                for number in (10, 20)
+            }
+        )
+        pricing = FakeHistoricalPricingClient()
+        service = MonitoringService(
+            config=build_config(pricing_mode="historical"),
+            rpc_client=rpc,
+            pricing_client=pricing,
+            explorer_client=FakeExplorerClient([]),
+            notifier=FakeNotifier(),
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+        )
+
+        candidates = asyncio.run(service._collect_native_candidates(1, 30, {contract}))
+
+        self.assertEqual([(c.block_number, c.usd_value) for c in candidates], [(20, 6000.0)])
+        self.assertEqual(pricing.prepared, [(1700000010, 1700000020)])
+
+    def test_transfer_without_a_historical_price_is_skipped(self) -> None:
+        contract = "0x1111111111111111111111111111111111111111"
+        transfer = {
+            "wallet_address": "0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+            "contract_address": contract,
+            "tx_hash": "0x14",
+            "block_number": 20,
+            "raw_amount": 3000 * 10**18,
+        }
+        pricing = FakeHistoricalPricingClient(missing_after=1700000015)
+        service = MonitoringService(
+            config=build_config(pricing_mode="historical"),
+            rpc_client=FakeRpcClient(
+                native_transfers={10: [{**transfer, "tx_hash": "0x0a", "block_number": 10}], 20: [transfer]}
+            ),
+            pricing_client=pricing,
+            explorer_client=FakeExplorerClient([]),
+            notifier=FakeNotifier(),
+            evaluator=BetEvaluator(usd_threshold=1000.0, wallet_max_tx_count=5),
+        )
+
+        with self.assertLogs(level="WARNING") as logs:
+            candidates = asyncio.run(service._collect_native_candidates(1, 30, {contract}))
+
+        self.assertEqual([c.tx_hash for c in candidates], ["0x0a"])
+        self.assertIn("Skipping transfer without a historical price", logs.output[0])
+
+    def test_erc20_transfers_are_queried_once_and_mapped_to_token_symbols(self) -> None:
+        usdc = "0x2222222222222222222222222222222222222222"
+        weth = "0x3333333333333333333333333333333333333333"
+        rpc = FakeRpcClient(
+            erc20_transfers=[
+                {
+                    "wallet_address": "0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+                    "contract_address": "0x1111111111111111111111111111111111111111",
+                    "token_address": token,
+                    "tx_hash": tx_hash,
+                    "block_number": block_number,
+                    "raw_amount": raw_amount,
+                }
+                for token, tx_hash, block_number, raw_amount in [
+                    (usdc, "0x01", 30, 6000 * 10**6),
+                    (weth, "0x02", 31, 7000 * 10**18),
+                    (usdc, "0x03", 32, 10 * 10**6),
+                ]
+            ]
+        )
+        service = MonitoringService(
+            config=build_config(
+                token_contracts={"USDC": usdc, "WETH": weth},
+                token_decimals={"USDC": 6, "WETH": 18},
+            ),
+            rpc_client=rpc,
+            pricing_client=FakePricingClient(),
+            explorer_client=FakeExplorerClient([]),
+            notifier=FakeNotifier(),
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+        )
+
+        candidates = asyncio.run(
+            service._collect_erc20_candidates(25, 35, {"0x1111111111111111111111111111111111111111"})
+        )
+
+        self.assertEqual(len(rpc.erc20_queries), 1)
+        self.assertEqual(set(rpc.erc20_queries[0]["token_addresses"]), {usdc, weth})
+        self.assertEqual([(c.tx_hash, c.token_symbol) for c in candidates], [("0x01", "USDC"), ("0x02", "WETH")])
+        self.assertEqual(rpc.timestamp_requests, [{30, 31}])
+        self.assertEqual(candidates[1].timestamp, 1700000031)
+
+    def test_rpc_novelty_backend_batches_wallet_lookups_at_range_end(self) -> None:
+        wallets = ["0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa", "0xbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb"]
+        rpc = FakeRpcClient(tx_counts={wallets[0]: 1, wallets[1]: 40})
+        explorer = FakeExplorerClient([])
+        notifier = FakeNotifier()
+        service = MonitoringService(
+            config=build_config(novelty_backend="rpc"),
+            rpc_client=rpc,
+            pricing_client=FakePricingClient(),
+            explorer_client=explorer,
+            notifier=notifier,
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+        )
+        candidates = [make_candidate(wallet, f"0x0{index}") for index, wallet in enumerate(wallets)]
+
+        asyncio.run(service.evaluate_and_alert(candidates, block_number=90))
+
+        self.assertEqual(rpc.tx_count_requests, [(set(wallets), 90)])
+        self.assertEqual(explorer.calls, 0)
+        self.assertEqual(len(notifier.messages), 1)
+
+    def test_rpc_novelty_backend_falls_back_to_explorer(self) -> None:
+        rpc = FakeRpcClient(tx_counts=RuntimeError("batch rejected"))
+        explorer = FakeExplorerClient([2])
+        service = MonitoringService(
+            config=build_config(novelty_backend="rpc"),
+            rpc_client=rpc,
+            pricing_client=FakePricingClient(),
+            explorer_client=explorer,
+            notifier=FakeNotifier(),
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+        )
+        candidates = [make_candidate("0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa", "0x01")]
+
+        asyncio.run(service.evaluate_and_alert(candidates, block_number=90))
+
+        self.assertEqual(explorer.calls, 1)
+
+    def test_candidates_are_enriched_concurrently_with_per_wallet_order(self) -> None:
+        explorer = SlowExplorerClient()
+        notifier = FakeNotifier()
+        service = MonitoringService(
+            config=build_config(explorer_concurrency=3),
+            rpc_client=FakeRpcClient(),
+            pricing_client=FakePricingClient(),
+            explorer_client=explorer,
+            notifier=notifier,
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+        )
+        candidates = [make_candidate(f"0x{index % 6:040x}", f"0x{index:02x}") for index in range(18)]
+        candidates.append(candidates[0])
+
+        asyncio.run(service.evaluate_and_alert(candidates))
+
+        self.assertEqual(explorer.max_in_flight, 3)
+        self.assertEqual(len(notifier.messages), 18)
+        first_wallet_messages = [message for message in notifier.messages if f"Wallet: 0x{0:040x}" in message]
+        self.assertEqual(
+            [message.splitlines()[2] for message in first_wallet_messages],
+            ["Tx: 0x00", "Tx: 0x06", "Tx: 0x0c"],
+        )
 
     def test_failed_notification_is_retried_from_pending_queue(self) -> None:
         explorer = FakeExplorerClient([1, 1])
@@ -109,16 +435,279 @@ class MonitoringServiceTests(unittest.TestCase):
             source="erc20_transfer",
         )
 
-        service._evaluate_and_alert([candidate])
+        asyncio.run(service.evaluate_and_alert([candidate]))
         self.assertIn(candidate.dedup_key, service._pending_candidates)
         self.assertEqual(len(notifier.messages), 0)
 
-        service._retry_pending_candidates()
+        asyncio.run(service._retry_pending_candidates())
         self.assertNotIn(candidate.dedup_key, service._pending_candidates)
         self.assertIn(candidate.dedup_key, service._seen_event_keys)
         self.assertEqual(len(notifier.messages), 1)
         self.assertEqual(explorer.calls, 2)
 
+    def test_pending_candidate_is_not_retried_before_its_backoff(self) -> None:
+        explorer = FakeExplorerClient([RuntimeError("explorer down")])
+        service = MonitoringService(
+            config=build_config(),
+            rpc_client=FakeRpcClient(),
+            pricing_client=FakePricingClient(),
+            explorer_client=explorer,
+            notifier=FakeNotifier(),
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+        )
+        candidate = make_candidate("0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa", "0xdeadbeef")
+        asyncio.run(service.evaluate_and_alert([candidate]))
+
+        async def scenario() -> bool:
+            async with service._pipeline():
+                batch = await service._dispatch_pending()
+                return batch.complete
+
+        self.assertTrue(asyncio.run(scenario()))
+        self.assertIn(candidate.dedup_key, service._pending_candidates)
+        self.assertEqual(explorer.calls, 1)
+
+    def test_every_explorer_request_spends_one_quota_token(self) -> None:
+        explorer = FakeExplorerClient([RuntimeError("429 Too Many Requests"), 1])
+        service = MonitoringService(
+            config=build_config(),
+            rpc_client=FakeRpcClient(),
+            pricing_client=FakePricingClient(),
+            explorer_client=explorer,
+            notifier=FakeNotifier(),
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+        )
+        candidate = make_candidate("0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa", "0xdeadbeef")
+
+        asyncio.run(service.evaluate_and_alert([candidate]))
+        asyncio.run(service._retry_pending_candidates())
+
+        self.assertIn(candidate.dedup_key, service._seen_event_keys)
+        self.assertEqual(explorer.attempts, [1, 1])
+        self.assertEqual(service.explorer_quota.used_today, explorer.calls)
+
+
+    def test_run_once_alerts_and_checkpoints_every_range(self) -> None:
+        contract = "0x1111111111111111111111111111111111111111"
+        rpc = FakeRpcClient(
+            latest_block_number=160,
+            native_transfers={
+                number: [
+                    {
+                        "wallet_address": f"0x{number:040x}",
+                        "contract_address": contract,
+                        "tx_hash": f"0x{number:064x}",
+                        "block_number": number,
+                        "raw_amount": 6000 * 10**18,
+                    }
+                ]
+                for number in (12, 70, 130)
+            },
+        )
+        notifier = FakeNotifier()
+        service = MonitoringService(
+            config=build_config(start_block=1),
+            rpc_client=rpc,
+            pricing_client=FakePricingClient(),
+            explorer_client=FakeExplorerClient([1, 1, 1]),
+            notifier=notifier,
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+        )
+
+        asyncio.run(service.run(once=True))
+
+        self.assertEqual([message.splitlines()[3] for message in notifier.messages], ["Block: 12", "Block: 70", "Block: 130"])
+        self.assertEqual(service._checkpoint, 158)
+        self.assertEqual(service.queue_depths(), {"ranges": 0, "enrich": 0, "notify": 0, "open_ranges": 0})
+        self.assertGreater(service.blocks_per_second, 0)
+
+    def test_sent_alerts_are_traced_and_old_wallets_are_not(self) -> None:
+        contract = "0x1111111111111111111111111111111111111111"
+        rpc = FakeRpcClient(
+            latest_block_number=60,
+            native_transfers={
+                number: [
+                    {
+                        "wallet_address": f"0x{number:040x}",
+                        "contract_address": contract,
+                        "tx_hash": f"0x{number:064x}",
+                        "block_number": number,
+                        "raw_amount": 6000 * 10**18,
+                    }
+                ]
+                for number in (12, 30)
+            },
+            tx_counts={f"0x{12:040x}": 1, f"0x{30:040x}": 50},
+        )
+        exporter = RecordingTraceExporter()
+        tracer = AlertTracer(exporters=[exporter])
+        service = MonitoringService(
+            config=build_config(start_block=1, novelty_backend="rpc"),
+            rpc_client=rpc,
+            pricing_client=FakePricingClient(),
+            explorer_client=FakeExplorerClient([]),
+            notifier=FakeNotifier(),
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+            tracer=tracer,
+        )
+
+        async def scenario() -> None:
+            async with tracer:
+                await service.run(once=True)
+
+        asyncio.run(scenario())
+
+        self.assertEqual([trace.block_number for trace in exporter.traces], [12])
+        trace = exporter.traces[0]
+        self.assertEqual(trace.block_timestamp, 1700000012)
+        marks = [
+            trace.confirmed_at,
+            trace.range_fetched_at,
+            trace.candidate_built_at,
+            trace.novelty_resolved_at,
+            trace.acknowledged_at,
+        ]
+        self.assertEqual(marks, sorted(marks))
+        self.assertEqual(len(tracer), 0)
+        self.assertIsNotNone(service.head_lag_seconds)
+
+    def test_head_lag_counts_scheduled_blocks_until_checkpointed(self) -> None:
+        rpc = FakeRpcClient(
+            latest_block_number=100,
+            native_transfers={
+                12: [
+                    {
+                        "wallet_address": f"0x{12:040x}",
+                        "contract_address": "0x1111111111111111111111111111111111111111",
+                        "tx_hash": f"0x{12:064x}",
+                        "block_number": 12,
+                        "raw_amount": 6000 * 10**18,
+                    }
+                ]
+            },
+            tx_counts={f"0x{12:040x}": 1},
+        )
+        held_alerts: list[str] = []
+        released = asyncio.Event()
+
+        class HeldNotifier:
+            async def send_message(self, text: str) -> None:
+                held_alerts.append(text)
+                await released.wait()
+
+        service = MonitoringService(
+            config=build_config(start_block=1, novelty_backend="rpc"),
+            rpc_client=rpc,
+            pricing_client=FakePricingClient(),
+            explorer_client=FakeExplorerClient([]),
+            notifier=HeldNotifier(),
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+        )
+        self.assertIsNone(service.head_lag_blocks)
+
+        async def scenario() -> tuple[int, int]:
+            run = asyncio.create_task(service.run(once=True))
+            while not held_alerts:
+                await asyncio.sleep(0.01)
+            # The range holding block 12 is scheduled, but its held alert keeps the checkpoint before it.
+            held = service.head_lag_blocks
+            released.set()
+            await run
+            return held, service.head_lag_blocks
+
+        held, settled = asyncio.run(scenario())
+
+        self.assertGreater(held, 98 - 12)
+        self.assertEqual(settled, 0)
+
+    def test_queued_notifier_does_not_block_extraction(self) -> None:
+        contract = "0x1111111111111111111111111111111111111111"
+        rpc = FakeRpcClient(
+            latest_block_number=160,
+            native_transfers={
+                number: [
+                    {
+                        "wallet_address": f"0x{number:040x}",
+                        "contract_address": contract,
+                        "tx_hash": f"0x{number:064x}",
+                        "block_number": number,
+                        "raw_amount": 6000 * 10**18,
+                    }
+                ]
+                for number in (12, 70, 130)
+            },
+        )
+        notifier = GatedAsyncNotifier()
+        service = MonitoringService(
+            config=build_config(start_block=1),
+            rpc_client=rpc,
+            pricing_client=FakePricingClient(),
+            explorer_client=FakeExplorerClient([1, 1, 1]),
+            notifier=notifier,
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+        )
+
+        async def scenario() -> tuple[int | None, dict[str, int]]:
+            run = asyncio.create_task(service.run(once=True))
+            while notifier.waiting < 3:
+                await asyncio.sleep(0.01)
+            held = (service._checkpoint, service.queue_depths())
+            notifier.release.set()
+            await run
+            return held
+
+        checkpoint, depths = asyncio.run(scenario())
+
+        # Every range was extracted while no alert was acknowledged, but none was checkpointed.
+        self.assertEqual(checkpoint, 0)
+        self.assertEqual(depths, {"ranges": 0, "enrich": 0, "notify": 0, "open_ranges": 4})
+        self.assertEqual(service._checkpoint, 158)
+        self.assertEqual(len(notifier.messages), 3)
+
+    def test_checkpoint_waits_for_earlier_ranges_to_commit(self) -> None:
+        service = MonitoringService(
+            config=build_config(),
+            rpc_client=FakeRpcClient(),
+            pricing_client=FakePricingClient(),
+            explorer_client=FakeExplorerClient([]),
+            notifier=FakeNotifier(),
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+        )
+        service._checkpoint = 0
+
+        async def scenario() -> list[int | None]:
+            async with service._pipeline():
+                first = CommitBatch(1, from_block=1, to_block=50)
+                second = CommitBatch(1, from_block=51, to_block=100)
+                service._open_ranges.extend([first, second])
+                checkpoints = []
+                second.commit_one()
+                await service._on_batch_committed(second)
+                checkpoints.append(service._checkpoint)
+                first.commit_one()
+                await service._on_batch_committed(first)
+                checkpoints.append(service._checkpoint)
+                return checkpoints
+
+        self.assertEqual(asyncio.run(scenario()), [0, 100])
+
+    def test_failed_stage_surfaces_instead_of_hanging(self) -> None:
+        class BrokenRpcClient(FakeRpcClient):
+            async def get_native_transfers_range(self, from_block, to_block, target_addresses):
+                raise RuntimeError("rpc down")
+
+        service = MonitoringService(
+            config=build_config(start_block=1),
+            rpc_client=BrokenRpcClient(),
+            pricing_client=FakePricingClient(),
+            explorer_client=FakeExplorerClient([]),
+            notifier=FakeNotifier(),
+            evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+        )
+
+        with self.assertRaisesRegex(RuntimeError, "rpc down"):
+            asyncio.run(service.run(once=True))
+
 
 if __name__ == "__main__":
     unittest.main()
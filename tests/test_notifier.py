@@ -0,0 +1,135 @@
+import asyncio
+import time
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from polymarkt_monitoring.breaker import CircuitBreaker, CircuitOpenError
+from polymarkt_monitoring.clients.notifier import AsyncTelegramNotifier, TelegramSendError, TelegramUnavailableError
+
+
+class FakeTelegramServer:
+    def __init__(
+        self, *, rate_limit_first: int = 0, retry_after: float = 1, status: int = 200, reject_containing: str = ""
+    ) -> None:
+        self.rate_limit_first = rate_limit_first
+        self.retry_after = retry_after
+        self.status = status
+        self.reject_containing = reject_containing
+        self.messages: list[str] = []
+        self.request_times: list[float] = []
+        self.delay = 0.0
+        app = web.Application()
+        app.router.add_post("/bot{token}/sendMessage", self._handle)
+        self.server = TestServer(app)
+
+    @property
+    def api_base(self) -> str:
+        return str(self.server.make_url("")).rstrip("/")
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.request_times.append(time.monotonic())
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.rate_limit_first > 0:
+            self.rate_limit_first -= 1
+            body = {"ok": False, "error_code": 429, "parameters": {"retry_after": self.retry_after}}
+            return web.json_response(body, status=429)
+        if self.status != 200:
+            return web.json_response({"ok": False, "error_code": self.status}, status=self.status)
+        if self.reject_containing and self.reject_containing in payload["text"]:
+            return web.json_response({"ok": False, "error_code": 400}, status=400)
+        self.messages.append(payload["text"])
+        return web.json_response({"ok": True, "result": {"message_id": len(self.messages)}})
+
+
+class AsyncTelegramNotifierTests(unittest.IsolatedAsyncioTestCase):
+    async def start(self, server: FakeTelegramServer, **kwargs) -> AsyncTelegramNotifier:
+        await server.server.start_server()
+        self.addAsyncCleanup(server.server.close)
+        notifier = AsyncTelegramNotifier(bot_token="token", chat_id="1", api_base=server.api_base, **kwargs)
+        self.addAsyncCleanup(notifier.close)
+        return notifier
+
+    async def test_send_resolves_after_delivery(self) -> None:
+        server = FakeTelegramServer()
+        notifier = await self.start(server)
+
+        await notifier.send_message("hello")
+
+        self.assertEqual(server.messages, ["hello"])
+        self.assertEqual(notifier.alerts_sent, 1)
+
+    async def test_rate_limit_waits_for_retry_after(self) -> None:
+        server = FakeTelegramServer(rate_limit_first=1, retry_after=1)
+        notifier = await self.start(server, max_attempts=1)
+
+        await notifier.send_message("hello")
+
+        self.assertEqual(server.messages, ["hello"])
+        self.assertEqual(notifier.rate_limited, 1)
+        self.assertGreaterEqual(server.request_times[1] - server.request_times[0], 0.95)
+
+    async def test_persistent_rate_limit_drops_the_message(self) -> None:
+        server = FakeTelegramServer(rate_limit_first=100, retry_after=0.2)
+        notifier = await self.start(server, max_rate_limit_wait_seconds=0.5)
+
+        with self.assertLogs("polymarkt_monitoring.clients.notifier", level="WARNING") as logs:
+            with self.assertRaises(TelegramUnavailableError):
+                await notifier.send_message("hello")
+
+        # Two waits of 0.2s fit the cap; the third 429 would exceed it.
+        self.assertEqual(len(server.request_times), 3)
+        self.assertTrue(any("Dropping Telegram message" in line for line in logs.output))
+
+    async def test_backlog_is_coalesced_within_size_limit(self) -> None:
+        server = FakeTelegramServer()
+        notifier = await self.start(server, messages_per_second=5, max_message_chars=25)
+
+        await asyncio.gather(*(notifier.send_message(f"alert-{index}") for index in range(5)))
+
+        # All five queue before the sender runs; 25 characters fit three alerts plus separators.
+        self.assertEqual(server.messages, ["alert-0\n\nalert-1\n\nalert-2", "alert-3\n\nalert-4"])
+        self.assertEqual(notifier.messages_sent, 2)
+        self.assertEqual(notifier.alerts_sent, 5)
+
+    async def test_permanent_failure_is_raised_to_every_caller(self) -> None:
+        server = FakeTelegramServer(status=400)
+        notifier = await self.start(server)
+
+        results = await asyncio.gather(notifier.send_message("a"), return_exceptions=True)
+
+        self.assertIsInstance(results[0], TelegramSendError)
+
+    async def test_rejected_batch_is_resent_one_alert_at_a_time(self) -> None:
+        server = FakeTelegramServer(reject_containing="bad")
+        notifier = await self.start(server, messages_per_second=50)
+
+        results = await asyncio.gather(
+            *(notifier.send_message(text) for text in ("alert-0", "bad", "alert-2")), return_exceptions=True
+        )
+
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], TelegramSendError)
+        self.assertIsNone(results[2])
+        self.assertEqual(server.messages, ["alert-0", "alert-2"])
+        self.assertEqual(notifier.alerts_sent, 2)
+
+    async def test_open_breaker_fails_alerts_without_calling_telegram(self) -> None:
+        server = FakeTelegramServer(status=502)
+        breaker = CircuitBreaker("telegram", failure_threshold=1, reset_timeout_seconds=60)
+        notifier = await self.start(server, max_attempts=1, breaker=breaker)
+
+        with self.assertRaises(TelegramUnavailableError):
+            await notifier.send_message("a")
+        with self.assertRaises(CircuitOpenError):
+            await notifier.send_message("b")
+
+        self.assertEqual(len(server.request_times), 1)
+        self.assertEqual(breaker.state, "open")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from polymarkt_monitoring.clients.novelty_cache import WalletNoveltyCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class WalletNoveltyCacheTests(unittest.TestCase):
+    def test_known_old_wallets_never_expire(self) -> None:
+        clock = FakeClock()
+        cache = WalletNoveltyCache(novelty_threshold=5, new_wallet_ttl_seconds=30, clock=clock)
+        cache.put("0xold", 12)
+        cache.put("0xnew", 1)
+
+        clock.now += 31
+
+        self.assertEqual(cache.get("0xold"), 12)
+        self.assertIsNone(cache.get("0xnew"))
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.permanent_entries), (1, 1, 1))
+
+    def test_evicts_least_recently_used_wallet(self) -> None:
+        cache = WalletNoveltyCache(novelty_threshold=5, max_entries=2)
+        cache.put("0xa", 9)
+        cache.put("0xb", 9)
+        cache.get("0xa")
+        cache.put("0xc", 9)
+
+        self.assertIsNone(cache.get("0xb"))
+        self.assertEqual(cache.get("0xa"), 9)
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_lower_count_does_not_downgrade_known_old_wallet(self) -> None:
+        cache = WalletNoveltyCache(novelty_threshold=5)
+        cache.put("0xa", 9)
+        cache.put("0xa", 2)
+
+        self.assertEqual(cache.get("0xa"), 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
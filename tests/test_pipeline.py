@@ -0,0 +1,61 @@
+import asyncio
+import unittest
+
+from polymarkt_monitoring.services.pipeline import CommitBatch, ShardedQueue, StageGroup
+
+
+class PipelineTests(unittest.TestCase):
+    def test_commit_batch_completes_on_last_commit(self) -> None:
+        batch = CommitBatch(2, from_block=1, to_block=10)
+
+        self.assertFalse(batch.commit_one())
+        self.assertTrue(batch.commit_one())
+        self.assertTrue(batch.complete)
+        self.assertTrue(CommitBatch(0).complete)
+        with self.assertRaises(RuntimeError):
+            batch.commit_one()
+
+    def test_sharded_queue_routes_keys_to_a_stable_shard(self) -> None:
+        async def scenario() -> list[list[str]]:
+            queue: ShardedQueue[str] = ShardedQueue(shards=3, maxsize=10)
+            for index in range(12):
+                await queue.put(f"wallet-{index % 4}", f"wallet-{index % 4}:{index}")
+            self.assertEqual(queue.qsize(), 12)
+            return [[item.get_nowait() for _ in range(item.qsize())] for item in queue.queues]
+
+        for shard in asyncio.run(scenario()):
+            for wallet in {entry.split(":")[0] for entry in shard}:
+                sequence = [int(entry.split(":")[1]) for entry in shard if entry.startswith(f"{wallet}:")]
+                self.assertEqual(len(sequence), 3)
+                self.assertEqual(sequence, sorted(sequence))
+
+    def test_full_queue_applies_backpressure(self) -> None:
+        async def scenario() -> bool:
+            queue: ShardedQueue[int] = ShardedQueue(shards=1, maxsize=1)
+            await queue.put("a", 1)
+            try:
+                await asyncio.wait_for(queue.put("a", 2), timeout=0.05)
+            except asyncio.TimeoutError:
+                return True
+            return False
+
+        self.assertTrue(asyncio.run(scenario()))
+
+    def test_stage_group_raises_the_first_stage_failure(self) -> None:
+        async def failing_stage() -> None:
+            raise ValueError("boom")
+
+        async def scenario() -> None:
+            stages = StageGroup()
+            stages.start("broken", failing_stage())
+            try:
+                await stages.wait_for(asyncio.Event().wait())
+            finally:
+                await stages.stop()
+
+        with self.assertRaisesRegex(ValueError, "boom"):
+            asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
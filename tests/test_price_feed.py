@@ -0,0 +1,81 @@
+import asyncio
+import unittest
+
+from polymarkt_monitoring.clients.price_feed import PriceFeed, StalePriceError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeBatchPricingClient:
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+        self.fail = False
+        self.price = 0.5
+
+    def get_usd_prices(self, asset_ids) -> dict[str, float]:
+        self.requests.append(list(asset_ids))
+        if self.fail:
+            raise RuntimeError("coingecko unavailable")
+        return {asset: self.price for asset in asset_ids}
+
+
+class PriceFeedTests(unittest.TestCase):
+    def test_refresh_fetches_all_assets_in_one_request(self) -> None:
+        client = FakeBatchPricingClient()
+        feed = PriceFeed(pricing_client=client, asset_ids=["matic-network", "USD-Coin", "matic-network", ""])
+
+        asyncio.run(feed.refresh())
+
+        self.assertEqual(client.requests, [["matic-network", "usd-coin"]])
+        self.assertEqual(feed.get_usd_price("usd-coin"), 0.5)
+
+    def test_serves_stale_prices_within_bound_then_fails(self) -> None:
+        clock = FakeClock()
+        client = FakeBatchPricingClient()
+        feed = PriceFeed(
+            pricing_client=client,
+            asset_ids=["matic-network"],
+            refresh_interval_seconds=20,
+            max_staleness_seconds=60,
+            clock=clock,
+        )
+        asyncio.run(feed.refresh())
+        client.fail = True
+
+        clock.now += 59
+        with self.assertRaises(RuntimeError):
+            asyncio.run(feed.refresh())
+        self.assertEqual(feed.get_usd_price("matic-network"), 0.5)
+
+        clock.now += 2
+        with self.assertRaises(StalePriceError):
+            feed.get_usd_price("matic-network")
+        with self.assertRaises(StalePriceError):
+            feed.get_usd_price("unknown-asset")
+
+    def test_background_task_refreshes_ahead_of_reads(self) -> None:
+        client = FakeBatchPricingClient()
+
+        async def scenario() -> float:
+            async with PriceFeed(
+                pricing_client=client,
+                asset_ids=["matic-network"],
+                refresh_interval_seconds=0.01,
+                max_staleness_seconds=1,
+            ) as feed:
+                client.price = 0.75
+                await asyncio.sleep(0.05)
+                return feed.get_usd_price("matic-network")
+
+        self.assertEqual(asyncio.run(scenario()), 0.75)
+        self.assertGreater(len(client.requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
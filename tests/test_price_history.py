@@ -0,0 +1,123 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from polymarkt_monitoring.clients.price_feed import StalePriceError
+from polymarkt_monitoring.clients.price_history import HistoricalPriceFeed
+
+DAY = 86_400
+START = 1_700_000_000
+
+
+class FakeHistoryClient:
+    """Hourly prices equal to the hour index since START."""
+
+    def __init__(self, now: int | None = None) -> None:
+        self.requests: list[tuple[str, int, int]] = []
+        # Like CoinGecko, never return points past ``now``.
+        self.now = now
+
+    def get_usd_price_range(self, asset_id: str, from_timestamp: int, to_timestamp: int) -> list[tuple[int, float]]:
+        self.requests.append((asset_id, from_timestamp, to_timestamp))
+        if self.now is not None:
+            to_timestamp = min(to_timestamp, self.now)
+        first_hour = -(-(from_timestamp - START) // 3_600)
+        last_hour = (to_timestamp - START) // 3_600
+        return [(START + hour * 3_600, float(hour)) for hour in range(first_hour, last_hour + 1)]
+
+
+class HistoricalPriceFeedTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "prices.json"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def build_feed(self, client: FakeHistoryClient) -> HistoricalPriceFeed:
+        return HistoricalPriceFeed(
+            pricing_client=client,
+            asset_ids=["matic-network"],
+            cache_path=self.path,
+            chunk_seconds=30 * DAY,
+            clock=lambda: START + 365 * DAY,
+        )
+
+    def test_long_window_needs_one_request_per_chunk(self) -> None:
+        client = FakeHistoryClient()
+        feed = self.build_feed(client)
+
+        for day in range(0, 60):
+            asyncio.run(feed.prepare(START + day * DAY, START + day * DAY + 3_000))
+
+        self.assertEqual(len(client.requests), 2)
+        self.assertEqual(feed.get_usd_price_at("matic-network", START + 5 * 3_600 + 1_000), 5.0)
+        self.assertEqual(feed.get_usd_price_at("matic-network", START + 5 * 3_600 + 2_000), 6.0)
+
+    def test_window_longer_than_a_chunk_is_split(self) -> None:
+        client = FakeHistoryClient()
+        feed = self.build_feed(client)
+
+        asyncio.run(feed.prepare(START, START + 200 * DAY))
+
+        padding = 2 * feed.max_gap_seconds
+        self.assertEqual(len(client.requests), 7)
+        self.assertTrue(all(to - start - padding < 30 * DAY for _, start, to in client.requests))
+        self.assertEqual(feed.get_usd_price_at("matic-network", START + 100 * DAY), 2_400.0)
+
+    def test_live_ranges_are_served_from_the_last_point_until_it_is_too_old(self) -> None:
+        now = START + 10 * DAY
+        client = FakeHistoryClient(now=now)
+        clock = [now]
+        feed = HistoricalPriceFeed(
+            pricing_client=client,
+            asset_ids=["matic-network"],
+            cache_path=self.path,
+            clock=lambda: clock[0],
+        )
+        asyncio.run(feed.prepare(now - DAY, now))
+
+        for seconds in range(15, 3_600, 15):
+            clock[0] = client.now = now + seconds
+            asyncio.run(feed.prepare(now + seconds - 15, now + seconds))
+
+        self.assertEqual(len(client.requests), 1)
+        self.assertEqual(feed.get_usd_price_at("matic-network", now + 3_000), 240.0)
+
+        clock[0] = client.now = now + 3 * 3_600
+        asyncio.run(feed.prepare(now + 3 * 3_600 - 15, now + 3 * 3_600))
+
+        self.assertEqual(len(client.requests), 2)
+        self.assertEqual(feed.get_usd_price_at("matic-network", now + 3 * 3_600), 243.0)
+
+    def test_cache_file_is_reused_across_runs(self) -> None:
+        asyncio.run(self.build_feed(FakeHistoryClient()).prepare(START, START + 10 * DAY))
+
+        client = FakeHistoryClient()
+        feed = self.build_feed(client)
+        asyncio.run(feed.prepare(START + DAY, START + 2 * DAY))
+
+        self.assertEqual(client.requests, [])
+        self.assertEqual(feed.get_usd_price_at("matic-network", START + DAY), 24.0)
+
+    def test_earlier_window_extends_coverage_backwards(self) -> None:
+        client = FakeHistoryClient()
+        feed = self.build_feed(client)
+        asyncio.run(feed.prepare(START + 40 * DAY, START + 41 * DAY))
+        asyncio.run(feed.prepare(START + 10 * DAY, START + 11 * DAY))
+
+        self.assertEqual(feed.get_usd_price_at("matic-network", START + 20 * DAY), 480.0)
+
+    def test_lookup_far_from_any_point_is_rejected(self) -> None:
+        feed = self.build_feed(FakeHistoryClient())
+        asyncio.run(feed.prepare(START, START + DAY))
+
+        with self.assertRaises(StalePriceError):
+            feed.get_usd_price_at("matic-network", START - 3 * DAY)
+        with self.assertRaises(StalePriceError):
+            feed.get_usd_price_at("weth", START)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import asyncio
+import unittest
+
+from polymarkt_monitoring.breaker import CircuitOpenError
+from polymarkt_monitoring.services.quota import SECONDS_PER_DAY, ExplorerQuota, RetryBackoff
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ExplorerQuotaTests(unittest.IsolatedAsyncioTestCase):
+    async def test_fresh_high_usd_candidates_are_served_first(self) -> None:
+        quota = ExplorerQuota(calls_per_second=20)
+        await quota.acquire(usd_value=1.0)
+        granted: list[str] = []
+
+        async def lookup(name: str, usd_value: float, retry: bool) -> None:
+            await quota.acquire(usd_value=usd_value, retry=retry)
+            granted.append(name)
+
+        await asyncio.gather(
+            lookup("retry-big", 50_000.0, True),
+            lookup("fresh-small", 6_000.0, False),
+            lookup("fresh-big", 20_000.0, False),
+            lookup("retry-small", 5_500.0, True),
+        )
+
+        self.assertEqual(granted, ["fresh-big", "fresh-small", "retry-big", "retry-small"])
+        self.assertEqual(quota.waiting, 0)
+        self.assertEqual(quota.used_today, 5)
+
+    async def test_calls_are_spaced_at_the_configured_rate(self) -> None:
+        quota = ExplorerQuota(calls_per_second=20)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        for _ in range(5):
+            await quota.acquire(usd_value=1.0)
+
+        self.assertGreaterEqual(loop.time() - started, 4 / 20 - 0.01)
+
+    async def test_cancelled_waiter_hands_its_turn_on(self) -> None:
+        quota = ExplorerQuota(calls_per_second=20)
+        await quota.acquire(usd_value=1.0)
+        first = asyncio.create_task(quota.acquire(usd_value=10.0))
+        second = asyncio.create_task(quota.acquire(usd_value=5.0))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.wait_for(second, timeout=1)
+
+        self.assertEqual(quota.waiting, 0)
+        self.assertEqual(quota.used_today, 2)
+
+    async def test_daily_limit_raises_until_next_utc_day(self) -> None:
+        clock = FakeClock(now=10 * SECONDS_PER_DAY + 100)
+        quota = ExplorerQuota(calls_per_second=1, daily_limit=2, clock=clock)
+
+        await quota.acquire(usd_value=1.0)
+        clock.now += 1
+        await quota.acquire(usd_value=1.0)
+        self.assertEqual(quota.remaining_today, 0)
+
+        with self.assertRaises(CircuitOpenError) as raised:
+            await quota.acquire(usd_value=1.0)
+        self.assertAlmostEqual(raised.exception.retry_in_seconds, SECONDS_PER_DAY - 101)
+
+        clock.now = 11 * SECONDS_PER_DAY
+        await quota.acquire(usd_value=1.0)
+        self.assertEqual(quota.remaining_today, 1)
+
+
+class RetryBackoffTests(unittest.TestCase):
+    def test_delay_doubles_per_failure_up_to_max(self) -> None:
+        clock = FakeClock()
+        backoff = RetryBackoff(base_seconds=10, max_seconds=25, clock=clock)
+
+        self.assertTrue(backoff.due("a"))
+        self.assertEqual([backoff.failed("a") for _ in range(3)], [10, 20, 25])
+        self.assertFalse(backoff.due("a"))
+        self.assertTrue(backoff.due("b"))
+
+        clock.now = 25
+        self.assertTrue(backoff.due("a"))
+
+        backoff.clear("a")
+        self.assertEqual(backoff.failed("a"), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from polymarkt_monitoring.ratelimit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_burst_then_refill_at_rate(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(rate=0.5, capacity=2, clock=clock)
+
+        self.assertTrue(bucket.try_acquire())
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+        self.assertAlmostEqual(bucket.delay(), 2.0)
+
+        clock.now = 1.0
+        self.assertAlmostEqual(bucket.delay(), 1.0)
+        clock.now = 2.0
+        self.assertTrue(bucket.try_acquire())
+
+    def test_tokens_never_exceed_capacity(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=3, clock=clock)
+        clock.now = 100.0
+
+        self.assertEqual(bucket.tokens, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+
+from polymarkt_monitoring.services.scheduler import PollScheduler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def build_scheduler(clock: FakeClock) -> PollScheduler:
+    return PollScheduler(
+        min_interval_seconds=0.5,
+        max_interval_seconds=15,
+        base_range_blocks=50,
+        max_range_blocks=500,
+        clock=clock,
+    )
+
+
+class PollSchedulerTests(unittest.TestCase):
+    def test_estimates_block_time_from_header_timestamps(self) -> None:
+        scheduler = build_scheduler(FakeClock())
+        scheduler.observe_block(100, 1_000)
+        scheduler.observe_block(150, 1_100)
+        scheduler.observe_block(120, 5_000)
+
+        self.assertEqual(scheduler.block_time_seconds, 2.0)
+
+    def test_sleeps_until_next_confirmed_block_is_expected(self) -> None:
+        clock = FakeClock()
+        scheduler = build_scheduler(clock)
+        scheduler.observe_block(100, int(clock.now) - 20)
+        scheduler.observe_block(110, int(clock.now))
+
+        # Block 111 is confirmed by head 113, due three 2-second blocks after block 110.
+        delay = scheduler.next_delay(scheduled_block=110, confirmations=2)
+
+        self.assertEqual(delay, 6.0)
+        self.assertEqual(scheduler.next_wake_at, clock.now + 6.0)
+
+    def test_backs_off_when_polls_keep_finding_nothing(self) -> None:
+        clock = FakeClock()
+        scheduler = build_scheduler(clock)
+
+        delays = [scheduler.next_delay(scheduled_block=10, confirmations=0) for _ in range(7)]
+        scheduler.observe_head(latest_confirmed=11, scheduled_block=10)
+
+        self.assertEqual(delays, [0.5, 1.0, 2.0, 4.0, 8.0, 15, 15])
+        self.assertEqual(scheduler.next_delay(scheduled_block=11, confirmations=0), 0.5)
+
+    def test_range_widens_far_behind_head_and_shrinks_near_it(self) -> None:
+        scheduler = build_scheduler(FakeClock())
+
+        scheduler.observe_head(latest_confirmed=10_000, scheduled_block=0)
+        self.assertEqual((scheduler.lag_blocks, scheduler.range_blocks()), (10_000, 500))
+        scheduler.observe_head(latest_confirmed=10_000, scheduled_block=9_200)
+        self.assertEqual(scheduler.range_blocks(), 200)
+        scheduler.observe_head(latest_confirmed=10_000, scheduled_block=9_990)
+        self.assertEqual(scheduler.range_blocks(), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
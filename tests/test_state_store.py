@@ -0,0 +1,89 @@
+import asyncio
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from polymarkt_monitoring.models import BetCandidate
+from polymarkt_monitoring.services import BetEvaluator, MonitoringService
+from polymarkt_monitoring.services.dedup import compact_key
+from polymarkt_monitoring.services.state_store import SqliteStateStore
+
+from test_monitor import FakeExplorerClient, FakeNotifier, FakePricingClient, FakeRpcClient, build_config
+
+
+def make_candidate(block_number: int) -> BetCandidate:
+    return BetCandidate(
+        wallet_address="0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        tx_hash=f"0x{block_number:064x}",
+        block_number=block_number,
+        timestamp=1700000000 + block_number,
+        contract_address="0x1111111111111111111111111111111111111111",
+        token_symbol="USDC",
+        token_amount=6000.0,
+        usd_value=6000.0,
+        source="erc20_transfer",
+    )
+
+
+class SqliteStateStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "state" / "monitor.db"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_commit_range_round_trips_state(self) -> None:
+        store = SqliteStateStore(self.path)
+        pending = make_candidate(90)
+        store.commit_range(
+            checkpoint=95,
+            pending_candidates=[pending],
+            new_dedup_keys=[(compact_key(make_candidate(80).dedup_key), 80), (b"\x00" * 16, 10)],
+            dedup_low_water=50,
+        )
+        store.close()
+
+        state = SqliteStateStore(self.path).load()
+
+        self.assertEqual(state.checkpoint, 95)
+        self.assertEqual(state.pending_candidates, [pending])
+        self.assertEqual(state.dedup_keys, [(compact_key(make_candidate(80).dedup_key), 80)])
+        journal_mode = sqlite3.connect(self.path).execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(journal_mode, "wal")
+
+    def test_restarted_monitor_resumes_without_realerting(self) -> None:
+        def build_service(store: SqliteStateStore, notifier: FakeNotifier) -> MonitoringService:
+            return MonitoringService(
+                config=build_config(start_block=10),
+                rpc_client=FakeRpcClient(latest_block_number=60),
+                pricing_client=FakePricingClient(),
+                explorer_client=FakeExplorerClient([1, 1]),
+                notifier=notifier,
+                evaluator=BetEvaluator(usd_threshold=5000.0, wallet_max_tx_count=5),
+                state_store=store,
+            )
+
+        store = SqliteStateStore(self.path)
+        first_notifier = FakeNotifier()
+        first = build_service(store, first_notifier)
+        asyncio.run(first._initial_block())
+        asyncio.run(first.evaluate_and_alert([make_candidate(40)]))
+        asyncio.run(first._persist_state(58))
+        store.close()
+
+        store = SqliteStateStore(self.path)
+        second_notifier = FakeNotifier()
+        second = build_service(store, second_notifier)
+        resumed_from = asyncio.run(second._initial_block())
+        asyncio.run(second.evaluate_and_alert([make_candidate(40)]))
+        store.close()
+
+        self.assertEqual(resumed_from, 58)
+        self.assertEqual(len(first_notifier.messages), 1)
+        self.assertEqual(second_notifier.calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from polymarkt_monitoring.models import BetCandidate
+from polymarkt_monitoring.tracing import ALERT_LATENCY, AlertTracer, JsonlTraceExporter, OtlpHttpTraceExporter
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FailingExporter:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def export(self, trace) -> None:
+        raise RuntimeError("collector down")
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def make_candidate(block_number: int, timestamp: int = 1_000) -> BetCandidate:
+    return BetCandidate(
+        wallet_address="0xabc",
+        tx_hash=f"0x{block_number:064x}",
+        block_number=block_number,
+        timestamp=timestamp,
+        contract_address="0xdef",
+        token_symbol="POL",
+        token_amount=10.0,
+        usd_value=6000.0,
+        source="native_transfer",
+    )
+
+
+def walk_candidate(tracer: AlertTracer, clock: FakeClock, candidate: BetCandidate) -> None:
+    clock.now = 1_004.0
+    tracer.observe_confirmed(candidate.block_number + 2)
+    clock.now = 1_005.0
+    fetched_at = tracer.now()
+    clock.now = 1_005.5
+    tracer.candidate_built(candidate, range_fetched_at=fetched_at)
+    clock.now = 1_007.0
+    tracer.novelty_resolved(candidate)
+    clock.now = 1_010.0
+
+
+class AlertTracerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_acknowledged_alert_is_written_with_stage_breakdown(self) -> None:
+        clock = FakeClock()
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "traces" / "alerts.jsonl"
+            before = ALERT_LATENCY.count()
+            async with AlertTracer(exporters=[JsonlTraceExporter(path=path)], clock=clock) as tracer:
+                candidate = make_candidate(50)
+                walk_candidate(tracer, clock, candidate)
+                trace = tracer.acknowledged(candidate)
+
+            records = [json.loads(line) for line in path.read_text().splitlines()]
+
+        self.assertEqual(trace.total_seconds, 10.0)
+        self.assertEqual(len(tracer), 0)
+        self.assertEqual(ALERT_LATENCY.count(), before + 1)
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["tx_hash"], candidate.tx_hash)
+        self.assertEqual(
+            records[0]["stage_seconds"],
+            {"confirmation": 4.0, "fetch": 1.0, "extract": 0.5, "novelty": 1.5, "notify": 3.0},
+        )
+        self.assertEqual(records[0]["total_seconds"], 10.0)
+
+    async def test_confirmation_is_dated_by_the_first_head_covering_the_block(self) -> None:
+        clock = FakeClock(now=10.0)
+        tracer = AlertTracer(clock=clock)
+        tracer.observe_confirmed(100)
+        clock.now = 12.0
+        tracer.observe_confirmed(100)
+        tracer.observe_confirmed(105)
+
+        self.assertEqual(tracer.confirmed_at(99), 10.0)
+        self.assertEqual(tracer.confirmed_at(101), 12.0)
+        self.assertIsNone(tracer.confirmed_at(106))
+
+        tracer.prune(103, keep=())
+        self.assertIsNone(tracer.confirmed_at(106))
+        self.assertEqual(tracer.confirmed_at(104), 12.0)
+
+    async def test_discarded_and_committed_traces_are_dropped(self) -> None:
+        tracer = AlertTracer(clock=FakeClock())
+        rejected, duplicate, pending = make_candidate(10), make_candidate(11), make_candidate(12)
+        for candidate in (rejected, duplicate, pending):
+            tracer.candidate_built(candidate, range_fetched_at=None)
+
+        tracer.discard(rejected)
+        tracer.prune(20, keep={pending.dedup_key})
+
+        self.assertEqual(len(tracer), 1)
+        self.assertIsNotNone(tracer.acknowledged(pending))
+        self.assertIsNone(tracer.acknowledged(duplicate))
+
+    async def test_failing_exporter_is_logged_and_closed(self) -> None:
+        exporter = FailingExporter()
+        clock = FakeClock()
+        tracer = AlertTracer(exporters=[exporter], clock=clock)
+        candidate = make_candidate(50)
+        walk_candidate(tracer, clock, candidate)
+
+        with self.assertLogs("polymarkt_monitoring.tracing", level="WARNING") as logs:
+            tracer.acknowledged(candidate)
+            await tracer.close()
+
+        self.assertIn("Alert trace export failed", logs.output[0])
+        self.assertTrue(exporter.closed)
+
+
+class OtlpHttpTraceExporterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_posts_an_alert_span_with_a_child_per_stage(self) -> None:
+        received: list[dict] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            received.append(await request.json())
+            return web.json_response({})
+
+        app = web.Application()
+        app.router.add_post("/v1/traces", handle)
+        server = TestServer(app)
+        await server.start_server()
+        self.addAsyncCleanup(server.close)
+
+        clock = FakeClock()
+        exporter = OtlpHttpTraceExporter(endpoint=str(server.make_url("/v1/traces")))
+        async with AlertTracer(exporters=[exporter], clock=clock) as tracer:
+            candidate = make_candidate(50)
+            walk_candidate(tracer, clock, candidate)
+            tracer.acknowledged(candidate)
+
+        spans = received[0]["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        root, *children = spans
+        self.assertEqual(root["name"], "alert")
+        self.assertEqual(root["startTimeUnixNano"], str(1_000 * 10**9))
+        self.assertEqual(root["endTimeUnixNano"], str(1_010 * 10**9))
+        self.assertEqual([span["name"] for span in children], ["confirmation", "fetch", "extract", "novelty", "notify"])
+        self.assertTrue(all(span["parentSpanId"] == root["spanId"] for span in children))
+        self.assertEqual({span["traceId"] for span in spans}, {root["traceId"]})
+
+
+if __name__ == "__main__":
+    unittest.main()